@@ -0,0 +1 @@
+# Busqueda app
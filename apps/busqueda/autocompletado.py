@@ -0,0 +1,111 @@
+"""
+In-process prefix index for typeahead suggestions.
+
+Every word suffix of a species' common and scientific names, accent- and
+case-folded, is a key in one sorted array; a lookup is a bisect plus a short
+forward scan, with no database access. Freshness is handled by
+``memoria.SpeciesIndex``.
+"""
+import bisect
+
+from apps.core.texto import normalizar
+
+from .memoria import SpeciesIndex
+
+
+# Key kinds, best first: start of the common name, of the scientific name, of an inner word
+COMUN, CIENTIFICO, PALABRA = 0, 1, 2
+
+
+def claves(item):
+    """``(key, kind)`` pairs under which a suggestion is reachable"""
+    resultado = set()
+    for nombre, tipo_clave in ((item['nombre_comun'], COMUN), (item['nombre_cientifico'], CIENTIFICO)):
+        palabras = normalizar(nombre).split()
+        for posicion in range(len(palabras)):
+            resultado.add((' '.join(palabras[posicion:]), tipo_clave if posicion == 0 else PALABRA))
+    return resultado
+
+
+class PrefixIndex(SpeciesIndex):
+    """
+    Sorted ``(key, kind, tipo, id)`` entries searched with bisect.
+
+    ``especies`` holds the suggestion payload per ``(tipo, id)`` and is what
+    incremental removal re-derives the old keys from.
+    """
+    # Entries examined per requested suggestion before ranking (more if too few match)
+    scan_factor = 20
+
+    def __init__(self):
+        super().__init__()
+        self.entradas = []
+        self.especies = {}
+
+    def __len__(self):
+        return len(self.especies)
+
+    def construir(self, items):
+        especies = {(item['tipo'], item['id']): item for item in items}
+        entradas = sorted(
+            (clave, tipo_clave, tipo, pk)
+            for (tipo, pk), item in especies.items()
+            for clave, tipo_clave in claves(item)
+        )
+        with self._lock:
+            self.entradas, self.especies = entradas, especies
+
+    def _quitar(self, clave_especie):
+        item = self.especies.pop(clave_especie, None)
+        if item is None:
+            return
+        for clave, tipo_clave in claves(item):
+            entrada = (clave, tipo_clave, *clave_especie)
+            posicion = bisect.bisect_left(self.entradas, entrada)
+            if posicion < len(self.entradas) and self.entradas[posicion] == entrada:
+                del self.entradas[posicion]
+
+    def update(self, item):
+        """Add or replace one species (no-op until the index has been built)"""
+        clave_especie = (item['tipo'], item['id'])
+        with self._lock:
+            if self.conocidas is None:
+                return
+            self._quitar(clave_especie)
+            self.especies[clave_especie] = item
+            for clave, tipo_clave in claves(item):
+                bisect.insort(self.entradas, (clave, tipo_clave, *clave_especie))
+
+    def discard(self, tipo, pk):
+        with self._lock:
+            self._quitar((tipo, pk))
+
+    def search(self, texto, limite=10, tipo=None):
+        """Up to ``limite`` suggestions whose names (or any of their words) start with ``texto``"""
+        prefijo = normalizar(texto)
+        if not prefijo:
+            return []
+        self.ensure_ready()
+
+        mejores = {}
+        with self._lock:
+            entradas = self.entradas
+            posicion = bisect.bisect_left(entradas, (prefijo,))
+            # Rank within a window of entries, widened until ``limite`` species
+            # match (the tipo filter may skip most of it) or the prefix runs out
+            ventana = posicion + limite * self.scan_factor
+            while posicion < len(entradas) and entradas[posicion][0].startswith(prefijo):
+                if posicion >= ventana and len(mejores) >= limite:
+                    break
+                clave, tipo_clave, tipo_especie, pk = entradas[posicion]
+                posicion += 1
+                if tipo and tipo_especie != tipo:
+                    continue
+                rango = (tipo_clave, clave)
+                if rango < mejores.get((tipo_especie, pk), (PALABRA + 1,)):
+                    mejores[(tipo_especie, pk)] = rango
+            elegidas = sorted(mejores, key=mejores.get)[:limite]
+            return [self.especies[clave_especie] for clave_especie in elegidas]
+
+
+prefijos = PrefixIndex()
@@ -0,0 +1,155 @@
+"""
+Typo-tolerant scientific-name lookup.
+
+Folded scientific names (whole binomials and their individual words) are
+indexed by padded trigram. A term within ``d`` edits of the query shares at
+least ``len(query) + 2 - 3d`` of its trigrams (each edit breaks at most three),
+so candidates come from the query's posting lists alone and only those are
+checked with a bounded Levenshtein distance; no lookup compares the query
+with every name.
+"""
+from collections import Counter
+
+from apps.core.texto import normalizar
+
+from .memoria import SpeciesIndex
+
+
+# Shorter words are too ambiguous to index on their own (e.g. "sp", "var")
+MIN_PALABRA = 4
+
+
+def trigramas(termino):
+    """Distinct trigrams of ``termino`` padded so that edges count too"""
+    relleno = f'##{termino}$$'
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+
+def levenshtein(a, b, maxima):
+    """Edit distance between ``a`` and ``b``, or ``maxima + 1`` once it must exceed ``maxima``"""
+    if abs(len(a) - len(b)) > maxima:
+        return maxima + 1
+    anterior = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        actual = [i]
+        for j, cb in enumerate(b, 1):
+            actual.append(min(
+                anterior[j] + 1,
+                actual[j - 1] + 1,
+                anterior[j - 1] + (ca != cb),
+            ))
+        if min(actual) > maxima:
+            return maxima + 1
+        anterior = actual
+    return anterior[-1]
+
+
+def distancia_maxima(termino):
+    """Default tolerance: 1 edit per ~4 characters, between 1 and 3"""
+    return max(1, min(3, len(termino) // 4))
+
+
+def terminos_de(item):
+    """Folded whole scientific name plus each of its words long enough to matter"""
+    nombre = normalizar(item['nombre_cientifico'])
+    terminos = {nombre} if nombre else set()
+    terminos.update(palabra for palabra in nombre.split() if len(palabra) >= MIN_PALABRA)
+    return terminos
+
+
+class ScientificNameIndex(SpeciesIndex):
+    """
+    ``trigram -> {term}`` and ``term -> {(tipo, id)}`` postings over
+    scientific names, with incremental add/remove.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.trigramas = {}
+        self.terminos = {}
+        self.especies = {}
+
+    def construir(self, items):
+        especies = {(item['tipo'], item['id']): item for item in items}
+        terminos = {}
+        for clave_especie, item in especies.items():
+            for termino in terminos_de(item):
+                terminos.setdefault(termino, set()).add(clave_especie)
+        indice_trigramas = {}
+        for termino in terminos:
+            for trigrama in trigramas(termino):
+                indice_trigramas.setdefault(trigrama, set()).add(termino)
+        with self._lock:
+            self.trigramas, self.terminos, self.especies = indice_trigramas, terminos, especies
+
+    def _quitar(self, clave_especie):
+        item = self.especies.pop(clave_especie, None)
+        if item is None:
+            return
+        for termino in terminos_de(item):
+            especies = self.terminos.get(termino)
+            if especies is None:
+                continue
+            especies.discard(clave_especie)
+            if not especies:
+                del self.terminos[termino]
+                for trigrama in trigramas(termino):
+                    self.trigramas.get(trigrama, set()).discard(termino)
+
+    def update(self, item):
+        """Add or replace one species (no-op until the index has been built)"""
+        clave_especie = (item['tipo'], item['id'])
+        with self._lock:
+            if self.conocidas is None:
+                return
+            self._quitar(clave_especie)
+            self.especies[clave_especie] = item
+            for termino in terminos_de(item):
+                self.terminos.setdefault(termino, set()).add(clave_especie)
+                for trigrama in trigramas(termino):
+                    self.trigramas.setdefault(trigrama, set()).add(termino)
+
+    def discard(self, tipo, pk):
+        with self._lock:
+            self._quitar((tipo, pk))
+
+    def candidatos(self, termino, maxima):
+        """Terms sharing enough trigrams with ``termino`` to be within ``maxima`` edits"""
+        propios = trigramas(termino)
+        minimo = max(1, len(propios) - 3 * maxima)
+        compartidos = Counter()
+        for trigrama in propios:
+            compartidos.update(self.trigramas.get(trigrama, ()))
+        return [candidato for candidato, total in compartidos.items() if total >= minimo]
+
+    def search(self, texto, limite=10, tipo=None, maxima=None):
+        """
+        Species whose scientific name (or one of its words) is within ``maxima``
+        edits of ``texto``, as suggestion dicts with a ``distancia`` key.
+        """
+        termino = normalizar(texto)
+        if not termino:
+            return []
+        self.ensure_ready()
+        if maxima is None:
+            maxima = distancia_maxima(termino)
+
+        mejores = {}
+        with self._lock:
+            for candidato in self.candidatos(termino, maxima):
+                distancia = levenshtein(termino, candidato, maxima)
+                if distancia > maxima:
+                    continue
+                for clave_especie in self.terminos[candidato]:
+                    if tipo and clave_especie[0] != tipo:
+                        continue
+                    if distancia < mejores.get(clave_especie, maxima + 1):
+                        mejores[clave_especie] = distancia
+            elegidas = sorted(mejores, key=lambda clave: (mejores[clave], self.especies[clave]['nombre_cientifico']))
+            return [
+                {**self.especies[clave_especie], 'distancia': mejores[clave_especie]}
+                for clave_especie in elegidas[:limite]
+            ]
+
+
+nombres_cientificos = ScientificNameIndex()
@@ -0,0 +1,44 @@
+"""Search helpers for the fauna/flora FilterSets and ordering backend"""
+from django.conf import settings
+from rest_framework.filters import OrderingFilter
+
+from . import indice
+from .difuso import nombres_cientificos
+
+
+def buscar_especies(tipo, texto, difuso=False):
+    """
+    Ranked ids for ``?q=``: full-text hits, preceded by scientific names within
+    a few edits of ``texto`` when ``difuso``. None means the full-text index is
+    unavailable (and nothing fuzzy matched), so the caller falls back to LIKE.
+    """
+    ids = indice.buscar(tipo, texto)
+    if not difuso:
+        return ids
+    cercanos = [item['id'] for item in nombres_cientificos.search(texto, settings.BUSQUEDA_LIMITE, tipo)]
+    if ids is None:
+        return cercanos or None
+    vistos = set(cercanos)
+    return (cercanos + [pk for pk in ids if pk not in vistos])[:settings.BUSQUEDA_LIMITE]
+
+
+class SearchRankOrderingFilter(OrderingFilter):
+    """OrderingFilter that keeps the ?q= rank order unless ?ordering= is given"""
+    # Public names that are model properties rather than columns
+    ordering_aliases = {'id': 'pk'}
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        resultado = []
+        for termino in ordering:
+            campo = termino.lstrip('-')
+            campo = self.ordering_aliases.get(campo, campo)
+            resultado.append(f'-{campo}' if termino.startswith('-') else campo)
+        return resultado
+
+    def filter_queryset(self, request, queryset, view):
+        if 'rango_busqueda' in queryset.query.annotations and not request.query_params.get(self.ordering_param):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
@@ -0,0 +1,183 @@
+"""
+SQLite FTS5 sidecar index for species search.
+
+Animals and plants are mirrored into two FTS5 tables (rowid = primary key) in
+a local SQLite file, kept in sync by signals.py and rebuilt with
+``manage.py reconstruir_busqueda``. ``buscar`` returns BM25-ranked ids and
+``filtrar`` hydrates them with one ``pk__in`` query, so ``?q=`` never turns
+into leading-wildcard LIKE scans on the main database.
+"""
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import Case, IntegerField, When
+from django.utils import timezone
+
+from apps.fauna.models import Animal
+from apps.flora.models import Flora
+
+
+logger = logging.getLogger(__name__)
+
+MODELOS = {
+    'fauna': Animal,
+    'flora': Flora,
+}
+
+COLUMNAS = {
+    'fauna': ('nombre_comun', 'nombre_cientifico', 'descripcion', 'habitat', 'distribucion', 'amenazas'),
+    'flora': ('nombre_comun', 'nombre_cientifico', 'descripcion', 'distribucion'),
+}
+
+# bm25() weights in COLUMNAS order: a hit in a name outranks one in a long text
+PESOS = {
+    'fauna': (10.0, 8.0, 1.0, 1.0, 1.0, 2.0),
+    'flora': (10.0, 8.0, 1.0, 1.0),
+}
+
+TOKEN = re.compile(r'\w+')
+
+_local = threading.local()
+
+
+def conexion():
+    """Per-thread connection to the index file (created on first use)"""
+    ruta = str(settings.BUSQUEDA_INDICE)
+    if getattr(_local, 'ruta', None) != ruta:
+        Path(ruta).parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(ruta, timeout=10, isolation_level=None)
+        con.execute('PRAGMA journal_mode=WAL')
+        con.execute('PRAGMA synchronous=NORMAL')
+        for tipo, columnas in COLUMNAS.items():
+            con.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {tipo} USING fts5("
+                f"{', '.join(columnas)}, tokenize='unicode61 remove_diacritics 2')"
+            )
+        con.execute('CREATE TABLE IF NOT EXISTS estado (tipo TEXT PRIMARY KEY, construido TEXT NOT NULL)')
+        _local.conexion, _local.ruta = con, ruta
+    return _local.conexion
+
+
+def documentos(tipo, ids=None):
+    """``(pk, (column values...))`` for every row of ``tipo`` (or only ``ids``)"""
+    columnas = COLUMNAS[tipo]
+    queryset = MODELOS[tipo].objects.order_by('pk')
+    if ids is not None:
+        queryset = queryset.filter(pk__in=ids)
+
+    if tipo == 'fauna':
+        queryset = queryset.only('pk', *columnas[:-1]).prefetch_related('amenazas')
+        for animal in queryset.iterator(chunk_size=500):
+            valores = [getattr(animal, columna) or '' for columna in columnas[:-1]]
+            valores.append(' '.join(amenaza.nombre for amenaza in animal.amenazas.all()))
+            yield animal.pk, tuple(valores)
+    else:
+        for pk, *valores in queryset.values_list('pk', *columnas).iterator(chunk_size=500):
+            yield pk, tuple(valor or '' for valor in valores)
+
+
+def _insertar(con, tipo, filas):
+    marcadores = ', '.join('?' * (len(COLUMNAS[tipo]) + 1))
+    con.executemany(
+        f"INSERT INTO {tipo} (rowid, {', '.join(COLUMNAS[tipo])}) VALUES ({marcadores})",
+        ((pk, *valores) for pk, valores in filas),
+    )
+
+
+def _borrar(con, tipo, ids):
+    con.executemany(f'DELETE FROM {tipo} WHERE rowid = ?', ((pk,) for pk in ids))
+
+
+def indexar(tipo, ids):
+    """Re-read ``ids`` from the database and replace their index entries"""
+    ids = list(ids)
+    con = conexion()
+    con.execute('BEGIN IMMEDIATE')
+    try:
+        _borrar(con, tipo, ids)
+        _insertar(con, tipo, documentos(tipo, ids))
+        con.execute('COMMIT')
+    except BaseException:
+        con.execute('ROLLBACK')
+        raise
+
+
+def eliminar(tipo, ids):
+    con = conexion()
+    con.execute('BEGIN IMMEDIATE')
+    try:
+        _borrar(con, tipo, ids)
+        con.execute('COMMIT')
+    except BaseException:
+        con.execute('ROLLBACK')
+        raise
+
+
+def reconstruir(tipo):
+    """Rebuild the whole ``tipo`` table; returns the number of indexed rows"""
+    filas = list(documentos(tipo))
+    con = conexion()
+    con.execute('BEGIN IMMEDIATE')
+    try:
+        con.execute(f'DELETE FROM {tipo}')
+        _insertar(con, tipo, filas)
+        con.execute(f"INSERT INTO {tipo} ({tipo}) VALUES ('optimize')")
+        con.execute(
+            'INSERT OR REPLACE INTO estado (tipo, construido) VALUES (?, ?)',
+            (tipo, timezone.now().isoformat()),
+        )
+        con.execute('COMMIT')
+    except BaseException:
+        con.execute('ROLLBACK')
+        raise
+    return len(filas)
+
+
+def expresion(texto):
+    """
+    FTS5 query for free user text: every word as a quoted prefix term (AND).
+
+    Quoting keeps FTS5 operators and punctuation in ``texto`` from being
+    parsed as query syntax.
+    """
+    return ' '.join(f'"{palabra}"*' for palabra in TOKEN.findall(texto))
+
+
+def buscar(tipo, texto, limite=None):
+    """
+    Ids of ``tipo`` matching ``texto``, best BM25 rank first.
+
+    Returns None when the index is unavailable or has never been built, so
+    callers can fall back to a database search.
+    """
+    consulta = expresion(texto)
+    if not consulta:
+        return []
+    pesos = ', '.join(str(peso) for peso in PESOS[tipo])
+    try:
+        con = conexion()
+        if con.execute('SELECT 1 FROM estado WHERE tipo = ?', (tipo,)).fetchone() is None:
+            return None
+        filas = con.execute(
+            f'SELECT rowid FROM {tipo} WHERE {tipo} MATCH ? ORDER BY bm25({tipo}, {pesos}) LIMIT ?',
+            (consulta, limite or settings.BUSQUEDA_LIMITE),
+        ).fetchall()
+    except sqlite3.Error:
+        logger.exception('Índice de búsqueda no disponible')
+        return None
+    return [pk for pk, in filas]
+
+
+def filtrar(queryset, ids):
+    """``queryset`` restricted to ``ids`` and ordered by their rank (``rango_busqueda``)"""
+    if not ids:
+        return queryset.none()
+    rango = Case(
+        *[When(pk=pk, then=posicion) for posicion, pk in enumerate(ids)],
+        output_field=IntegerField(),
+    )
+    return queryset.filter(pk__in=ids).annotate(rango_busqueda=rango).order_by('rango_busqueda')
@@ -0,0 +1,17 @@
+"""Rebuild the SQLite FTS5 species search index from the catalog tables"""
+from django.core.management.base import BaseCommand
+
+from apps.busqueda import indice
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el índice de búsqueda de fauna y flora'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tipo', choices=sorted(indice.COLUMNAS), help='Solo fauna o solo flora')
+
+    def handle(self, *args, **options):
+        tipos = [options['tipo']] if options['tipo'] else sorted(indice.COLUMNAS)
+        for tipo in tipos:
+            total = indice.reconstruir(tipo)
+            self.stdout.write(self.style.SUCCESS(f'{tipo}: {total} especies indexadas'))
@@ -0,0 +1,91 @@
+"""
+Base for in-process species indexes.
+
+An index is built on first use from every species' names. Local writes are
+applied incrementally through ``update``/``discard`` (see signals.py). Every
+BUSQUEDA_INDICES_REFRESCO seconds the catalog data versions are compared with
+the ones the index reflects: if only this process's own writes moved them
+(``versiones.solo_propias``) they are simply taken over, otherwise another
+process wrote and the index is rebuilt.
+"""
+import threading
+import time
+
+from django.conf import settings
+
+from apps.core import versiones
+from apps.fauna.models import Animal
+from apps.flora.models import Flora
+
+
+MODELOS = {
+    'fauna': Animal,
+    'flora': Flora,
+}
+
+
+def cargar():
+    """``{tipo, id, nombre_comun, nombre_cientifico}`` for every species, straight from the database"""
+    items = []
+    for tipo, model in MODELOS.items():
+        for pk, nombre_comun, nombre_cientifico in model.objects.values_list(
+            'pk', 'nombre_comun', 'nombre_cientifico'
+        ).iterator(chunk_size=2000):
+            items.append({
+                'tipo': tipo,
+                'id': pk,
+                'nombre_comun': nombre_comun,
+                'nombre_cientifico': nombre_cientifico,
+            })
+    return items
+
+
+class SpeciesIndex:
+    """
+    Subclasses implement ``construir(items)`` (build fresh structures and swap
+    them in under ``self._lock``), ``update(item)`` and ``discard(tipo, pk)``.
+    """
+
+    def __init__(self):
+        # {tabla: version} of the data this index reflects; None until built
+        self.conocidas = None
+        self.verificado = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def construir(self, items):
+        raise NotImplementedError
+
+    def update(self, item):
+        raise NotImplementedError
+
+    def discard(self, tipo, pk):
+        raise NotImplementedError
+
+    def rebuild(self):
+        # Read the versions first: a write racing the load triggers another rebuild later
+        conocidas = versiones.obtener(*MODELOS.values())
+        self.construir(cargar())
+        self.conocidas = conocidas
+
+    def _fresco(self):
+        return self.conocidas is not None and time.monotonic() - self.verificado < settings.BUSQUEDA_INDICES_REFRESCO
+
+    def ensure_ready(self):
+        """Build on first use; rebuild when another process changed the catalog"""
+        if self._fresco():
+            return
+        with self._refresh_lock:
+            if self._fresco():
+                return
+            if self.conocidas is None:
+                self.rebuild()
+            else:
+                actuales = versiones.obtener(*MODELOS.values())
+                if actuales != self.conocidas:
+                    if versiones.solo_propias(self.conocidas, actuales):
+                        # Only this process wrote, and update/discard already applied it
+                        self.conocidas = actuales
+                    else:
+                        self.rebuild()
+            self.verificado = time.monotonic()
@@ -0,0 +1,97 @@
+"""Keep the search indexes in sync with catalog writes"""
+import logging
+import sqlite3
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.fauna.models import Animal, Amenaza, AnimalAmenaza
+from apps.flora.models import Flora
+from . import indice
+from .autocompletado import prefijos
+from .difuso import nombres_cientificos
+
+
+logger = logging.getLogger(__name__)
+
+TIPOS = {
+    Animal: 'fauna',
+    Flora: 'flora',
+}
+
+# In-process indexes updated incrementally by this process's own writes
+EN_MEMORIA = (prefijos, nombres_cientificos)
+
+
+def _al_confirmar(funcion, tipo, ids):
+    """Run after the surrounding transaction commits; index errors never fail the write"""
+    def ejecutar():
+        try:
+            funcion(tipo, ids)
+        except sqlite3.Error:
+            logger.exception('No se pudo actualizar el índice de búsqueda (%s %s)', tipo, ids)
+
+    transaction.on_commit(ejecutar)
+
+
+def _en_memoria(metodo, *args):
+    """Apply a local write to the in-process indexes once the surrounding transaction commits"""
+    def ejecutar():
+        for memoria in EN_MEMORIA:
+            getattr(memoria, metodo)(*args)
+
+    transaction.on_commit(ejecutar)
+
+
+@receiver(post_save, sender=Animal)
+@receiver(post_save, sender=Flora)
+def especie_guardada(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _al_confirmar(indice.indexar, TIPOS[sender], [instance.pk])
+    sugerencia = {
+        'tipo': TIPOS[sender],
+        'id': instance.pk,
+        'nombre_comun': instance.nombre_comun,
+        'nombre_cientifico': instance.nombre_cientifico,
+    }
+    _en_memoria('update', sugerencia)
+
+
+@receiver(post_delete, sender=Animal)
+@receiver(post_delete, sender=Flora)
+def especie_eliminada(sender, instance, **kwargs):
+    tipo, pk = TIPOS[sender], instance.pk
+    _al_confirmar(indice.eliminar, tipo, [pk])
+    _en_memoria('discard', tipo, pk)
+
+
+@receiver(post_save, sender=AnimalAmenaza)
+@receiver(post_delete, sender=AnimalAmenaza)
+def amenaza_de_animal_cambiada(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _al_confirmar(indice.indexar, 'fauna', [instance.animal_id])
+
+
+@receiver(m2m_changed, sender=AnimalAmenaza)
+def amenazas_m2m_cambiadas(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        ids = [instance.pk]
+    elif pk_set:
+        ids = list(pk_set)
+    else:
+        # post_clear from the Amenaza side does not say which animals were affected
+        ids = list(Animal.objects.values_list('pk', flat=True))
+    _al_confirmar(indice.indexar, 'fauna', ids)
+
+
+@receiver(post_save, sender=Amenaza)
+def amenaza_guardada(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    ids = list(AnimalAmenaza.objects.filter(amenaza=instance).values_list('animal_id', flat=True))
+    if ids:
+        _al_confirmar(indice.indexar, 'fauna', ids)
@@ -0,0 +1,105 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from apps.core import versiones
+from apps.fauna.models import Animal, Categoria
+from .autocompletado import prefijos
+from .memoria import MODELOS
+
+
+@override_settings(BUSQUEDA_INDICES_REFRESCO=0)
+class SpeciesIndexVersionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.categoria = Categoria.objects.create(nombre='Aves')
+        cls.garza = Animal.objects.create(nombre_comun='Garza', nombre_cientifico='Ardea alba', categoria=cls.categoria)
+
+    def setUp(self):
+        # Test transactions roll back, so version numbers repeat between tests
+        versiones._propias.clear()
+        versiones._invalidar()
+        prefijos.conocidas = None
+        prefijos.search('garza')
+        self.rebuild = mock.patch.object(prefijos, 'rebuild', wraps=prefijos.rebuild).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def nombres(self, texto):
+        return [item['nombre_comun'] for item in prefijos.search(texto)]
+
+    def escribir_desde_otro_proceso(self, pk, nombre):
+        # No signals: only the shared version moves, as when another worker writes
+        Animal.objects.filter(pk=pk).update(nombre_comun=nombre)
+        versiones.incrementar(Animal)
+
+    def test_escritura_local_no_reconstruye(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Animal.objects.create(nombre_comun='Tucán', nombre_cientifico='Ramphastos sp', categoria=self.categoria)
+
+        self.assertEqual(self.nombres('tuc'), ['Tucán'])
+        self.rebuild.assert_not_called()
+        self.assertEqual(prefijos.conocidas, versiones.obtener(*MODELOS.values()))
+
+    def test_escritura_de_otro_proceso_reconstruye(self):
+        self.escribir_desde_otro_proceso(self.garza.pk, 'Garceta')
+
+        self.assertEqual(self.nombres('garc'), ['Garceta'])
+        self.rebuild.assert_called_once()
+
+    def test_escritura_local_no_oculta_una_concurrente(self):
+        otro = Animal.objects.create(nombre_comun='Ibis', nombre_cientifico='Eudocimus albus', categoria=self.categoria)
+        prefijos.conocidas = None
+        prefijos.search('ibis')
+        self.rebuild.reset_mock()
+
+        # Another worker writes, then this process writes before the next check
+        self.escribir_desde_otro_proceso(otro.pk, 'Corocoro')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.garza.nombre_comun = 'Garzón'
+            self.garza.save()
+
+        self.assertEqual(self.nombres('coroc'), ['Corocoro'])
+        self.assertEqual(self.nombres('garz'), ['Garzón'])
+        self.rebuild.assert_called_once()
+
+
+class AutocompleteParamsTests(TestCase):
+
+    def test_limit_invalido_devuelve_400(self):
+        for limit in ('abc', '0', '-1', '2.5'):
+            with self.subTest(limit=limit):
+                response = self.client.get('/api/autocomplete/', {'q': 'gar', 'limit': limit})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('limit', response.json())
+
+    def test_limit_grande_se_recorta(self):
+        response = self.client.get('/api/autocomplete/', {'q': 'gar', 'limit': '500'})
+        self.assertEqual(response.status_code, 200)
+
+
+class ResolverParamsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        categoria = Categoria.objects.create(nombre='Aves')
+        Animal.objects.create(nombre_comun='Harpía', nombre_cientifico='Harpia harpyja', categoria=categoria)
+
+    def setUp(self):
+        versiones._invalidar()
+
+    def test_parametros_invalidos_devuelven_400(self):
+        for parametro, valor in (('limit', 'abc'), ('limit', '0'), ('distancia', 'x'), ('distancia', '-1')):
+            with self.subTest(**{parametro: valor}):
+                response = self.client.get('/api/especies/resolver/', {'q': 'Harpia harpya', parametro: valor})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(parametro, response.json())
+
+    def test_distancia_se_recorta_al_maximo(self):
+        response = self.client.get('/api/especies/resolver/', {'q': 'Harpia harpya', 'distancia': '99'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['nombre_cientifico'] for item in response.json()], ['Harpia harpyja'])
+
+    def test_distancia_cero_exige_coincidencia_exacta(self):
+        response = self.client.get('/api/especies/resolver/', {'q': 'Harpia harpya', 'distancia': '0'})
+        self.assertEqual(response.json(), [])
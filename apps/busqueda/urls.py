@@ -0,0 +1,13 @@
+"""Search URL configuration"""
+from django.urls import path
+from .views import AutocompleteView, ResolverEspeciesView
+
+app_name = 'busqueda'
+
+urlpatterns = [
+    # Sugerencias por prefijo para el buscador (sin acentos ni mayúsculas)
+    path('autocomplete/', AutocompleteView.as_view(), name='autocomplete'),
+    
+    # Nombre científico aproximado -> especies candidatas por distancia de edición
+    path('especies/resolver/', ResolverEspeciesView.as_view(), name='resolver-especies'),
+]
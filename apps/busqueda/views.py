@@ -0,0 +1,136 @@
+"""Search views"""
+import time
+
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .autocompletado import prefijos
+from .difuso import nombres_cientificos
+
+
+def entero(request, nombre, defecto, minimo, maximo):
+    """Integer query parameter capped at ``maximo``; 400 when it is not an integer >= ``minimo``"""
+    valor = request.query_params.get(nombre)
+    if valor is None:
+        return defecto
+    try:
+        valor = int(valor)
+        if valor < minimo:
+            raise ValueError(valor)
+    except ValueError:
+        raise ValidationError({nombre: f'Debe ser un entero mayor o igual a {minimo}.'})
+    return min(valor, maximo)
+
+
+class AutocompleteView(APIView):
+    """
+    Typeahead suggestions for the species search box.
+    Served from the in-process prefix index; the lookup time is reported in
+    the Server-Timing header.
+    """
+    permission_classes = [AllowAny]
+    default_limit = 8
+    max_limit = 20
+    
+    @swagger_auto_schema(
+        operation_description="Species whose common or scientific name (or any word of it) starts with q",
+        manual_parameters=[
+            openapi.Parameter(
+                'q',
+                openapi.IN_QUERY,
+                description="Text typed so far (accents and case are ignored)",
+                type=openapi.TYPE_STRING,
+                required=True
+            ),
+            openapi.Parameter(
+                'limit',
+                openapi.IN_QUERY,
+                description="Number of suggestions (default: 8, max: 20)",
+                type=openapi.TYPE_INTEGER
+            ),
+            openapi.Parameter(
+                'tipo',
+                openapi.IN_QUERY,
+                description="Filter by type: 'fauna', 'flora', or 'todos' (default)",
+                type=openapi.TYPE_STRING,
+                enum=['fauna', 'flora', 'todos']
+            )
+        ]
+    )
+    def get(self, request):
+        """Get suggestions"""
+        limit = entero(request, 'limit', self.default_limit, 1, self.max_limit)
+        tipo = request.query_params.get('tipo', 'todos')
+        
+        inicio = time.perf_counter()
+        sugerencias = prefijos.search(
+            request.query_params.get('q', ''),
+            limit,
+            tipo if tipo in ['fauna', 'flora'] else None
+        )
+        duracion = (time.perf_counter() - inicio) * 1000
+        
+        response = Response(sugerencias)
+        response['Server-Timing'] = f'autocompletado;dur={duracion:.3f}'
+        return response
+
+
+class ResolverEspeciesView(APIView):
+    """
+    Resolve a possibly misspelled scientific name to candidate species,
+    closest edit distance first (e.g. "Harpia harpya" -> Harpia harpyja).
+    """
+    permission_classes = [AllowAny]
+    default_limit = 5
+    max_limit = 20
+    max_distancia = 3
+    
+    @swagger_auto_schema(
+        operation_description="Candidate species for a scientific name, ranked by edit distance",
+        manual_parameters=[
+            openapi.Parameter(
+                'q',
+                openapi.IN_QUERY,
+                description="Scientific name (binomial or a single word)",
+                type=openapi.TYPE_STRING,
+                required=True
+            ),
+            openapi.Parameter(
+                'distancia',
+                openapi.IN_QUERY,
+                description="Maximum edit distance (default: 1 per 4 characters, max: 3)",
+                type=openapi.TYPE_INTEGER
+            ),
+            openapi.Parameter(
+                'limit',
+                openapi.IN_QUERY,
+                description="Number of candidates (default: 5, max: 20)",
+                type=openapi.TYPE_INTEGER
+            ),
+            openapi.Parameter(
+                'tipo',
+                openapi.IN_QUERY,
+                description="Filter by type: 'fauna', 'flora', or 'todos' (default)",
+                type=openapi.TYPE_STRING,
+                enum=['fauna', 'flora', 'todos']
+            )
+        ]
+    )
+    def get(self, request):
+        """Get candidates"""
+        limit = entero(request, 'limit', self.default_limit, 1, self.max_limit)
+        tipo = request.query_params.get('tipo', 'todos')
+        # None lets the index pick a distance from the length of q
+        distancia = entero(request, 'distancia', None, 0, self.max_distancia)
+        
+        candidatos = nombres_cientificos.search(
+            request.query_params.get('q', ''),
+            limit,
+            tipo if tipo in ['fauna', 'flora'] else None,
+            distancia
+        )
+        return Response(candidatos)
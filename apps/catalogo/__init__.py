@@ -0,0 +1 @@
+# Catalogo app
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class CatalogoConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.catalogo'
+    verbose_name = 'Catálogo'
@@ -0,0 +1,60 @@
+"""Pre-rendered, pre-compressed reference-data bundle"""
+import gzip
+import hashlib
+import threading
+
+from django.db.models import Count
+from rest_framework.renderers import JSONRenderer
+
+from apps.core import versiones
+from apps.core.estados import ESTADO_FAUNA_CHOICES, ESTADO_FLORA_CHOICES
+from apps.fauna.models import Categoria, Animal, Amenaza, AccionProteccion
+from apps.fauna.serializers import CategoriaSerializer, AmenazaSerializer, AccionProteccionSerializer
+
+
+# Tables whose writes change the bundle (Animal: cantidad_animales per category)
+TABLAS = (Categoria, Animal, Amenaza, AccionProteccion)
+
+_paquete = {'firma': None, 'data': None}
+_lock = threading.Lock()
+
+
+class Paquete:
+    """Rendered bundle: JSON bytes, gzip bytes and a content-hash ETag for each"""
+
+    def __init__(self, contenido):
+        self.json = contenido
+        self.gzip = gzip.compress(contenido, compresslevel=9)
+        self.hash = hashlib.sha256(contenido).hexdigest()[:20]
+        # Strong validators differ per content-coding
+        self.etag = f'"{self.hash}"'
+        self.etag_gzip = f'"{self.hash}-gzip"'
+
+
+def construir():
+    categorias = Categoria.objects.annotate(total_animales=Count('animales')).order_by('id_categoria')
+    data = {
+        'estados_conservacion': {
+            'fauna': ESTADO_FAUNA_CHOICES,
+            'flora': ESTADO_FLORA_CHOICES,
+        },
+        # Counted in one GROUP BY, like CategoriaViewSet
+        'categorias': CategoriaSerializer(categorias, many=True).data,
+        'amenazas': AmenazaSerializer(Amenaza.objects.order_by('id_amenaza'), many=True).data,
+        'acciones_proteccion': AccionProteccionSerializer(
+            AccionProteccion.objects.order_by('id_accion'), many=True
+        ).data,
+    }
+    return Paquete(JSONRenderer().render(data))
+
+
+def obtener():
+    """Current bundle, rebuilt only when one of TABLAS changed"""
+    firma = versiones.firma(*TABLAS)
+    with _lock:
+        if _paquete['firma'] == firma:
+            return _paquete['data']
+    paquete = construir()
+    with _lock:
+        _paquete.update(firma=firma, data=paquete)
+    return paquete
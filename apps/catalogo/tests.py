@@ -0,0 +1,58 @@
+import gzip
+import json
+
+from django.test import TestCase
+
+from apps.core import versiones
+from apps.fauna.models import Categoria
+
+URL = '/api/catalogo/referencia/'
+
+
+class ReferenciaTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Categoria.objects.create(nombre='Aves')
+
+    def setUp(self):
+        versiones._invalidar()
+
+    def test_etag_distinto_por_codificacion(self):
+        plano = self.client.get(URL)
+        comprimido = self.client.get(URL, HTTP_ACCEPT_ENCODING='gzip, deflate')
+
+        self.assertNotIn('Content-Encoding', plano)
+        self.assertEqual(comprimido['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(comprimido.content)), json.loads(plano.content))
+        self.assertNotEqual(plano['ETag'], comprimido['ETag'])
+        self.assertIn('Accept-Encoding', plano['Vary'])
+
+    def test_gzip_con_q_cero_no_se_comprime(self):
+        for cabecera in ('gzip;q=0', 'gzip;q=0, *', '*;q=0', 'identity'):
+            with self.subTest(accept_encoding=cabecera):
+                response = self.client.get(URL, HTTP_ACCEPT_ENCODING=cabecera)
+                self.assertNotIn('Content-Encoding', response)
+
+    def test_if_none_match(self):
+        etag = self.client.get(URL)['ETag']
+        etag_gzip = self.client.get(URL, HTTP_ACCEPT_ENCODING='gzip')['ETag']
+        casos = [
+            (etag, '', 304),
+            (f'W/{etag}', '', 304),
+            (f'"otro", {etag}', '', 304),
+            ('*', '', 304),
+            (etag_gzip, 'gzip', 304),
+            # The identity tag does not validate the gzip representation, nor the reverse
+            (etag, 'gzip', 200),
+            (etag_gzip, '', 200),
+            # Substrings of a tag are not tags
+            (etag.strip('"')[:10], '', 200),
+            (f'"x{etag.strip(chr(34))}"', '', 200),
+        ]
+        for if_none_match, accept_encoding, codigo in casos:
+            with self.subTest(if_none_match=if_none_match, accept_encoding=accept_encoding):
+                response = self.client.get(
+                    URL, HTTP_IF_NONE_MATCH=if_none_match, HTTP_ACCEPT_ENCODING=accept_encoding
+                )
+                self.assertEqual(response.status_code, codigo)
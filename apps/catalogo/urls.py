@@ -0,0 +1,10 @@
+"""Catalog URL configuration"""
+from django.urls import path
+from .views import ReferenciaView
+
+app_name = 'catalogo'
+
+urlpatterns = [
+    # Datos de referencia en un solo payload (estados, categorías, amenazas, acciones)
+    path('referencia/', ReferenciaView.as_view(), name='referencia'),
+]
@@ -0,0 +1,93 @@
+"""Catalog views"""
+from django.http import HttpResponse, HttpResponseNotModified, HttpResponseRedirect
+from django.urls import reverse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from . import referencia
+
+
+def acepta_gzip(accept_encoding):
+    """
+    Whether an Accept-Encoding header allows gzip: listed with q > 0, or not
+    listed and covered by ``*`` with q > 0.
+    """
+    calidades = {}
+    for elemento in accept_encoding.split(','):
+        codificacion, *parametros = [parte.strip() for parte in elemento.split(';')]
+        if not codificacion:
+            continue
+        calidad = 1.0
+        for parametro in parametros:
+            nombre, _, valor = parametro.partition('=')
+            if nombre.strip().lower() == 'q':
+                try:
+                    calidad = float(valor)
+                except ValueError:
+                    calidad = 0.0
+        calidades[codificacion.lower()] = calidad
+    for codificacion in ('gzip', 'x-gzip', '*'):
+        if codificacion in calidades:
+            return calidades[codificacion] > 0
+    return False
+
+
+class ReferenciaView(APIView):
+    """
+    Reference data in one request: estados de conservación, categorías (with
+    animal counts), amenazas and acciones de protección.
+
+    The payload is rendered and gzip-compressed once per data version and served
+    as bytes. Fetching it through the versioned URL (``?v=<hash>``, advertised in
+    the ``X-Referencia-Url`` header) allows ``Cache-Control: immutable``.
+    """
+    permission_classes = [AllowAny]
+    
+    @swagger_auto_schema(
+        operation_description="Get all reference data (estados, categorías, amenazas, acciones) in one payload",
+        manual_parameters=[
+            openapi.Parameter(
+                'v',
+                openapi.IN_QUERY,
+                description="Content hash from X-Referencia-Url; enables immutable caching",
+                type=openapi.TYPE_STRING
+            )
+        ],
+        responses={200: openapi.Response(description="Reference data bundle"), 304: 'Not Modified'}
+    )
+    def get(self, request):
+        paquete = referencia.obtener()
+        url_versionada = f"{reverse('catalogo:referencia')}?v={paquete.hash}"
+        
+        version = request.query_params.get('v')
+        if version and version != paquete.hash:
+            # Outdated versioned URL: never serve new content under an old immutable URL
+            return HttpResponseRedirect(url_versionada)
+        
+        comprimido = acepta_gzip(request.headers.get('Accept-Encoding', ''))
+        etag = paquete.etag_gzip if comprimido else paquete.etag
+        # If-None-Match uses the weak comparison: W/"x" matches "x"
+        etags = [
+            candidato.removeprefix('W/')
+            for candidato in parse_etags(request.headers.get('If-None-Match', ''))
+        ]
+        if '*' in etags or etag in etags:
+            response = HttpResponseNotModified()
+        elif comprimido:
+            response = HttpResponse(paquete.gzip, content_type='application/json')
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(paquete.json, content_type='application/json')
+        
+        response['ETag'] = etag
+        response['X-Referencia-Url'] = url_versionada
+        if version:
+            response['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response['Cache-Control'] = 'public, max-age=0, must-revalidate'
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return response
@@ -0,0 +1,135 @@
+"""
+Sparse fieldsets: ``?fields=`` / ``?exclude=`` for serializers and querysets.
+
+``DynamicFieldsMixin`` trims a serializer to the requested fields.
+``SparseFieldsetMixin`` wires it into a viewset and derives the queryset
+projection (``only()``, ``select_related()``, ``prefetch_related()``) from the
+fields actually rendered, so unrequested columns, joins and prefetches are
+never read.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+def lista_campos(valor):
+    """``'a, b,,c'`` -> ``['a', 'b', 'c']``; None when the parameter is absent"""
+    if valor is None:
+        return None
+    return [campo.strip() for campo in valor.split(',') if campo.strip()]
+
+
+class DynamicFieldsMixin:
+    """ModelSerializer mixin accepting ``fields`` and ``exclude`` kwargs"""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        exclude = kwargs.pop('exclude', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+        for field_name in exclude or ():
+            self.fields.pop(field_name, None)
+
+
+def proyeccion(model, fields, requisitos=None):
+    """
+    ``(only, select_related, prefetch_related)`` needed to render ``fields``.
+
+    Sources are mapped onto the model: ``categoria.nombre`` needs a join and
+    that column, a nested serializer needs its whole related row, a ``many``
+    field needs a prefetch. Fields whose source is not a model field (method
+    fields, properties) are looked up in ``requisitos`` (field name -> list of
+    lookup paths) and otherwise need nothing beyond the primary key.
+    """
+    requisitos = requisitos or {}
+    only = {model._meta.pk.name}
+    select = set()
+    prefetch = set()
+
+    def agregar(ruta, unir=False):
+        partes = ruta.split('__')
+        only.add(ruta)
+        if len(partes) > 1:
+            select.add('__'.join(partes[:-1]))
+        if unir:
+            select.add(ruta)
+
+    for nombre, field in fields.items():
+        if nombre in requisitos:
+            for ruta in requisitos[nombre]:
+                agregar(ruta)
+            continue
+        if field.source == '*':
+            continue
+        try:
+            model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            continue
+        ruta = '__'.join(field.source_attrs)
+        if isinstance(field, (serializers.ListSerializer, serializers.ManyRelatedField)):
+            prefetch.add(ruta)
+        else:
+            agregar(ruta, unir=isinstance(field, serializers.BaseSerializer))
+
+    # A select_related relation must not be deferred
+    only.update(select)
+    return sorted(only), sorted(select), sorted(prefetch)
+
+
+class SparseFieldsetMixin:
+    """
+    ViewSet mixin for ``?fields=a,b`` / ``?exclude=c`` (``?minimal=true`` is an
+    alias for ``minimal_fields``).
+
+    Sparse requests are rendered with ``sparse_serializer_class`` (a
+    DynamicFieldsMixin serializer declaring every available field);
+    ``field_requirements`` maps method fields to the lookups they read.
+    """
+    sparse_serializer_class = None
+    minimal_fields = None
+    field_requirements = {}
+
+    def get_sparse_fields(self):
+        """``(fields, exclude)`` from the query string, None when not requested"""
+        params = self.request.query_params
+        fields = lista_campos(params.get('fields'))
+        if fields is None and params.get('minimal') == 'true':
+            fields = list(self.minimal_fields)
+        exclude = lista_campos(params.get('exclude'))
+        for param, nombres in (('fields', fields), ('exclude', exclude)):
+            self.validate_sparse_fields(param, nombres)
+        return fields, exclude
+
+    def validate_sparse_fields(self, param, nombres):
+        """400 listing the names in ``nombres`` that the sparse serializer does not declare"""
+        if not nombres:
+            return
+        if getattr(self, '_available_fields', None) is None:
+            self._available_fields = list(self.sparse_serializer_class().fields)
+        desconocidos = [nombre for nombre in nombres if nombre not in self._available_fields]
+        if desconocidos:
+            raise ValidationError({
+                param: f"Unknown fields: {', '.join(desconocidos)}. "
+                       f"Available: {', '.join(self._available_fields)}"
+            })
+
+    def is_sparse(self):
+        fields, exclude = self.get_sparse_fields()
+        return fields is not None or exclude is not None
+
+    def get_serializer(self, *args, **kwargs):
+        if self.is_sparse() and self.get_serializer_class() is self.sparse_serializer_class:
+            kwargs['fields'], kwargs['exclude'] = self.get_sparse_fields()
+        return super().get_serializer(*args, **kwargs)
+
+    def project_queryset(self, queryset):
+        """Restrict ``queryset`` to what the serializer for this request renders"""
+        serializer = self.get_serializer()
+        only, select, prefetch = proyeccion(queryset.model, serializer.fields, self.field_requirements)
+        if select:
+            # select_related() with no arguments would follow every foreign key
+            queryset = queryset.select_related(*select)
+        return queryset.prefetch_related(*prefetch).only(*only)
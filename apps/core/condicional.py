@@ -0,0 +1,91 @@
+"""
+Conditional GET for catalog read endpoints.
+
+Views declare the tables they read (``version_models``). Validators come from
+their data versions (VersionTabla, see versiones.py) and the derivatives
+manifest, both held in process memory, so a matching ``If-None-Match`` /
+``If-Modified-Since`` is answered with 304 before any catalog query.
+"""
+import hashlib
+from datetime import datetime, timezone
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from . import derivados, versiones
+
+
+class RespuestaAnticipada(Exception):
+    """Short-circuits a view from ``initial`` (a 304, or a cached response)"""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    APIView mixin adding strong ETag / Last-Modified to GET and HEAD.
+
+    The ETag covers the data versions, the URL and the negotiated media type,
+    so every representation gets its own. Views whose payload is not a pure
+    function of those tables override ``get_version_token`` (or declare no
+    ``version_models`` to opt out).
+    """
+    version_models = ()
+
+    def get_version_models(self):
+        return self.version_models
+
+    def get_version_token(self):
+        """``(token, last_modified)`` describing the data this request renders, None to skip"""
+        models = self.get_version_models()
+        if not models:
+            return None
+        todas = versiones.todas()
+        fechas = [todas[versiones.tabla(model)][1] for model in models if versiones.tabla(model) in todas]
+        manifest = derivados.version()
+        if manifest:
+            fechas.append(datetime.fromtimestamp(manifest, tz=timezone.utc))
+        return f'{versiones.firma(*models)}|{manifest}', max(fechas, default=None)
+
+    def get_validators(self, request, token, last_modified):
+        contenido = f'{token}|{request.accepted_media_type}|{request.get_full_path()}'
+        return f'"{hashlib.sha256(contenido.encode()).hexdigest()[:20]}"', last_modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.version_token = None
+        self.validators = None
+        if request.method not in ('GET', 'HEAD'):
+            return
+        version = self.get_version_token()
+        if version is None:
+            return
+        self.version_token = version[0]
+        self.validators = self.get_validators(request, *version)
+        etag, last_modified = self.validators
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if response is not None:
+            raise RespuestaAnticipada(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, RespuestaAnticipada):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, 'validators', None)
+        if validators and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified.timestamp())
+            # Always revalidate; the 304 path is cheap
+            patch_cache_control(response, max_age=0, must_revalidate=True)
+        return response
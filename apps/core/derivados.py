@@ -0,0 +1,139 @@
+"""
+Responsive image derivatives for photo URLs.
+
+``manage.py generar_derivados`` downloads (or reads) every ``url_foto``,
+generates resized WebP/JPEG variants at ``GALERIA_DERIVADOS_ANCHOS`` and stores
+them content-addressed under ``MEDIA_ROOT/derivados/<sha256 of the source>/``.
+A manifest maps sha256(url_foto) to the source hash and generated widths, so
+only new or changed URLs are processed and serializers can build a ``srcset``
+without touching the database.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+from django.conf import settings
+
+
+FORMATOS = {
+    'webp': 'WEBP',
+    'jpeg': 'JPEG',
+}
+
+_manifest = {'data': {}, 'mtime': None, 'verificado': 0.0}
+_lock = threading.Lock()
+
+
+def directorio():
+    return Path(settings.MEDIA_ROOT) / 'derivados'
+
+
+def ruta_manifest():
+    return directorio() / 'manifest.json'
+
+
+def clave(url_foto):
+    return hashlib.sha256(url_foto.encode('utf-8')).hexdigest()
+
+
+def leer_manifest():
+    try:
+        with open(ruta_manifest(), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def escribir_manifest(data):
+    """Atomic replace so API workers never read a half-written manifest"""
+    ruta = ruta_manifest()
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    tmp = ruta.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp, ruta)
+
+
+def manifest():
+    """Process-cached manifest, re-read when its mtime changes (checked every few seconds)"""
+    with _lock:
+        if time.monotonic() - _manifest['verificado'] > settings.GALERIA_DERIVADOS_REFRESCO:
+            _manifest['verificado'] = time.monotonic()
+            try:
+                mtime = os.stat(ruta_manifest()).st_mtime
+            except FileNotFoundError:
+                mtime = None
+            if mtime != _manifest['mtime']:
+                _manifest['data'] = leer_manifest() if mtime else {}
+                _manifest['mtime'] = mtime
+        return _manifest['data']
+
+
+def version():
+    """mtime of the manifest currently served (None before any generation)"""
+    manifest()
+    return _manifest['mtime']
+
+
+def srcset(url_foto):
+    """``{'webp': 'url 320w, ...', 'jpeg': ...}`` for a photo URL, or None if not generated yet"""
+    if not url_foto:
+        return None
+    entrada = manifest().get(clave(url_foto))
+    if not entrada:
+        return None
+    base = f"{settings.MEDIA_URL}derivados/{entrada['contenido']}/"
+    return {
+        formato: ', '.join(f'{base}{ancho}.{formato} {ancho}w' for ancho in entrada['anchos'])
+        for formato in FORMATOS
+    }
+
+
+def _leer_origen(url_foto, timeout):
+    if url_foto.startswith(('http://', 'https://')):
+        peticion = urllib.request.Request(url_foto, headers={'User-Agent': 'EcoAlbum-Derivados/1.0'})
+        with urllib.request.urlopen(peticion, timeout=timeout) as respuesta:
+            return respuesta.read()
+    # Local sources must be relative paths that stay inside MEDIA_ROOT
+    if Path(url_foto).is_absolute():
+        raise ValueError(f'Ruta absoluta no permitida: {url_foto}')
+    raiz = Path(settings.MEDIA_ROOT).resolve()
+    ruta = (raiz / url_foto).resolve()
+    if not ruta.is_relative_to(raiz):
+        raise ValueError(f'Ruta fuera de MEDIA_ROOT: {url_foto}')
+    return ruta.read_bytes()
+
+
+def generar(url_foto, raiz, anchos, calidad, timeout):
+    """
+    Process-pool worker: build every variant of one source image.
+
+    Returns ``(url_foto, entrada, error)``; ``entrada`` is the manifest value.
+    """
+    from PIL import Image
+
+    try:
+        contenido = _leer_origen(url_foto, timeout)
+        digest = hashlib.sha256(contenido).hexdigest()
+        destino = Path(raiz) / digest
+        with Image.open(io.BytesIO(contenido)) as imagen:
+            imagen = imagen.convert('RGB')
+            # Never upscale: keep widths smaller than the source (or the source width itself)
+            generados = [ancho for ancho in anchos if ancho < imagen.width] or [imagen.width]
+            destino.mkdir(parents=True, exist_ok=True)
+            for ancho in generados:
+                archivos = {f: destino / f'{ancho}.{f}' for f in FORMATOS}
+                if all(archivo.exists() for archivo in archivos.values()):
+                    continue  # Same content already derived from another URL
+                alto = max(1, round(imagen.height * ancho / imagen.width))
+                variante = imagen.resize((ancho, alto), Image.LANCZOS)
+                for formato, archivo in archivos.items():
+                    variante.save(archivo, FORMATOS[formato], quality=calidad)
+        return url_foto, {'contenido': digest, 'anchos': generados}, None
+    except Exception as e:
+        return url_foto, None, str(e)
@@ -0,0 +1,16 @@
+"""Estados de conservación (sincronizados con schema.sql)"""
+
+ESTADO_FAUNA_CHOICES = [
+    'Preocupación menor (LC)',
+    'Casi amenazado (NT)',
+    'Vulnerable (VU)',
+    'En peligro (EN)',
+    'Peligro crítico (CR)',
+]
+
+ESTADO_FLORA_CHOICES = [
+    'Preocupación menor (LC)',
+    'Vulnerable (VU)',
+    'En peligro (EN)',
+    'Peligro crítico (CR)',
+]
@@ -0,0 +1,84 @@
+"""
+Facet counts for list endpoints: ``?facets=categoria,estado``.
+
+All requested facets come from one GROUP BY over the filtered queryset (on
+every requested column together); each facet is then the marginal sum of
+those groups. Unfiltered facets are cached per data version.
+"""
+import threading
+from collections import Counter
+
+from django.db.models import Count
+from rest_framework.exceptions import ValidationError
+
+from . import versiones
+from .campos import lista_campos
+
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def contar(queryset, facetas):
+    """``{faceta: [{'valor', 'total'}, ...]}`` for ``facetas`` (name -> lookup path), in one query"""
+    rutas = list(dict.fromkeys(facetas.values()))
+    grupos = queryset.order_by().values(*rutas).annotate(total=Count('pk'))
+    totales = {nombre: Counter() for nombre in facetas}
+    for grupo in grupos:
+        for nombre, ruta in facetas.items():
+            totales[nombre][grupo[ruta]] += grupo['total']
+    return {
+        nombre: [
+            {'valor': valor, 'total': total}
+            for valor, total in sorted(contador.items(), key=lambda par: (-par[1], par[0] or ''))
+        ]
+        for nombre, contador in totales.items()
+    }
+
+
+class FacetMixin:
+    """
+    List mixin adding a ``facets`` key next to ``results``.
+
+    ``facet_fields`` maps public facet names to lookup paths;
+    ``facet_models`` are the tables whose data version keys the cache of
+    unfiltered facets.
+    """
+    facets_query_param = 'facets'
+    facet_fields = {}
+    facet_models = ()
+
+    def get_facets(self):
+        nombres = lista_campos(self.request.query_params.get(self.facets_query_param))
+        if not nombres:
+            return None
+        desconocidas = [nombre for nombre in nombres if nombre not in self.facet_fields]
+        if desconocidas:
+            raise ValidationError({
+                self.facets_query_param: f"Unknown facets: {', '.join(desconocidas)}. "
+                                         f"Available: {', '.join(self.facet_fields)}"
+            })
+        facetas = {nombre: self.facet_fields[nombre] for nombre in nombres}
+
+        filtrado = any(param in self.request.query_params for param in self.filterset_class.base_filters)
+        if filtrado:
+            return contar(self.filter_queryset(self.get_queryset()), facetas)
+
+        clave = (self.queryset.model, tuple(sorted(facetas)))
+        actual = versiones.firma(*self.facet_models)
+        with _lock:
+            entrada = _cache.get(clave)
+            if entrada and entrada[0] == actual:
+                return entrada[1]
+        data = contar(self.queryset.model.objects.all(), facetas)
+        with _lock:
+            _cache[clave] = (actual, data)
+        return data
+
+    def list(self, request, *args, **kwargs):
+        # Validate ?facets= before running the page query
+        facetas = self.get_facets()
+        response = super().list(request, *args, **kwargs)
+        if facetas is not None:
+            response.data['facets'] = facetas
+        return response
@@ -0,0 +1,58 @@
+"""
+A-Z browse index for species listings.
+
+``letra_inicial`` is a stored, indexed column on Animal and Flora (set in
+``save()``), so ``?letra=`` is an equality lookup and the per-letter histogram
+is one GROUP BY on it. Unfiltered histograms are cached per data version.
+"""
+import threading
+
+from django.db.models import Count
+
+from . import versiones
+from .texto import letra_inicial
+
+
+ALFABETO = [chr(codigo) for codigo in range(ord('A'), ord('Z') + 1)] + ['#']
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def contar(queryset):
+    """``{letra: total}`` over ``queryset``, with every letter present (0 when empty)"""
+    totales = dict(
+        queryset.order_by().values('letra_inicial').annotate(total=Count('pk')).values_list('letra_inicial', 'total')
+    )
+    return {letra: totales.get(letra, 0) for letra in ALFABETO}
+
+
+def conteos(model):
+    """``contar`` over every row of ``model``, one GROUP BY per data version"""
+    actual = versiones.firma(model)
+    with _lock:
+        entrada = _cache.get(model)
+        if entrada and entrada[0] == actual:
+            return entrada[1]
+    data = contar(model.objects.all())
+    with _lock:
+        _cache[model] = (actual, data)
+    return data
+
+
+def sincronizar(model):
+    """
+    Recompute ``letra_inicial`` where it is stale (rows inserted by raw SQL).
+
+    Returns the number of rows updated.
+    """
+    cambiados = []
+    for obj in model.objects.only('pk', 'nombre_comun', 'letra_inicial').iterator(chunk_size=2000):
+        letra = letra_inicial(obj.nombre_comun)
+        if obj.letra_inicial != letra:
+            obj.letra_inicial = letra
+            cambiados.append(obj)
+    model.objects.bulk_update(cambiados, ['letra_inicial'], batch_size=500)
+    if cambiados:
+        versiones.incrementar(model)
+    return len(cambiados)
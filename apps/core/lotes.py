@@ -0,0 +1,46 @@
+"""
+Batch retrieve on list endpoints: ``?ids=3,1,2``.
+
+Returns the requested rows in request order, rendered like the detail view
+and fetched with one query plus one per prefetched relation, whatever the
+number of ids. List filters and pagination do not apply.
+"""
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .campos import lista_campos
+
+
+class BatchRetrieveMixin:
+    """ViewSet mixin; ``get_serializer_class`` should check ``is_batch()`` like it checks retrieve"""
+    ids_query_param = 'ids'
+
+    def get_ids(self):
+        """Requested primary keys, deduplicated in request order; None when not requested"""
+        valores = lista_campos(self.request.query_params.get(self.ids_query_param))
+        if valores is None:
+            return None
+        try:
+            ids = list(dict.fromkeys(int(valor) for valor in valores))
+        except ValueError:
+            raise ValidationError({self.ids_query_param: 'Expected a comma-separated list of integer ids'})
+        if not ids:
+            raise ValidationError({self.ids_query_param: 'At least one id is required'})
+        if len(ids) > settings.CATALOGO_IDS_MAX:
+            raise ValidationError({self.ids_query_param: f'At most {settings.CATALOGO_IDS_MAX} ids per request'})
+        return ids
+
+    def is_batch(self):
+        return self.action == 'list' and self.ids_query_param in self.request.query_params
+
+    def list(self, request, *args, **kwargs):
+        ids = self.get_ids()
+        if ids is None:
+            return super().list(request, *args, **kwargs)
+        encontrados = {obj.pk: obj for obj in self.get_queryset().filter(pk__in=ids)}
+        serializer = self.get_serializer([encontrados[pk] for pk in ids if pk in encontrados], many=True)
+        return Response({
+            'results': serializer.data,
+            'missing': [pk for pk in ids if pk not in encontrados],
+        })
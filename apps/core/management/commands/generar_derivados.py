@@ -0,0 +1,68 @@
+"""Generate responsive WebP/JPEG derivatives for every photo URL"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core import derivados
+from apps.fauna.models import FotoAnimal
+from apps.flora.models import FotoFlora
+
+
+class Command(BaseCommand):
+    help = (
+        'Genera miniaturas WebP/JPEG (GALERIA_DERIVADOS_ANCHOS) para cada url_foto. '
+        'Incremental: solo procesa URLs nuevas o cambiadas.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None, help='Procesos del pool (default: CPUs)')
+        parser.add_argument('--todos', action='store_true', help='Regenerar también las URLs ya procesadas')
+        parser.add_argument('--timeout', type=int, default=30, help='Timeout de descarga en segundos')
+
+    def handle(self, *args, **options):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise CommandError('Pillow no está instalado: pip install -r requirements.txt')
+
+        manifest = {} if options['todos'] else derivados.leer_manifest()
+        urls = set()
+        for model in (FotoAnimal, FotoFlora):
+            urls.update(model.objects.values_list('url_foto', flat=True).distinct().iterator())
+        pendientes = sorted(url for url in urls if url and derivados.clave(url) not in manifest)
+
+        # Drop entries for URLs no longer referenced (files stay: content-addressed, may be shared)
+        vigentes = {derivados.clave(url) for url in urls if url}
+        manifest = {k: v for k, v in manifest.items() if k in vigentes}
+
+        self.stdout.write(f'{len(urls)} URLs, {len(pendientes)} pendientes')
+        if not pendientes:
+            derivados.escribir_manifest(manifest)
+            return
+
+        raiz = str(derivados.directorio())
+        anchos = sorted(settings.GALERIA_DERIVADOS_ANCHOS)
+        generadas = errores = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            futuros = [
+                pool.submit(
+                    derivados.generar, url, raiz, anchos,
+                    settings.GALERIA_DERIVADOS_CALIDAD, options['timeout']
+                )
+                for url in pendientes
+            ]
+            for i, futuro in enumerate(as_completed(futuros), 1):
+                url, entrada, error = futuro.result()
+                if error:
+                    errores += 1
+                    self.stderr.write(f'  ✗ {url}: {error}')
+                else:
+                    generadas += 1
+                    manifest[derivados.clave(url)] = entrada
+                # Checkpoint so an interrupted run keeps its progress
+                if i % 100 == 0:
+                    derivados.escribir_manifest(manifest)
+
+        derivados.escribir_manifest(manifest)
+        self.stdout.write(self.style.SUCCESS(f'{generadas} URLs procesadas, {errores} errores'))
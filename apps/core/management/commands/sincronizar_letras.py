@@ -0,0 +1,17 @@
+"""Fill Animal/Flora.letra_inicial for rows inserted without Django"""
+from django.core.management.base import BaseCommand
+
+from apps.core import letras
+from apps.fauna.models import Animal
+from apps.flora.models import Flora
+
+
+class Command(BaseCommand):
+    help = 'Recalcula la letra inicial (índice A-Z) de animales y plantas'
+
+    def handle(self, *args, **options):
+        animales = letras.sincronizar(Animal)
+        plantas = letras.sincronizar(Flora)
+        self.stdout.write(self.style.SUCCESS(
+            f'Letra inicial actualizada: {animales} animales, {plantas} plantas.'
+        ))
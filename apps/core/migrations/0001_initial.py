@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VersionTabla',
+            fields=[
+                ('tabla', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('version', models.BigIntegerField(default=0)),
+                ('actualizado', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Versión de tabla',
+                'verbose_name_plural': 'Versiones de tablas',
+                'db_table': 'VersionTabla',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+"""Core models"""
+from django.db import models
+from django.utils import timezone
+
+
+class VersionTabla(models.Model):
+    """Versión de datos por tabla del catálogo (se incrementa en cada escritura)"""
+    tabla = models.CharField(max_length=64, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    actualizado = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'VersionTabla'
+        verbose_name = 'Versión de tabla'
+        verbose_name_plural = 'Versiones de tablas'
+
+    def __str__(self):
+        return f"{self.tabla} v{self.version}"
@@ -0,0 +1,115 @@
+"""
+Opt-in keyset pagination for the species lists.
+
+Without ``?cursor=`` responses are the usual page-number pages. With it
+(empty for the first page) the list is cut on ``(ordering key, pk)`` instead
+of OFFSET, no COUNT is run, and ``next`` carries an opaque cursor, so page
+1000 costs the same as page 1.
+"""
+import base64
+import json
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class OptionalCursorPagination(PageNumberPagination):
+    """PageNumberPagination, or keyset pagination when ``?cursor=`` is present"""
+    cursor_query_param = 'cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        campo, descendente = self.sort_key(queryset)
+        self.orden = f'-{campo}' if descendente else campo
+        nulos = self.nullable(queryset, campo)
+
+        # NULLs sort as the smallest key: first ascending, last descending. That is
+        # SQL Server's own order, so the plain (campo, pk) index still serves it
+        if descendente:
+            queryset = queryset.order_by(F(campo).desc(nulls_last=nulos or None), '-pk')
+        else:
+            queryset = queryset.order_by(F(campo).asc(nulls_first=nulos or None), 'pk')
+
+        posicion = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+        if posicion is not None:
+            queryset = queryset.filter(self.after(campo, descendente, nulos, *posicion))
+
+        filas = list(queryset[:page_size + 1])
+        self.siguiente = None
+        if len(filas) > page_size:
+            filas = filas[:page_size]
+            ultimo = filas[-1]
+            self.siguiente = (getattr(ultimo, campo), ultimo.pk)
+        return filas
+
+    @staticmethod
+    def after(campo, descendente, nulos, valor, pk):
+        """Rows strictly after ``(valor, pk)`` in the order above"""
+        operador = 'lt' if descendente else 'gt'
+        siguiente_pk = Q(**{f'pk__{operador}': pk})
+        if valor is None:
+            # Ascending: the rest of the NULLs, then every value. Descending: NULLs are last
+            condicion = Q(**{f'{campo}__isnull': True}) & siguiente_pk
+            return condicion if descendente else condicion | Q(**{f'{campo}__isnull': False})
+        condicion = Q(**{f'{campo}__{operador}': valor}) | (Q(**{campo: valor}) & siguiente_pk)
+        if descendente and nulos:
+            condicion |= Q(**{f'{campo}__isnull': True})
+        return condicion
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.siguiente is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(*self.siguiente))
+
+    @staticmethod
+    def sort_key(queryset):
+        """``(field, descending)`` from the first ordering term; pk when unordered"""
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        termino = ordering[0] if ordering else 'pk'
+        if not isinstance(termino, str):
+            return 'pk', False
+        return termino.lstrip('-'), termino.startswith('-')
+
+    @staticmethod
+    def nullable(queryset, campo):
+        try:
+            return queryset.model._meta.get_field(campo).null
+        except FieldDoesNotExist:
+            # pk alias or an annotation such as the search rank
+            return False
+
+    def encode_cursor(self, valor, pk):
+        contenido = json.dumps([self.orden, valor, pk], separators=(',', ':'))
+        return base64.urlsafe_b64encode(contenido.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return None
+        try:
+            orden, valor, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            # A cursor is only meaningful for the ordering it was issued under
+            if orden != self.orden or not isinstance(pk, int) or not isinstance(valor, (str, int, type(None))):
+                raise ValueError(cursor)
+            return valor, pk
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound('Invalid cursor')
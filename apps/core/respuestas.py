@@ -0,0 +1,125 @@
+"""
+Response cache for catalog read endpoints.
+
+Rendered JSON is stored in the ``respuestas`` cache alias under a key built
+from the host, the path, the sorted query parameters, the negotiated media
+type and the data versions of the tables the view reads. Any write bumps a
+version (see versiones.py), so later requests simply compute another key and
+stale entries age out on their own; nothing is ever enumerated or deleted.
+
+Hits and misses are counted per view in the same cache, so with a shared
+backend (file-based, one host) the figures cover every worker; they are
+approximate (see ``contar``).
+"""
+import hashlib
+from urllib.parse import urlencode
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from rest_framework.response import Response
+
+from .condicional import ConditionalGetMixin, RespuestaAnticipada
+
+
+ALIAS = 'respuestas'
+
+# View names with a cache, for the stats endpoint (counters are looked up by name)
+vistas = set()
+
+
+def cache():
+    return caches[ALIAS]
+
+
+def clave(request, token):
+    parametros = urlencode(sorted(
+        (nombre, valor) for nombre in request.query_params for valor in request.query_params.getlist(nombre)
+    ))
+    contenido = '|'.join([
+        request.get_host(), request.path, parametros, request.accepted_media_type, token,
+    ])
+    return f'respuesta:{hashlib.sha256(contenido.encode()).hexdigest()}'
+
+
+def contar(vista, resultado):
+    """
+    Bump a hit/miss counter.
+
+    ``incr()`` is atomic on LocMemCache, Memcached and Redis. FileBasedCache
+    implements it as ``get()`` + ``set()``, so concurrent workers sharing a
+    directory can lose increments there, and any backend may cull a counter
+    under MAX_ENTRIES: the figures are approximate, meant for a hit ratio.
+    """
+    nombre = f'estadistica:{vista}:{resultado}'
+    respaldo = cache()
+    try:
+        respaldo.incr(nombre)
+    except ValueError:
+        # First count (or culled): only one worker's add() wins, the others incr()
+        if not respaldo.add(nombre, 1, timeout=None):
+            try:
+                respaldo.incr(nombre)
+            except ValueError:
+                pass
+
+
+def estadisticas():
+    """``{view: {hits, misses, ratio}}`` plus a ``total`` entry"""
+    respaldo = cache()
+    resultado = {}
+    total_hits = total_misses = 0
+    for vista in sorted(vistas):
+        hits = respaldo.get(f'estadistica:{vista}:hit', 0)
+        misses = respaldo.get(f'estadistica:{vista}:miss', 0)
+        total_hits += hits
+        total_misses += misses
+        resultado[vista] = {
+            'hits': hits,
+            'misses': misses,
+            'ratio': round(hits / (hits + misses), 3) if hits + misses else None,
+        }
+    resultado['total'] = {
+        'hits': total_hits,
+        'misses': total_misses,
+        'ratio': round(total_hits / (total_hits + total_misses), 3) if total_hits + total_misses else None,
+    }
+    return resultado
+
+
+class CachedResponseMixin(ConditionalGetMixin):
+    """
+    ConditionalGetMixin that also serves JSON GETs from the response cache.
+
+    Only views with ``version_models`` (or another version token) are cached;
+    the ``X-Cache`` header says whether a response was a HIT or a MISS.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        vistas.add(cls.__name__)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.cache_key = None
+        if request.method != 'GET' or self.version_token is None or request.accepted_renderer.format != 'json':
+            return
+        self.cache_key = clave(request, self.version_token)
+        entrada = cache().get(self.cache_key)
+        contar(type(self).__name__, 'miss' if entrada is None else 'hit')
+        if entrada is not None:
+            contenido, content_type = entrada
+            response = HttpResponse(contenido, content_type=content_type)
+            response['X-Cache'] = 'HIT'
+            raise RespuestaAnticipada(response)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, 'cache_key', None) and isinstance(response, Response) and response.status_code == 200:
+            clave_cache = self.cache_key
+
+            def guardar(renderizada):
+                cache().set(clave_cache, (renderizada.content, renderizada['Content-Type']))
+
+            response.add_post_render_callback(guardar)
+            response['X-Cache'] = 'MISS'
+        return response
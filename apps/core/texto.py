@@ -0,0 +1,22 @@
+"""Text folding shared by search, autocomplete and the A-Z index"""
+import re
+import unicodedata
+
+
+SEPARADOR = re.compile(r'[^0-9a-z]+')
+
+
+def normalizar(texto):
+    """Accent- and case-folded form: ``'Águila  Harpía'`` -> ``'aguila harpia'``"""
+    descompuesto = unicodedata.normalize('NFKD', texto or '')
+    sin_acentos = ''.join(c for c in descompuesto if not unicodedata.combining(c))
+    return SEPARADOR.sub(' ', sin_acentos.casefold()).strip()
+
+
+def letra_inicial(texto):
+    """A-Z bucket of ``texto`` (``'Águila'`` -> ``'A'``, ``'Ñeque'`` -> ``'N'``), '#' for digits/others"""
+    plegado = normalizar(texto)
+    if not plegado:
+        return '#'
+    letra = plegado[0].upper()
+    return letra if 'A' <= letra <= 'Z' else '#'
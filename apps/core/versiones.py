@@ -0,0 +1,151 @@
+"""
+Catalog data versions.
+
+Each registered model has a row in VersionTabla whose counter is bumped by
+post_save/post_delete/m2m_changed signals. Caches key their entries on
+``firma(...)`` of the tables they read, so any write anywhere invalidates
+them without enumerating keys.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils import timezone
+
+
+_registradas = set()
+_memo = {'data': None, 'leido': 0.0}
+_lock = threading.Lock()
+
+# {tabla: {version}} produced by this process's own signal-tracked writes, once committed
+_propias = {}
+PROPIAS_MAX = 10000
+
+
+def tabla(model):
+    return model._meta.db_table
+
+
+def _invalidar():
+    with _lock:
+        _memo['data'] = None
+
+
+def incrementar(*models):
+    """Bump the version of every table in ``models`` (also the hook for bulk writes)"""
+    from .models import VersionTabla
+
+    ahora = timezone.now()
+    for nombre in sorted({tabla(model) for model in models}):
+        actualizadas = VersionTabla.objects.filter(tabla=nombre).update(
+            version=F('version') + 1, actualizado=ahora
+        )
+        if not actualizadas:
+            try:
+                with transaction.atomic():
+                    VersionTabla.objects.create(tabla=nombre, version=1, actualizado=ahora)
+            except IntegrityError:
+                VersionTabla.objects.filter(tabla=nombre).update(
+                    version=F('version') + 1, actualizado=ahora
+                )
+    _invalidar()
+
+
+def todas():
+    """
+    ``{tabla: (version, actualizado)}`` for every table.
+
+    Served from process memory for CATALOGO_VERSIONES_TTL seconds (local writes
+    invalidate it immediately), otherwise one small query.
+    """
+    from .models import VersionTabla
+
+    with _lock:
+        if _memo['data'] is not None and time.monotonic() - _memo['leido'] < settings.CATALOGO_VERSIONES_TTL:
+            return _memo['data']
+    data = {
+        nombre: (version, actualizado)
+        for nombre, version, actualizado in VersionTabla.objects.values_list('tabla', 'version', 'actualizado')
+    }
+    with _lock:
+        _memo.update(data=data, leido=time.monotonic())
+    return data
+
+
+def obtener(*models):
+    """``{tabla: version}`` for ``models`` (0 for tables never written)"""
+    data = todas()
+    return {tabla(model): data.get(tabla(model), (0, None))[0] for model in models}
+
+
+def firma(*models):
+    """Stable string identifying the data state of ``models``"""
+    return '.'.join(f'{nombre}:{version}' for nombre, version in sorted(obtener(*models).items()))
+
+
+def _anotar_propia(model):
+    """
+    Remember the version this write just produced for ``model``.
+
+    Read inside the write's transaction, which holds the VersionTabla row
+    lock, so the value is ours; recorded only on commit, since a rolled-back
+    number is reused by the next writer.
+    """
+    from .models import VersionTabla
+
+    nombre = tabla(model)
+    version = VersionTabla.objects.filter(tabla=nombre).values_list('version', flat=True).first()
+
+    def confirmar():
+        with _lock:
+            propias = _propias.setdefault(nombre, set())
+            if len(propias) >= PROPIAS_MAX:
+                # Forgetting only costs in-process caches a rebuild
+                propias.clear()
+            propias.add(version)
+
+    transaction.on_commit(confirmar)
+
+
+def solo_propias(anteriores, actuales):
+    """
+    True when every version between ``anteriores`` and ``actuales``
+    (``{tabla: version}``) came from this process's signal-tracked writes,
+    i.e. no other process (and no bulk write) changed those tables meanwhile.
+    """
+    with _lock:
+        for nombre, version in actuales.items():
+            desde = anteriores.get(nombre, 0)
+            propias = _propias.get(nombre, ())
+            if version < desde or any(v not in propias for v in range(desde + 1, version + 1)):
+                return False
+    return True
+
+
+def _al_escribir(sender, **kwargs):
+    if kwargs.get('raw'):
+        return
+    incrementar(sender)
+    _anotar_propia(sender)
+
+
+def _al_cambiar_m2m(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        incrementar(sender)
+        _anotar_propia(sender)
+
+
+def registrar(*models):
+    """Track writes to ``models``; m2m through tables are tracked via m2m_changed too"""
+    for model in models:
+        if model in _registradas:
+            continue
+        _registradas.add(model)
+        uid = f'versiones:{model._meta.label}'
+        post_save.connect(_al_escribir, sender=model, dispatch_uid=uid)
+        post_delete.connect(_al_escribir, sender=model, dispatch_uid=uid)
+        # Only fires when ``model`` is the through table of a ManyToManyField
+        m2m_changed.connect(_al_cambiar_m2m, sender=model, dispatch_uid=uid)
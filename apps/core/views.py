@@ -1,10 +1,12 @@
-"""Core views - Health check"""
+"""Core views - Health check, response cache stats"""
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import connection
 from django.utils import timezone
 
+from . import respuestas
+
 
 class HealthCheckView(APIView):
     """Health check endpoint"""
@@ -33,3 +35,10 @@ class HealthCheckView(APIView):
         
         status_code = status.HTTP_200_OK if api_status == 'healthy' else status.HTTP_503_SERVICE_UNAVAILABLE
         return Response(data, status=status_code)
+
+
+class ResponseCacheStatsView(APIView):
+    """Hit/miss counts of the response cache per view, for tuning"""
+    
+    def get(self, request):
+        return Response(respuestas.estadisticas())
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class ExportacionConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.exportacion'
+    verbose_name = 'Exportación'
@@ -0,0 +1,136 @@
+"""
+Full-catalog export rows.
+
+Species are read in primary-key batches of EXPORTACION_LOTE rows, each
+batch with its joins and prefetches (photos, threats, actions), so memory
+is bounded by one batch whatever the catalog size and the first rows are
+written before the last ones are read.
+"""
+import csv
+import json
+
+from django.conf import settings
+from django.db.models import Prefetch
+
+from apps.fauna.models import Animal, FotoAnimal
+from apps.flora.models import Flora, FotoFlora
+
+
+def lotes(queryset, tamano):
+    """
+    Rows of ``queryset`` in pk order, ``tamano`` per query.
+
+    Keyset batches instead of ``iterator(chunk_size=...)``: the SQL Server
+    backend has no chunked reads (the iterator would load the whole result)
+    and cannot run the prefetch queries while a cursor is still open.
+    """
+    ultimo = None
+    while True:
+        lote = queryset.order_by('pk')
+        if ultimo is not None:
+            lote = lote.filter(pk__gt=ultimo)
+        lote = list(lote[:tamano])
+        yield from lote
+        if len(lote) < tamano:
+            return
+        ultimo = lote[-1].pk
+
+
+def fotos(obj):
+    return [
+        {'id': foto.id_foto, 'url_foto': foto.url_foto, 'descripcion': foto.descripcion}
+        for foto in obj.fotos.all()
+    ]
+
+
+def fila_animal(animal):
+    return {
+        'id': animal.id_animal,
+        'nombre_comun': animal.nombre_comun,
+        'nombre_cientifico': animal.nombre_cientifico,
+        'categoria': animal.categoria.nombre,
+        'estado': animal.estado,
+        'descripcion': animal.descripcion,
+        'habitat': animal.habitat,
+        'distribucion': animal.distribucion,
+        'importancia_ecologica': animal.importancia_ecologica,
+        'foto_principal': animal.foto_principal.url_foto if animal.foto_principal_id else None,
+        'fotos': fotos(animal),
+        'amenazas': [amenaza.nombre for amenaza in animal.amenazas.all()],
+        'acciones_proteccion': [accion.titulo for accion in animal.acciones_proteccion.all()],
+    }
+
+
+def fila_planta(planta):
+    return {
+        'id': planta.id_planta,
+        'nombre_comun': planta.nombre_comun,
+        'nombre_cientifico': planta.nombre_cientifico,
+        'estado': planta.estado,
+        'descripcion': planta.descripcion,
+        'distribucion': planta.distribucion,
+        'foto_principal': planta.foto_principal.url_foto if planta.foto_principal_id else None,
+        'fotos': fotos(planta),
+    }
+
+
+def animales():
+    return Animal.objects.select_related('categoria', 'foto_principal').prefetch_related(
+        Prefetch('fotos', queryset=FotoAnimal.objects.order_by('id_foto')),
+        'amenazas',
+        'acciones_proteccion',
+    )
+
+
+def plantas():
+    return Flora.objects.select_related('foto_principal').prefetch_related(
+        Prefetch('fotos', queryset=FotoFlora.objects.order_by('id_foto')),
+    )
+
+
+# tipo -> (queryset, row builder, CSV columns in row order)
+FUENTES = {
+    'fauna': (animales, fila_animal, (
+        'id', 'nombre_comun', 'nombre_cientifico', 'categoria', 'estado', 'descripcion', 'habitat',
+        'distribucion', 'importancia_ecologica', 'foto_principal', 'fotos', 'amenazas', 'acciones_proteccion',
+    )),
+    'flora': (plantas, fila_planta, (
+        'id', 'nombre_comun', 'nombre_cientifico', 'estado', 'descripcion', 'distribucion',
+        'foto_principal', 'fotos',
+    )),
+}
+
+
+def filas(tipo):
+    """Export dicts for every species of ``tipo``, lazily"""
+    queryset, fila, _ = FUENTES[tipo]
+    for obj in lotes(queryset(), settings.EXPORTACION_LOTE):
+        yield fila(obj)
+
+
+def como_ndjson(tipo):
+    """One JSON object per line"""
+    for fila in filas(tipo):
+        yield json.dumps(fila, ensure_ascii=False) + '\n'
+
+
+class _Eco:
+    """File-like object whose write() returns the line instead of storing it"""
+
+    def write(self, valor):
+        return valor
+
+
+def celda(valor):
+    """CSV cell: lists become photo URLs or names joined by ' | '"""
+    if isinstance(valor, list):
+        return ' | '.join(item['url_foto'] if isinstance(item, dict) else item for item in valor)
+    return valor
+
+
+def como_csv(tipo):
+    """Header line, then one line per species"""
+    escritor = csv.DictWriter(_Eco(), fieldnames=FUENTES[tipo][2])
+    yield escritor.writeheader()
+    for fila in filas(tipo):
+        yield escritor.writerow({campo: celda(valor) for campo, valor in fila.items()})
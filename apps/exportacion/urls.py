@@ -0,0 +1,10 @@
+"""Export URL configuration"""
+from django.urls import re_path
+from .views import ExportView
+
+app_name = 'exportacion'
+
+urlpatterns = [
+    # Catálogo completo en streaming: fauna.ndjson, flora.ndjson, fauna.csv, flora.csv
+    re_path(r'^(?P<tipo>fauna|flora)\.(?P<formato>ndjson|csv)$', ExportView.as_view(), name='exportar'),
+]
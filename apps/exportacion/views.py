@@ -0,0 +1,35 @@
+"""Full-catalog export views"""
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from . import filas
+
+
+FORMATOS = {
+    'ndjson': (filas.como_ndjson, 'application/x-ndjson; charset=utf-8'),
+    'csv': (filas.como_csv, 'text/csv; charset=utf-8'),
+}
+
+
+class ExportView(APIView):
+    """
+    Every animal or plant, with photos (and threats/actions for fauna), as
+    NDJSON or CSV. Streamed: rows are written while later batches are still
+    being read, so partners replace a full walk of ``?page=N`` with one request.
+    """
+    permission_classes = [AllowAny]
+    
+    @swagger_auto_schema(
+        operation_description="Stream the whole fauna or flora catalog as NDJSON or CSV",
+        responses={200: openapi.Response(description="NDJSON (one species per line) or CSV with a header row")}
+    )
+    def get(self, request, tipo, formato):
+        generador, content_type = FORMATOS[formato]
+        response = StreamingHttpResponse(generador(tipo), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{tipo}.{formato}"'
+        # Let reverse proxies pass chunks through instead of buffering the whole body
+        response['X-Accel-Buffering'] = 'no'
+        return response
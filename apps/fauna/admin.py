@@ -28,6 +28,7 @@ class AnimalAdmin(admin.ModelAdmin):
     list_display = ['nombre_comun', 'nombre_cientifico', 'categoria', 'estado']
     list_filter = ['categoria', 'estado']
     search_fields = ['nombre_comun', 'nombre_cientifico']
+    raw_id_fields = ['foto_principal']
     inlines = [FotoAnimalInline, AnimalAmenazaInline, AnimalAccionProteccionInline]
 
 
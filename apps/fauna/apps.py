@@ -5,3 +5,15 @@ class FaunaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.fauna'
     verbose_name = 'Fauna (Animales)'
+
+    def ready(self):
+        from apps.core import versiones
+        from .models import (
+            Categoria, Animal, FotoAnimal, Amenaza, AccionProteccion,
+            AnimalAmenaza, AnimalAccionProteccion,
+        )
+        versiones.registrar(
+            Categoria, Animal, FotoAnimal, Amenaza, AccionProteccion,
+            AnimalAmenaza, AnimalAccionProteccion,
+        )
+        from . import signals  # noqa: F401
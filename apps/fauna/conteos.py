@@ -0,0 +1,30 @@
+"""Per-category animal counts for nested CategoriaSerializer output"""
+import threading
+
+from django.db.models import Count
+
+from apps.core import versiones
+from .models import Animal
+
+
+_cache = {'firma': None, 'data': {}}
+_lock = threading.Lock()
+
+
+def animales_por_categoria():
+    """
+    ``{id_categoria: animal count}``, one GROUP BY per Animal data version.
+
+    Between writes this is a dict lookup, so nested categories (animal detail)
+    run no COUNT at all.
+    """
+    actual = versiones.firma(Animal)
+    with _lock:
+        if _cache['firma'] == actual:
+            return _cache['data']
+    data = dict(
+        Animal.objects.order_by().values('categoria').annotate(total=Count('pk')).values_list('categoria', 'total')
+    )
+    with _lock:
+        _cache.update(firma=actual, data=data)
+    return data
@@ -1,6 +1,9 @@
 """Fauna filters"""
 from django_filters import rest_framework as filters
 from django.db import models
+from apps.busqueda import indice
+from apps.busqueda.filters import buscar_especies
+from apps.core.texto import letra_inicial
 from .models import Animal
 
 
@@ -10,20 +13,28 @@ class AnimalFilter(filters.FilterSet):
     categoria = filters.CharFilter(field_name='categoria__nombre', lookup_expr='iexact')
     estado = filters.ChoiceFilter(choices=Animal.ESTADO_CHOICES)
     letra = filters.CharFilter(method='letra_filter', label='Filtro alfabético')
+    fuzzy = filters.BooleanFilter(method='fuzzy_filter', label='Tolerar errores en el nombre científico (con q)')
     
     class Meta:
         model = Animal
-        fields = ['q', 'categoria', 'estado', 'letra']
+        fields = ['q', 'categoria', 'estado', 'letra', 'fuzzy']
     
     def search_filter(self, queryset, name, value):
-        """Search by common name or scientific name"""
+        """Ranked full-text search; LIKE over the names while the index is unavailable"""
+        ids = buscar_especies('fauna', value, difuso=self.form.cleaned_data.get('fuzzy'))
+        if ids is not None:
+            return indice.filtrar(queryset, ids)
         return queryset.filter(
             models.Q(nombre_comun__icontains=value) |
             models.Q(nombre_cientifico__icontains=value)
         )
     
+    def fuzzy_filter(self, queryset, name, value):
+        """Read by search_filter; nothing to filter on its own"""
+        return queryset
+    
     def letra_filter(self, queryset, name, value):
-        """Filter by first letter of common name"""
+        """Filter by first letter of common name, ignoring accents (Á matches A)"""
         if value:
-            return queryset.filter(nombre_comun__istartswith=value[0])
+            return queryset.filter(letra_inicial=letra_inicial(value[0]))
         return queryset
@@ -0,0 +1,20 @@
+"""Recompute the precomputed related-species table (AnimalRelacionado)"""
+from django.core.management.base import BaseCommand
+
+from apps.fauna import similitud
+
+
+class Command(BaseCommand):
+    help = 'Recalcula las especies relacionadas de todos los animales (o de --ids)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ids',
+            type=int,
+            nargs='+',
+            help='Solo estos animales y los que se vean afectados por ellos'
+        )
+
+    def handle(self, *args, **options):
+        total = similitud.recalcular(options['ids'])
+        self.stdout.write(self.style.SUCCESS(f'Especies relacionadas recalculadas: {total} animales.'))
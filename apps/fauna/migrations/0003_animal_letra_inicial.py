@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:34
+
+from django.db import migrations, models
+
+from apps.core.texto import letra_inicial
+
+
+def asignar_letras(apps, schema_editor):
+    Animal = apps.get_model('fauna', 'Animal')
+    filas = list(Animal.objects.only('pk', 'nombre_comun'))
+    for fila in filas:
+        fila.letra_inicial = letra_inicial(fila.nombre_comun)
+    Animal.objects.bulk_update(filas, ['letra_inicial'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fauna', '0002_animal_foto_principal'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='animal',
+            name='letra_inicial',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=1),
+        ),
+        migrations.RunPython(asignar_letras, migrations.RunPython.noop),
+    ]
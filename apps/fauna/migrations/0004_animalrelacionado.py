@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fauna', '0003_animal_letra_inicial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnimalRelacionado',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('puntaje', models.FloatField()),
+                ('animal', models.ForeignKey(db_column='id_animal', on_delete=django.db.models.deletion.CASCADE, related_name='similares', to='fauna.animal')),
+                ('relacionado', models.ForeignKey(db_column='id_relacionado', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='fauna.animal')),
+            ],
+            options={
+                'verbose_name': 'Animal relacionado',
+                'verbose_name_plural': 'Animales relacionados',
+                'db_table': 'AnimalRelacionado',
+                'indexes': [models.Index(fields=['animal', '-puntaje'], name='animalrelacionado_puntaje')],
+                'unique_together': {('animal', 'relacionado')},
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fauna', '0004_animalrelacionado'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='animal',
+            index=models.Index(fields=['nombre_comun', 'id_animal'], name='animal_nombre_comun_pk'),
+        ),
+        migrations.AddIndex(
+            model_name='animal',
+            index=models.Index(fields=['nombre_cientifico', 'id_animal'], name='animal_nombre_cient_pk'),
+        ),
+        migrations.AddIndex(
+            model_name='animal',
+            index=models.Index(fields=['estado', 'id_animal'], name='animal_estado_pk'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 """Fauna models - Alineados con schema.sql"""
 from django.db import models
 
+from apps.core.texto import letra_inicial
+
 
 class Categoria(models.Model):
     """Modelo para categorías de animales"""
@@ -67,11 +69,28 @@ class Animal(models.Model):
         through='AnimalAccionProteccion',
         related_name='animales'
     )
+    # Foto mostrada en listados; se mantiene sincronizada desde signals.py
+    foto_principal = models.ForeignKey(
+        'FotoAnimal',
+        on_delete=models.SET_NULL,
+        db_column='id_foto_principal',
+        related_name='+',
+        blank=True,
+        null=True
+    )
+    # Inicial de nombre_comun sin acentos (A-Z, '#'), para ?letra= y el índice alfabético
+    letra_inicial = models.CharField(max_length=1, blank=True, default='', editable=False, db_index=True)
 
     class Meta:
         db_table = 'Animal'
         verbose_name = 'Animal'
         verbose_name_plural = 'Animales'
+        # (orden, pk) para la paginación por cursor de cada ?ordering=
+        indexes = [
+            models.Index(fields=['nombre_comun', 'id_animal'], name='animal_nombre_comun_pk'),
+            models.Index(fields=['nombre_cientifico', 'id_animal'], name='animal_nombre_cient_pk'),
+            models.Index(fields=['estado', 'id_animal'], name='animal_estado_pk'),
+        ]
 
     def __str__(self):
         return f"{self.nombre_comun} ({self.nombre_cientifico})"
@@ -81,6 +100,13 @@ class Animal(models.Model):
         """Alias para compatibilidad con serializers"""
         return self.id_animal
     
+    def save(self, *args, **kwargs):
+        self.letra_inicial = letra_inicial(self.nombre_comun)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'nombre_comun' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'letra_inicial'}
+        super().save(*args, **kwargs)
+    
     def get_estado_display(self):
         """Retorna el estado tal cual (ya es legible)"""
         return self.estado or ''
@@ -190,3 +216,29 @@ class AnimalAccionProteccion(models.Model):
         unique_together = ('animal', 'accion')
         verbose_name = 'Animal-Acción de Protección'
         verbose_name_plural = 'Animal-Acciones de Protección'
+
+
+class AnimalRelacionado(models.Model):
+    """Especies similares precalculadas (ver similitud.py); se mantiene desde signals.py"""
+    animal = models.ForeignKey(
+        Animal,
+        on_delete=models.CASCADE,
+        db_column='id_animal',
+        related_name='similares'
+    )
+    relacionado = models.ForeignKey(
+        Animal,
+        on_delete=models.CASCADE,
+        db_column='id_relacionado',
+        related_name='+'
+    )
+    puntaje = models.FloatField()
+
+    class Meta:
+        db_table = 'AnimalRelacionado'
+        unique_together = ('animal', 'relacionado')
+        indexes = [
+            models.Index(fields=['animal', '-puntaje'], name='animalrelacionado_puntaje'),
+        ]
+        verbose_name = 'Animal relacionado'
+        verbose_name_plural = 'Animales relacionados'
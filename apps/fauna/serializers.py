@@ -1,5 +1,8 @@
 """Fauna serializers"""
 from rest_framework import serializers
+from apps.core import derivados
+from apps.core.campos import DynamicFieldsMixin
+from .conteos import animales_por_categoria
 from .models import Categoria, Animal, FotoAnimal, Amenaza, AccionProteccion
 
 
@@ -12,14 +15,23 @@ class CategoriaSerializer(serializers.ModelSerializer):
         fields = ['id', 'nombre', 'descripcion', 'cantidad_animales']
     
     def get_cantidad_animales(self, obj):
-        return obj.animales.count()
+        # Annotated by CategoriaViewSet; nested categories read the versioned cache
+        total = getattr(obj, 'total_animales', None)
+        if total is None:
+            total = animales_por_categoria().get(obj.pk, 0)
+        return total
 
 
 class FotoAnimalSerializer(serializers.ModelSerializer):
     """Serializer for animal photos"""
+    srcset = serializers.SerializerMethodField()
+    
     class Meta:
         model = FotoAnimal
-        fields = ['id', 'url_foto', 'descripcion']
+        fields = ['id', 'url_foto', 'srcset', 'descripcion']
+    
+    def get_srcset(self, obj):
+        return derivados.srcset(obj.url_foto)
 
 
 class AmenazaSerializer(serializers.ModelSerializer):
@@ -56,8 +68,7 @@ class AnimalListSerializer(serializers.ModelSerializer):
         ]
     
     def get_foto_principal(self, obj):
-        foto = obj.fotos.first()
-        return foto.url_foto if foto else None
+        return obj.foto_principal.url_foto if obj.foto_principal_id else None
 
 
 class AnimalMinimalSerializer(serializers.ModelSerializer):
@@ -69,8 +80,7 @@ class AnimalMinimalSerializer(serializers.ModelSerializer):
         fields = ['id', 'nombre_comun', 'foto_principal']
     
     def get_foto_principal(self, obj):
-        foto = obj.fotos.first()
-        return foto.url_foto if foto else None
+        return obj.foto_principal.url_foto if obj.foto_principal_id else None
 
 
 class AnimalDetailSerializer(serializers.ModelSerializer):
@@ -100,8 +110,8 @@ class AnimalDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class AnimalDynamicSerializer(serializers.ModelSerializer):
-    """Dynamic serializer that accepts fields parameter"""
+class AnimalDynamicSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Every animal field; trimmed with ``fields``/``exclude`` for sparse fieldsets"""
     categoria_nombre = serializers.CharField(source='categoria.nombre', read_only=True)
     foto_principal = serializers.SerializerMethodField()
     estado_display = serializers.CharField(source='get_estado_display', read_only=True)
@@ -111,19 +121,23 @@ class AnimalDynamicSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Animal
-        fields = '__all__'
-    
-    def __init__(self, *args, **kwargs):
-        # Get fields from context
-        fields = kwargs.pop('fields', None)
-        super().__init__(*args, **kwargs)
-        
-        if fields is not None:
-            allowed = set(fields.split(','))
-            existing = set(self.fields)
-            for field_name in existing - allowed:
-                self.fields.pop(field_name)
+        fields = [
+            'id',
+            'nombre_comun',
+            'nombre_cientifico',
+            'descripcion',
+            'habitat',
+            'distribucion',
+            'importancia_ecologica',
+            'estado',
+            'estado_display',
+            'categoria',
+            'categoria_nombre',
+            'foto_principal',
+            'fotos',
+            'amenazas',
+            'acciones_proteccion'
+        ]
     
     def get_foto_principal(self, obj):
-        foto = obj.fotos.first()
-        return foto.url_foto if foto else None
+        return obj.foto_principal.url_foto if obj.foto_principal_id else None
@@ -0,0 +1,158 @@
+"""Fauna signal handlers"""
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.core import versiones
+from .models import Animal, AnimalAccionProteccion, AnimalAmenaza, AnimalRelacionado, FotoAnimal
+from . import similitud
+
+
+def asignar_foto_principal(animal_ids=None):
+    """
+    Point animals without a principal photo at their lowest-id photo.
+
+    With no ids, every row is checked (used after raw SQL seeding).
+    Returns the number of rows updated.
+    """
+    queryset = Animal.objects.filter(foto_principal__isnull=True)
+    if animal_ids is not None:
+        queryset = queryset.filter(pk__in=animal_ids)
+    actualizadas = queryset.update(
+        foto_principal=Subquery(
+            FotoAnimal.objects.filter(animal=OuterRef('pk')).order_by('id_foto').values('id_foto')[:1]
+        )
+    )
+    if actualizadas:
+        # update() sends no post_save
+        versiones.incrementar(Animal)
+    return actualizadas
+
+
+@receiver(pre_save, sender=FotoAnimal)
+def foto_animal_por_guardar(sender, instance, raw=False, **kwargs):
+    # Remember the stored owner so post_save can tell a reassignment apart
+    instance._animal_anterior = None
+    if not raw and instance.pk is not None:
+        instance._animal_anterior = (
+            FotoAnimal.objects.filter(pk=instance.pk).values_list('animal_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=FotoAnimal)
+def foto_animal_guardada(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        asignar_foto_principal([instance.animal_id])
+        return
+    anterior = getattr(instance, '_animal_anterior', None)
+    if anterior is not None and anterior != instance.animal_id:
+        # The photo moved to another animal: the old one must not keep it as principal
+        Animal.objects.filter(pk=anterior, foto_principal=instance.pk).update(foto_principal=None)
+        asignar_foto_principal([anterior, instance.animal_id])
+
+
+@receiver(post_delete, sender=FotoAnimal)
+def foto_animal_eliminada(sender, instance, **kwargs):
+    # on_delete=SET_NULL already cleared the FK if this was the principal photo
+    asignar_foto_principal([instance.animal_id])
+
+
+class RecalculoPendiente:
+    """Animals touched by one transaction, recomputed in a single pass when it commits"""
+
+    def __init__(self):
+        self.propagar = set()
+        self.solos = set()
+        self.todos = False
+
+    def agregar(self, ids, propagar):
+        if ids is None:
+            self.todos = True
+        else:
+            (self.propagar if propagar else self.solos).update(ids)
+
+    def __call__(self):
+        if self.todos:
+            similitud.recalcular(None)
+            return
+        if self.propagar:
+            similitud.recalcular(self.propagar)
+        if self.solos - self.propagar:
+            similitud.recalcular(self.solos - self.propagar, propagar=False)
+
+
+def recalcular_relacionados(ids, propagar=True):
+    """
+    Refresh the related-species table once the surrounding transaction commits.
+
+    Every call in one transaction lands in the same pending set, so a bulk
+    edit costs one recompute instead of one per saved row. The set is tied
+    to its on_commit callback: after a rollback the callback is gone and the
+    next call starts a new one.
+    """
+    conexion = transaction.get_connection()
+    pendiente = getattr(conexion, '_relacionados_pendiente', None)
+    if pendiente is not None and any(func is pendiente for _, func, _ in conexion.run_on_commit):
+        pendiente.agregar(ids, propagar)
+        return
+    pendiente = conexion._relacionados_pendiente = RecalculoPendiente()
+    # Filled before registering: outside a transaction on_commit runs right away
+    pendiente.agregar(ids, propagar)
+    transaction.on_commit(pendiente)
+
+
+@receiver(pre_save, sender=Animal)
+def animal_por_guardar(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Remember the stored profile fields so post_save can skip edits that do not touch them
+    instance._perfil_anterior = None
+    if raw or (update_fields is not None and not {'categoria', 'estado'} & set(update_fields)):
+        return
+    if instance.pk is not None:
+        instance._perfil_anterior = (
+            Animal.objects.filter(pk=instance.pk).values_list('categoria_id', 'estado').first()
+        )
+
+
+@receiver(post_save, sender=Animal)
+def animal_guardado(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # Only categoria and estado feed the similarity (threats/actions are handled below)
+    if raw or (update_fields is not None and not {'categoria', 'estado'} & set(update_fields)):
+        return
+    if not created and getattr(instance, '_perfil_anterior', None) == (instance.categoria_id, instance.estado):
+        return
+    recalcular_relacionados([instance.pk])
+
+
+@receiver(pre_delete, sender=Animal)
+def animal_por_eliminar(sender, instance, **kwargs):
+    # Read before the cascade removes the rows: these animals lose a neighbour
+    ids = list(AnimalRelacionado.objects.filter(relacionado=instance).values_list('animal_id', flat=True))
+    if ids:
+        recalcular_relacionados(ids, propagar=False)
+
+
+@receiver(post_save, sender=AnimalAmenaza)
+@receiver(post_delete, sender=AnimalAmenaza)
+@receiver(post_save, sender=AnimalAccionProteccion)
+@receiver(post_delete, sender=AnimalAccionProteccion)
+def relacion_de_animal_cambiada(sender, instance, raw=False, **kwargs):
+    if not raw:
+        recalcular_relacionados([instance.animal_id])
+
+
+@receiver(m2m_changed, sender=AnimalAmenaza)
+@receiver(m2m_changed, sender=AnimalAccionProteccion)
+def relaciones_m2m_cambiadas(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        ids = [instance.pk]
+    elif pk_set:
+        ids = list(pk_set)
+    else:
+        # post_clear from the Amenaza/AccionProteccion side: recompute everything
+        ids = None
+    recalcular_relacionados(ids)
@@ -0,0 +1,173 @@
+"""
+Related species for the animal detail page.
+
+Each animal is reduced to a profile: categoria, estado rank and two bitsets
+(Python ints with bit ``id`` set per Amenaza / AccionProteccion), so Jaccard
+similarity is two ``&``/``|`` and a ``bit_count()``. The best
+FAUNA_RELACIONADOS_MAX neighbours of every animal are stored in
+AnimalRelacionado and read with one indexed query.
+
+After a write only the changed animals and the animals whose stored
+neighbours they enter or leave are recomputed, and of those only the ones
+whose neighbour list differs from the stored one are rewritten.
+"""
+import heapq
+import math
+from collections import defaultdict, namedtuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min
+
+from apps.core import versiones
+
+from .models import Animal, AnimalAccionProteccion, AnimalAmenaza, AnimalRelacionado
+
+
+PESOS = {
+    'categoria': 0.35,
+    'amenazas': 0.30,
+    'acciones': 0.20,
+    'estado': 0.15,
+}
+
+# Least to most threatened, as in Animal.ESTADO_CHOICES
+RANGO_ESTADO = {estado: posicion for posicion, (estado, _) in enumerate(Animal.ESTADO_CHOICES)}
+
+Perfil = namedtuple('Perfil', 'categoria estado amenazas acciones')
+
+
+def perfiles():
+    """``{id_animal: Perfil}`` for every animal, in three queries"""
+    resultado = {}
+    for pk, categoria, estado in Animal.objects.values_list('pk', 'categoria_id', 'estado').iterator(chunk_size=2000):
+        resultado[pk] = [categoria, RANGO_ESTADO.get(estado), 0, 0]
+    for animal_id, amenaza_id in AnimalAmenaza.objects.values_list('animal_id', 'amenaza_id').iterator(chunk_size=2000):
+        if animal_id in resultado:
+            resultado[animal_id][2] |= 1 << amenaza_id
+    for animal_id, accion_id in AnimalAccionProteccion.objects.values_list('animal_id', 'accion_id').iterator(chunk_size=2000):
+        if animal_id in resultado:
+            resultado[animal_id][3] |= 1 << accion_id
+    return {pk: Perfil(*valores) for pk, valores in resultado.items()}
+
+
+def jaccard(a, b):
+    union = (a | b).bit_count()
+    return (a & b).bit_count() / union if union else 0.0
+
+
+def puntaje(a, b):
+    """Weighted similarity between two profiles, in [0, 1]"""
+    total = PESOS['categoria'] * (a.categoria == b.categoria)
+    total += PESOS['amenazas'] * jaccard(a.amenazas, b.amenazas)
+    total += PESOS['acciones'] * jaccard(a.acciones, b.acciones)
+    if a.estado is not None and b.estado is not None:
+        total += PESOS['estado'] * (1 - abs(a.estado - b.estado) / (len(RANGO_ESTADO) - 1))
+    return total
+
+
+def vecinos(pk, todos, limite):
+    """``[(puntaje, id)]`` of the ``limite`` animals most similar to ``pk``; ties go to the lower id"""
+    perfil = todos[pk]
+    candidatos = (
+        (puntaje(perfil, otro), -otro_pk)
+        for otro_pk, otro in todos.items()
+        if otro_pk != pk
+    )
+    return [(valor, -negativo) for valor, negativo in heapq.nlargest(limite, candidatos) if valor > 0]
+
+
+def afectados(ids, todos, limite):
+    """
+    Animals outside ``ids`` whose stored neighbours may change because
+    ``ids`` changed: those listing one of them now, and those the new
+    profiles would enter (list not full, or better than its worst entry).
+    """
+    ids = set(ids)
+    resultado = set(
+        AnimalRelacionado.objects.filter(relacionado__in=ids).values_list('animal_id', flat=True)
+    )
+    guardados = {
+        fila['animal']: (fila['total'], fila['minimo'])
+        for fila in AnimalRelacionado.objects.order_by().values('animal').annotate(
+            total=Count('pk'), minimo=Min('puntaje')
+        )
+    }
+    cambiados = [todos[pk] for pk in ids if pk in todos]
+    for pk, perfil in todos.items():
+        if pk in ids or pk in resultado:
+            continue
+        total, minimo = guardados.get(pk, (0, 0.0))
+        for otro in cambiados:
+            valor = puntaje(perfil, otro)
+            if valor > 0 and (total < limite or valor >= minimo):
+                resultado.add(pk)
+                break
+    return resultado - ids
+
+
+def almacenados(objetivos):
+    """``{id_animal: {relacionado_id: puntaje}}`` as currently stored for ``objetivos`` (None: all)"""
+    resultado = defaultdict(dict)
+    queryset = AnimalRelacionado.objects.values_list('animal_id', 'relacionado_id', 'puntaje')
+    if objetivos is None:
+        partes = [queryset]
+    else:
+        # Chunked: SQL Server caps a statement at ~2100 parameters
+        pendientes = list(objetivos)
+        partes = (
+            queryset.filter(animal_id__in=pendientes[inicio:inicio + 1000])
+            for inicio in range(0, len(pendientes), 1000)
+        )
+    for parte in partes:
+        for animal_id, relacionado_id, valor in parte.iterator(chunk_size=2000):
+            resultado[animal_id][relacionado_id] = valor
+    return resultado
+
+
+def iguales(antes, despues):
+    return antes.keys() == despues.keys() and all(
+        math.isclose(antes[pk], despues[pk], abs_tol=1e-9) for pk in despues
+    )
+
+
+def recalcular(ids=None, propagar=True):
+    """
+    Recompute the neighbours of ``ids`` (every animal when None) and,
+    when ``propagar`` (their profiles changed), of the animals they affect.
+    Only animals whose neighbour list actually changed are rewritten.
+    Returns the number of animals recomputed.
+    """
+    limite = settings.FAUNA_RELACIONADOS_MAX
+    todos = perfiles()
+    if ids is not None and 2 * len(set(ids)) >= len(todos):
+        # Most animals changed: a full pass is cheaper than working out who is affected
+        ids = None
+    if ids is None:
+        objetivos = set(todos)
+    elif propagar:
+        objetivos = afectados(ids, todos, limite) | set(ids)
+    else:
+        objetivos = set(ids)
+
+    nuevos = {
+        pk: {otro_pk: valor for valor, otro_pk in vecinos(pk, todos, limite)}
+        for pk in objetivos if pk in todos
+    }
+    actuales = almacenados(None if ids is None else objetivos)
+    cambiados = [pk for pk, relacionados in nuevos.items() if not iguales(actuales.get(pk, {}), relacionados)]
+    if not cambiados:
+        return len(objetivos)
+
+    filas = [
+        AnimalRelacionado(animal_id=pk, relacionado_id=otro_pk, puntaje=valor)
+        for pk in cambiados
+        for otro_pk, valor in nuevos[pk].items()
+    ]
+    with transaction.atomic():
+        # Chunked: SQL Server caps a statement at ~2100 parameters
+        for inicio in range(0, len(cambiados), 1000):
+            AnimalRelacionado.objects.filter(animal_id__in=cambiados[inicio:inicio + 1000]).delete()
+        AnimalRelacionado.objects.bulk_create(filas, batch_size=500)
+        versiones.incrementar(AnimalRelacionado)
+    return len(objetivos)
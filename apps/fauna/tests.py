@@ -0,0 +1,261 @@
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.db.models import F
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.core import versiones
+from apps.core.pagination import OptionalCursorPagination
+
+from . import similitud
+from .models import AccionProteccion, Amenaza, Animal, AnimalRelacionado, Categoria, FotoAnimal
+
+
+class AnimalListTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        categorias = [Categoria.objects.create(nombre=nombre) for nombre in ('Aves', 'Mamíferos', 'Reptiles')]
+        amenazas = [Amenaza.objects.create(nombre=f'Amenaza {i}') for i in range(3)]
+        acciones = [AccionProteccion.objects.create(titulo=f'Acción {i}', descripcion='-') for i in range(3)]
+        for i in range(30):
+            animal = Animal.objects.create(
+                nombre_comun=f'Animal {i:02d}',
+                nombre_cientifico=f'Genus species{i}',
+                categoria=categorias[i % 3],
+                estado=Animal.ESTADO_CHOICES[i % len(Animal.ESTADO_CHOICES)][0],
+            )
+            for j in range(3):
+                FotoAnimal.objects.create(animal=animal, url_foto=f'https://example.org/a{i}_{j}.jpg')
+            animal.amenazas.add(amenazas[i % 3])
+            animal.acciones_proteccion.add(acciones[i % 3])
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_consultas_no_dependen_del_tamano_de_pagina(self):
+        # Data versions, COUNT and the page itself: no per-row queries
+        for page_size in (5, 25):
+            with self.subTest(page_size=page_size):
+                # Start cold so the request reaches the database
+                caches['respuestas'].clear()
+                versiones._invalidar()
+                with mock.patch.object(OptionalCursorPagination, 'page_size', page_size):
+                    with self.assertNumQueries(3):
+                        response = self.client.get('/api/fauna/fauna/')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.data['results']), page_size)
+                self.assertTrue(all(fila['foto_principal'] for fila in response.data['results']))
+
+    def test_campos_desconocidos_devuelven_400(self):
+        response = self.client.get('/api/fauna/fauna/?fields=id,bogus')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('bogus', response.data['fields'])
+
+        response = self.client.get('/api/fauna/fauna/?fields=id,nombre_comun')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data['results'][0]), {'id', 'nombre_comun'})
+
+
+class FotoPrincipalTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        categoria = Categoria.objects.create(nombre='Aves')
+        cls.origen = Animal.objects.create(nombre_comun='Origen', nombre_cientifico='A a', categoria=categoria)
+        cls.destino = Animal.objects.create(nombre_comun='Destino', nombre_cientifico='B b', categoria=categoria)
+
+    def test_primera_foto_es_principal(self):
+        foto = FotoAnimal.objects.create(animal=self.origen, url_foto='https://example.org/1.jpg')
+        FotoAnimal.objects.create(animal=self.origen, url_foto='https://example.org/2.jpg')
+        self.origen.refresh_from_db()
+        self.assertEqual(self.origen.foto_principal_id, foto.pk)
+
+    def test_reasignar_foto_recalcula_ambos_animales(self):
+        movida = FotoAnimal.objects.create(animal=self.origen, url_foto='https://example.org/1.jpg')
+        restante = FotoAnimal.objects.create(animal=self.origen, url_foto='https://example.org/2.jpg')
+
+        movida.animal = self.destino
+        movida.save()
+
+        self.origen.refresh_from_db()
+        self.destino.refresh_from_db()
+        self.assertEqual(self.origen.foto_principal_id, restante.pk)
+        self.assertEqual(self.destino.foto_principal_id, movida.pk)
+
+    def test_reasignar_ultima_foto_deja_al_animal_sin_principal(self):
+        foto = FotoAnimal.objects.create(animal=self.origen, url_foto='https://example.org/1.jpg')
+        foto.animal = self.destino
+        foto.save()
+
+        self.origen.refresh_from_db()
+        self.assertIsNone(self.origen.foto_principal_id)
+
+
+class CursorPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        categoria = Categoria.objects.create(nombre='Aves')
+        estados = [estado for estado, _ in Animal.ESTADO_CHOICES] + [None, None, None]
+        for i in range(16):
+            Animal.objects.create(
+                nombre_comun=f'Animal {i % 5}',
+                nombre_cientifico=f'Genus species{i}',
+                categoria=categoria,
+                estado=estados[i % len(estados)],
+            )
+
+    def recorrer(self, ordering):
+        vistos = []
+        url = f'/api/fauna/fauna/?cursor=&ordering={ordering}'
+        with mock.patch.object(OptionalCursorPagination, 'page_size', 3):
+            while url:
+                caches['respuestas'].clear()
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn('count', response.data)
+                vistos.extend(fila['id'] for fila in response.data['results'])
+                url = response.data['next']
+        return vistos
+
+    def test_recorrido_completo_sin_repetir(self):
+        # NULL estado sorts as the smallest value, with pk breaking ties
+        esperados = {
+            'estado': Animal.objects.order_by(F('estado').asc(nulls_first=True), 'pk'),
+            '-estado': Animal.objects.order_by(F('estado').desc(nulls_last=True), '-pk'),
+            'nombre_comun': Animal.objects.order_by('nombre_comun', 'pk'),
+            '-id': Animal.objects.order_by('-pk'),
+        }
+        for ordering, queryset in esperados.items():
+            with self.subTest(ordering=ordering):
+                self.assertEqual(self.recorrer(ordering), list(queryset.values_list('pk', flat=True)))
+
+    def test_cursor_de_otro_orden_es_invalido(self):
+        with mock.patch.object(OptionalCursorPagination, 'page_size', 3):
+            siguiente = self.client.get('/api/fauna/fauna/?cursor=&ordering=estado').data['next']
+        response = self.client.get(siguiente.replace('ordering=estado', 'ordering=nombre_comun'))
+        self.assertEqual(response.status_code, 404)
+
+
+class CursorIndexTests(TestCase):
+
+    def test_indices_creados_por_migracion(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Animal._meta.db_table)
+        for index in Animal._meta.indexes:
+            with self.subTest(index=index.name):
+                self.assertIn(index.name, constraints)
+                self.assertEqual(constraints[index.name]['columns'], [
+                    Animal._meta.get_field(nombre).column for nombre in index.fields
+                ])
+
+    def test_schema_sql_no_duplica_indices_de_migraciones(self):
+        # init-db.py runs schema.sql and then migrate --fake-initial, which only fakes
+        # 0001: an index also created by schema.sql would make its AddIndex fail
+        schema = (Path(settings.BASE_DIR) / 'db' / 'schema.sql').read_text(encoding='utf-8')
+        for index in Animal._meta.indexes:
+            with self.subTest(index=index.name):
+                self.assertNotIn(index.name, schema)
+
+
+class RelacionadosTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        aves = Categoria.objects.create(nombre='Aves')
+        mamiferos = Categoria.objects.create(nombre='Mamíferos')
+        cls.amenazas = [Amenaza.objects.create(nombre=f'Amenaza {n}') for n in range(4)]
+        estados = [estado for estado, _ in Animal.ESTADO_CHOICES]
+        cls.animales = [
+            Animal.objects.create(
+                nombre_comun=f'Especie {n}',
+                nombre_cientifico=f'Species {n}',
+                categoria=aves if n % 2 else mamiferos,
+                estado=estados[n % len(estados)],
+            )
+            for n in range(12)
+        ]
+        for n, animal in enumerate(cls.animales):
+            animal.amenazas.add(*cls.amenazas[:n % 4 + 1])
+
+    def setUp(self):
+        # on_commit never fires inside TestCase: seed the table by hand, and drop
+        # the pending set setUpTestData left registered on the class transaction
+        similitud.recalcular()
+        connection._relacionados_pendiente = None
+
+    def almacenado(self):
+        return {
+            (animal_id, relacionado_id): round(valor, 9)
+            for animal_id, relacionado_id, valor in AnimalRelacionado.objects.values_list(
+                'animal_id', 'relacionado_id', 'puntaje'
+            )
+        }
+
+    def test_recalculo_incremental_igual_al_completo(self):
+        animal = self.animales[3]
+        with self.captureOnCommitCallbacks(execute=True):
+            animal.estado = Animal.ESTADO_CHOICES[0][0]
+            animal.save()
+            animal.amenazas.remove(self.amenazas[0])
+        incremental = self.almacenado()
+
+        AnimalRelacionado.objects.all().delete()
+        similitud.recalcular()
+        self.assertEqual(incremental, self.almacenado())
+
+    def test_un_recalculo_por_transaccion(self):
+        with mock.patch.object(similitud, 'recalcular', wraps=similitud.recalcular) as recalcular:
+            with self.captureOnCommitCallbacks(execute=True):
+                for animal in self.animales[:6]:
+                    animal.estado = Animal.ESTADO_CHOICES[-1][0]
+                    animal.save()
+                    animal.amenazas.add(self.amenazas[3])
+        recalcular.assert_called_once()
+        self.assertEqual(set(recalcular.call_args.args[0]), {animal.pk for animal in self.animales[:6]})
+
+    def test_savepoint_revertido_no_pierde_cambios_posteriores(self):
+        with mock.patch.object(similitud, 'recalcular') as recalcular:
+            with self.captureOnCommitCallbacks(execute=True):
+                try:
+                    with transaction.atomic():
+                        self.animales[0].amenazas.add(self.amenazas[3])
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                self.animales[1].amenazas.add(self.amenazas[3])
+        recalcular.assert_called_once()
+        self.assertEqual(set(recalcular.call_args.args[0]), {self.animales[1].pk})
+
+    def test_cambio_sin_efecto_en_el_perfil_no_recalcula(self):
+        animal = self.animales[0]
+        with mock.patch.object(similitud, 'recalcular') as recalcular:
+            with self.captureOnCommitCallbacks(execute=True):
+                animal.nombre_comun = 'Otro nombre'
+                animal.save()
+        recalcular.assert_not_called()
+
+    @override_settings(FAUNA_RELACIONADOS_MAX=2)
+    def test_solo_se_reescriben_las_filas_cambiadas(self):
+        similitud.recalcular()
+        antes = dict(AnimalRelacionado.objects.values_list('pk', 'animal_id'))
+        animal = self.animales[5]
+        with self.captureOnCommitCallbacks(execute=True):
+            animal.amenazas.add(self.amenazas[3])
+        despues = dict(AnimalRelacionado.objects.values_list('pk', 'animal_id'))
+
+        reescritos = {animal_id for pk, animal_id in antes.items() if pk not in despues}
+        self.assertIn(animal.pk, reescritos)
+        self.assertLess(len(reescritos), len(self.animales))
+
+        # A no-op recompute writes nothing and keeps the cached responses valid
+        version = versiones.obtener(AnimalRelacionado)
+        similitud.recalcular()
+        self.assertEqual(dict(AnimalRelacionado.objects.values_list('pk', 'animal_id')), despues)
+        versiones._invalidar()
+        self.assertEqual(versiones.obtener(AnimalRelacionado), version)
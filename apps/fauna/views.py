@@ -1,55 +1,99 @@
 """Fauna views"""
+from django.db.models import Count
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import OrderingFilter
 
-from .models import Categoria, Animal, FotoAnimal, Amenaza, AccionProteccion
+from .models import (
+    Categoria, Animal, AnimalRelacionado, FotoAnimal, Amenaza, AccionProteccion,
+    AnimalAmenaza, AnimalAccionProteccion,
+)
 from .serializers import (
     CategoriaSerializer,
     AnimalListSerializer,
     AnimalMinimalSerializer,
     AnimalDetailSerializer,
+    AnimalDynamicSerializer,
     FotoAnimalSerializer,
     AmenazaSerializer,
     AccionProteccionSerializer
 )
 from .filters import AnimalFilter
+from apps.busqueda.filters import SearchRankOrderingFilter
+from apps.core import letras as indice_letras
+from apps.core.campos import SparseFieldsetMixin
+from apps.core.facetas import FacetMixin
+from apps.core.lotes import BatchRetrieveMixin
+from apps.core.pagination import OptionalCursorPagination
+from apps.core.respuestas import CachedResponseMixin
 
 
-class CategoriaViewSet(viewsets.ReadOnlyModelViewSet):
+class CategoriaViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for animal categories"""
-    queryset = Categoria.objects.all()
+    queryset = Categoria.objects.annotate(total_animales=Count('animales')).order_by('id_categoria')
     serializer_class = CategoriaSerializer
     permission_classes = [AllowAny]
+    version_models = (Categoria, Animal)
     
 
-class AnimalViewSet(viewsets.ReadOnlyModelViewSet):
-    """ViewSet for fauna/animals with dynamic field selection"""
-    queryset = Animal.objects.select_related('categoria').prefetch_related('fotos', 'amenazas', 'acciones_proteccion')
+class AnimalViewSet(CachedResponseMixin, BatchRetrieveMixin, FacetMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    """ViewSet for fauna/animals with sparse fieldsets (?fields=, ?exclude=, ?minimal=true), ?facets= and ?ids="""
+    queryset = Animal.objects.all()
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, SearchRankOrderingFilter]
+    pagination_class = OptionalCursorPagination
     filterset_class = AnimalFilter
     ordering_fields = ['nombre_comun', 'nombre_cientifico', 'estado', 'id']
     ordering = ['nombre_comun']
+    sparse_serializer_class = AnimalDynamicSerializer
+    minimal_fields = AnimalMinimalSerializer.Meta.fields
+    # Method fields and the columns they read
+    field_requirements = {
+        'foto_principal': ['foto_principal__url_foto'],
+        'estado_display': ['estado'],
+    }
+    # ?facets= names -> grouped column (values match the list filters)
+    facet_fields = {
+        'categoria': 'categoria__nombre',
+        'estado': 'estado',
+    }
+    facet_models = (Animal, Categoria)
+    # Tables behind every action (ETag / Last-Modified)
+    version_models = (
+        Animal, Categoria, FotoAnimal, Amenaza, AccionProteccion,
+        AnimalAmenaza, AnimalAccionProteccion, AnimalRelacionado,
+    )
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action and query params"""
-        if self.action == 'retrieve':
+        if self.is_sparse():
+            return AnimalDynamicSerializer
+        if self.action == 'retrieve' or self.is_batch():
             return AnimalDetailSerializer
-        
-        # Check for fields parameter for sparse fieldsets
-        fields = self.request.query_params.get('fields')
-        if fields:
-            # Return minimal or list based on requested fields
-            field_list = fields.split(',')
-            if len(field_list) <= 3:
-                return AnimalMinimalSerializer
-        
         return AnimalListSerializer
     
+    def get_queryset(self):
+        """Fetch only what the current action's serializer renders"""
+        queryset = super().get_queryset()
+        
+        # Relation actions only need the animal to exist; the relation is queried on its own
+        if self.action in ('fotos', 'amenazas', 'acciones', 'relacionados'):
+            return queryset.only('id_animal')
+        # Aggregated with values(); no serializer involved
+        if self.action == 'letras':
+            return queryset
+        return self.project_queryset(queryset)
+    
+    @action(detail=False, methods=['get'])
+    def letras(self, request):
+        """Animal count per first letter (A-Z, '#'); accepts the same filters as the list"""
+        if any(param in request.query_params for param in self.filterset_class.base_filters):
+            return Response(indice_letras.contar(self.filter_queryset(self.get_queryset())))
+        return Response(indice_letras.conteos(Animal))
+    
     @action(detail=True, methods=['get'])
     def fotos(self, request, pk=None):
         """Get all photos for an animal"""
@@ -73,17 +117,39 @@ class AnimalViewSet(viewsets.ReadOnlyModelViewSet):
         acciones = animal.acciones_proteccion.all()
         serializer = AccionProteccionSerializer(acciones, many=True)
         return Response(serializer.data)
+    
+    @action(detail=True, methods=['get'])
+    def relacionados(self, request, pk=None):
+        """Most similar animals, precomputed in AnimalRelacionado (see similitud.py)"""
+        try:
+            animal_id = int(pk)
+        except ValueError:
+            raise NotFound()
+        filas = list(
+            AnimalRelacionado.objects.filter(animal_id=animal_id)
+            .select_related('relacionado__foto_principal')
+            .order_by('-puntaje', 'relacionado_id')
+        )
+        if not filas:
+            # No neighbours stored: still 404 for an unknown animal
+            self.get_object()
+        return Response([
+            {**AnimalMinimalSerializer(fila.relacionado).data, 'similitud': round(fila.puntaje, 3)}
+            for fila in filas
+        ])
 
 
-class AmenazaViewSet(viewsets.ReadOnlyModelViewSet):
+class AmenazaViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for threats"""
     queryset = Amenaza.objects.all()
     serializer_class = AmenazaSerializer
     permission_classes = [AllowAny]
+    version_models = (Amenaza,)
 
 
-class AccionProteccionViewSet(viewsets.ReadOnlyModelViewSet):
+class AccionProteccionViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for protection actions"""
     queryset = AccionProteccion.objects.all()
     serializer_class = AccionProteccionSerializer
     permission_classes = [AllowAny]
+    version_models = (AccionProteccion,)
@@ -34,7 +34,11 @@ class FloraAdmin(admin.ModelAdmin):
         ('Estado de Conservación', {
             'fields': ('estado',)
         }),
+        ('Foto principal', {
+            'fields': ('foto_principal',)
+        }),
     )
+    raw_id_fields = ['foto_principal']
     
     def get_fotos_count(self, obj):
         return obj.fotos.count()
@@ -5,3 +5,9 @@ class FloraConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.flora'
     verbose_name = 'Flora (Plantas)'
+
+    def ready(self):
+        from apps.core import versiones
+        from .models import Flora, FotoFlora
+        versiones.registrar(Flora, FotoFlora)
+        from . import signals  # noqa: F401
@@ -1,6 +1,10 @@
 """Flora filters for advanced querying"""
 import django_filters
+from django_filters.widgets import BooleanWidget
 from django.db import models
+from apps.busqueda import indice
+from apps.busqueda.filters import buscar_especies
+from apps.core.texto import letra_inicial
 from .models import Flora
 
 
@@ -22,20 +26,34 @@ class FloraFilter(django_filters.FilterSet):
         label='Filtrar por letra inicial'
     )
     
+    # Typo tolerance on the scientific name, used together with q
+    fuzzy = django_filters.BooleanFilter(
+        method='fuzzy_filter',
+        widget=BooleanWidget(),
+        label='Tolerar errores en el nombre científico (con q)'
+    )
+    
     class Meta:
         model = Flora
-        fields = ['estado', 'q', 'letra']
+        fields = ['estado', 'q', 'letra', 'fuzzy']
     
     def search_filter(self, queryset, name, value):
-        """Search across common name, scientific name, and description"""
+        """Ranked full-text search; LIKE over names and description while the index is unavailable"""
+        ids = buscar_especies('flora', value, difuso=self.form.cleaned_data.get('fuzzy'))
+        if ids is not None:
+            return indice.filtrar(queryset, ids)
         return queryset.filter(
             models.Q(nombre_comun__icontains=value) |
             models.Q(nombre_cientifico__icontains=value) |
             models.Q(descripcion__icontains=value)
         )
     
+    def fuzzy_filter(self, queryset, name, value):
+        """Read by search_filter; nothing to filter on its own"""
+        return queryset
+    
     def filter_by_letter(self, queryset, name, value):
-        """Filter plants by first letter of common name"""
+        """Filter plants by first letter of common name, ignoring accents (Á matches A)"""
         if value and len(value) == 1:
-            return queryset.filter(nombre_comun__istartswith=value)
+            return queryset.filter(letra_inicial=letra_inicial(value))
         return queryset
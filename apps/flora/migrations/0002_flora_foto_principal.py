@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def asignar_fotos_principales(apps, schema_editor):
+    Flora = apps.get_model('flora', 'Flora')
+    FotoFlora = apps.get_model('flora', 'FotoFlora')
+    Flora.objects.filter(foto_principal__isnull=True).update(
+        foto_principal=Subquery(
+            FotoFlora.objects.filter(planta=OuterRef('pk')).order_by('id_foto').values('id_foto')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('flora', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='flora',
+            name='foto_principal',
+            field=models.ForeignKey(blank=True, db_column='id_foto_principal', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='flora.fotoflora'),
+        ),
+        migrations.RunPython(asignar_fotos_principales, migrations.RunPython.noop),
+    ]
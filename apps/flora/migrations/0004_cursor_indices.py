@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('flora', '0003_flora_letra_inicial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='flora',
+            index=models.Index(fields=['nombre_comun', 'id_planta'], name='flora_nombre_comun_pk'),
+        ),
+        migrations.AddIndex(
+            model_name='flora',
+            index=models.Index(fields=['nombre_cientifico', 'id_planta'], name='flora_nombre_cient_pk'),
+        ),
+        migrations.AddIndex(
+            model_name='flora',
+            index=models.Index(fields=['estado', 'id_planta'], name='flora_estado_pk'),
+        ),
+    ]
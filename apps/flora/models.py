@@ -1,6 +1,8 @@
 """Flora models - Alineados con schema.sql"""
 from django.db import models
 
+from apps.core.texto import letra_inicial
+
 
 class Flora(models.Model):
     """Modelo para plantas"""
@@ -17,11 +19,28 @@ class Flora(models.Model):
     descripcion = models.TextField(blank=True, null=True)
     distribucion = models.TextField(blank=True, null=True)
     estado = models.CharField(max_length=50, choices=ESTADO_CHOICES, blank=True, null=True)
+    # Foto mostrada en listados; se mantiene sincronizada desde signals.py
+    foto_principal = models.ForeignKey(
+        'FotoFlora',
+        on_delete=models.SET_NULL,
+        db_column='id_foto_principal',
+        related_name='+',
+        blank=True,
+        null=True
+    )
+    # Inicial de nombre_comun sin acentos (A-Z, '#'), para ?letra= y el índice alfabético
+    letra_inicial = models.CharField(max_length=1, blank=True, default='', editable=False, db_index=True)
 
     class Meta:
         db_table = 'Flora'
         verbose_name = 'Flora'
         verbose_name_plural = 'Flora'
+        # (orden, pk) para la paginación por cursor de cada ?ordering=
+        indexes = [
+            models.Index(fields=['nombre_comun', 'id_planta'], name='flora_nombre_comun_pk'),
+            models.Index(fields=['nombre_cientifico', 'id_planta'], name='flora_nombre_cient_pk'),
+            models.Index(fields=['estado', 'id_planta'], name='flora_estado_pk'),
+        ]
 
     def __str__(self):
         return f"{self.nombre_comun} ({self.nombre_cientifico})"
@@ -31,6 +50,13 @@ class Flora(models.Model):
         """Alias para compatibilidad con serializers"""
         return self.id_planta
     
+    def save(self, *args, **kwargs):
+        self.letra_inicial = letra_inicial(self.nombre_comun)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'nombre_comun' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'letra_inicial'}
+        super().save(*args, **kwargs)
+    
     def get_estado_display(self):
         """Retorna el estado tal cual (ya es legible)"""
         return self.estado or ''
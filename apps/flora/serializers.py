@@ -1,13 +1,20 @@
 """Flora serializers"""
 from rest_framework import serializers
+from apps.core import derivados
+from apps.core.campos import DynamicFieldsMixin
 from .models import Flora, FotoFlora
 
 
 class FotoFloraSerializer(serializers.ModelSerializer):
     """Serializer for plant photos"""
+    srcset = serializers.SerializerMethodField()
+    
     class Meta:
         model = FotoFlora
-        fields = ['id', 'url_foto', 'descripcion']
+        fields = ['id', 'url_foto', 'srcset', 'descripcion']
+    
+    def get_srcset(self, obj):
+        return derivados.srcset(obj.url_foto)
 
 
 class FloraListSerializer(serializers.ModelSerializer):
@@ -27,8 +34,7 @@ class FloraListSerializer(serializers.ModelSerializer):
         ]
     
     def get_foto_principal(self, obj):
-        foto = obj.fotos.first()
-        return foto.url_foto if foto else None
+        return obj.foto_principal.url_foto if obj.foto_principal_id else None
 
 
 class FloraMinimalSerializer(serializers.ModelSerializer):
@@ -40,8 +46,7 @@ class FloraMinimalSerializer(serializers.ModelSerializer):
         fields = ['id', 'nombre_comun', 'foto_principal']
     
     def get_foto_principal(self, obj):
-        foto = obj.fotos.first()
-        return foto.url_foto if foto else None
+        return obj.foto_principal.url_foto if obj.foto_principal_id else None
 
 
 class FloraDetailSerializer(serializers.ModelSerializer):
@@ -61,3 +66,27 @@ class FloraDetailSerializer(serializers.ModelSerializer):
             'estado_display',
             'fotos'
         ]
+
+
+class FloraDynamicSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Every plant field; trimmed with ``fields``/``exclude`` for sparse fieldsets"""
+    foto_principal = serializers.SerializerMethodField()
+    estado_display = serializers.CharField(source='get_estado_display', read_only=True)
+    fotos = FotoFloraSerializer(many=True, read_only=True)
+    
+    class Meta:
+        model = Flora
+        fields = [
+            'id',
+            'nombre_comun',
+            'nombre_cientifico',
+            'descripcion',
+            'distribucion',
+            'estado',
+            'estado_display',
+            'foto_principal',
+            'fotos'
+        ]
+    
+    def get_foto_principal(self, obj):
+        return obj.foto_principal.url_foto if obj.foto_principal_id else None
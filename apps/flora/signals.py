@@ -0,0 +1,58 @@
+"""Flora signal handlers"""
+from django.db.models import OuterRef, Subquery
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+
+from apps.core import versiones
+from .models import Flora, FotoFlora
+
+
+def asignar_foto_principal(planta_ids=None):
+    """
+    Point plants without a principal photo at their lowest-id photo.
+
+    With no ids, every row is checked (used after raw SQL seeding).
+    Returns the number of rows updated.
+    """
+    queryset = Flora.objects.filter(foto_principal__isnull=True)
+    if planta_ids is not None:
+        queryset = queryset.filter(pk__in=planta_ids)
+    actualizadas = queryset.update(
+        foto_principal=Subquery(
+            FotoFlora.objects.filter(planta=OuterRef('pk')).order_by('id_foto').values('id_foto')[:1]
+        )
+    )
+    if actualizadas:
+        # update() sends no post_save
+        versiones.incrementar(Flora)
+    return actualizadas
+
+
+@receiver(pre_save, sender=FotoFlora)
+def foto_flora_por_guardar(sender, instance, raw=False, **kwargs):
+    # Remember the stored owner so post_save can tell a reassignment apart
+    instance._planta_anterior = None
+    if not raw and instance.pk is not None:
+        instance._planta_anterior = (
+            FotoFlora.objects.filter(pk=instance.pk).values_list('planta_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=FotoFlora)
+def foto_flora_guardada(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        asignar_foto_principal([instance.planta_id])
+        return
+    anterior = getattr(instance, '_planta_anterior', None)
+    if anterior is not None and anterior != instance.planta_id:
+        # The photo moved to another plant: the old one must not keep it as principal
+        Flora.objects.filter(pk=anterior, foto_principal=instance.pk).update(foto_principal=None)
+        asignar_foto_principal([anterior, instance.planta_id])
+
+
+@receiver(post_delete, sender=FotoFlora)
+def foto_flora_eliminada(sender, instance, **kwargs):
+    # on_delete=SET_NULL already cleared the FK if this was the principal photo
+    asignar_foto_principal([instance.planta_id])
@@ -0,0 +1,99 @@
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.core import versiones
+from apps.core.pagination import OptionalCursorPagination
+
+from .models import Flora, FotoFlora
+
+
+class FloraListTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(30):
+            planta = Flora.objects.create(
+                nombre_comun=f'Planta {i:02d}',
+                nombre_cientifico=f'Genus species{i}',
+                estado=Flora.ESTADO_CHOICES[i % len(Flora.ESTADO_CHOICES)][0],
+            )
+            for j in range(3):
+                FotoFlora.objects.create(planta=planta, url_foto=f'https://example.org/f{i}_{j}.jpg')
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_consultas_no_dependen_del_tamano_de_pagina(self):
+        # Data versions, COUNT and the page itself: no per-row queries
+        for page_size in (5, 25):
+            with self.subTest(page_size=page_size):
+                # Start cold so the request reaches the database
+                caches['respuestas'].clear()
+                versiones._invalidar()
+                with mock.patch.object(OptionalCursorPagination, 'page_size', page_size):
+                    with self.assertNumQueries(3):
+                        response = self.client.get('/api/flora/flora/')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.data['results']), page_size)
+                self.assertTrue(all(fila['foto_principal'] for fila in response.data['results']))
+
+
+class FotoPrincipalTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.origen = Flora.objects.create(nombre_comun='Origen', nombre_cientifico='A a')
+        cls.destino = Flora.objects.create(nombre_comun='Destino', nombre_cientifico='B b')
+
+    def test_primera_foto_es_principal(self):
+        foto = FotoFlora.objects.create(planta=self.origen, url_foto='https://example.org/1.jpg')
+        FotoFlora.objects.create(planta=self.origen, url_foto='https://example.org/2.jpg')
+        self.origen.refresh_from_db()
+        self.assertEqual(self.origen.foto_principal_id, foto.pk)
+
+    def test_reasignar_foto_recalcula_ambas_plantas(self):
+        movida = FotoFlora.objects.create(planta=self.origen, url_foto='https://example.org/1.jpg')
+        restante = FotoFlora.objects.create(planta=self.origen, url_foto='https://example.org/2.jpg')
+
+        movida.planta = self.destino
+        movida.save()
+
+        self.origen.refresh_from_db()
+        self.destino.refresh_from_db()
+        self.assertEqual(self.origen.foto_principal_id, restante.pk)
+        self.assertEqual(self.destino.foto_principal_id, movida.pk)
+
+    def test_reasignar_ultima_foto_deja_a_la_planta_sin_principal(self):
+        foto = FotoFlora.objects.create(planta=self.origen, url_foto='https://example.org/1.jpg')
+        foto.planta = self.destino
+        foto.save()
+
+        self.origen.refresh_from_db()
+        self.assertIsNone(self.origen.foto_principal_id)
+
+
+class CursorIndexTests(TestCase):
+
+    def test_indices_creados_por_migracion(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Flora._meta.db_table)
+        for index in Flora._meta.indexes:
+            with self.subTest(index=index.name):
+                self.assertIn(index.name, constraints)
+                self.assertEqual(constraints[index.name]['columns'], [
+                    Flora._meta.get_field(nombre).column for nombre in index.fields
+                ])
+
+    def test_schema_sql_no_duplica_indices_de_migraciones(self):
+        # init-db.py runs schema.sql and then migrate --fake-initial, which only fakes
+        # 0001: an index also created by schema.sql would make its AddIndex fail
+        schema = (Path(settings.BASE_DIR) / 'db' / 'schema.sql').read_text(encoding='utf-8')
+        for index in Flora._meta.indexes:
+            with self.subTest(index=index.name):
+                self.assertNotIn(index.name, schema)
@@ -4,37 +4,76 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import OrderingFilter
 
 from .models import Flora, FotoFlora
 from .serializers import (
     FloraListSerializer,
     FloraDetailSerializer,
+    FloraDynamicSerializer,
     FloraMinimalSerializer,
     FotoFloraSerializer
 )
 from .filters import FloraFilter
+from apps.busqueda.filters import SearchRankOrderingFilter
+from apps.core import letras as indice_letras
+from apps.core.campos import SparseFieldsetMixin
+from apps.core.facetas import FacetMixin
+from apps.core.lotes import BatchRetrieveMixin
+from apps.core.pagination import OptionalCursorPagination
+from apps.core.respuestas import CachedResponseMixin
 
 
-class FloraViewSet(viewsets.ReadOnlyModelViewSet):
-    """ViewSet for Flora (plants) - Read Only"""
-    queryset = Flora.objects.prefetch_related('fotos')
+class FloraViewSet(CachedResponseMixin, BatchRetrieveMixin, FacetMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    """ViewSet for Flora (plants) - Read Only, with sparse fieldsets (?fields=, ?exclude=, ?minimal=true), ?facets= and ?ids="""
+    queryset = Flora.objects.all()
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, SearchRankOrderingFilter]
+    pagination_class = OptionalCursorPagination
     filterset_class = FloraFilter
-    ordering_fields = ['nombre_comun', 'nombre_cientifico', 'estado']
+    ordering_fields = ['nombre_comun', 'nombre_cientifico', 'estado', 'id']
     ordering = ['nombre_comun']
+    sparse_serializer_class = FloraDynamicSerializer
+    minimal_fields = FloraMinimalSerializer.Meta.fields
+    # Method fields and the columns they read
+    field_requirements = {
+        'foto_principal': ['foto_principal__url_foto'],
+        'estado_display': ['estado'],
+    }
+    # ?facets= names -> grouped column (values match the list filters)
+    facet_fields = {
+        'estado': 'estado',
+    }
+    facet_models = (Flora,)
+    # Tables behind every action (ETag / Last-Modified)
+    version_models = (Flora, FotoFlora)
     
     def get_serializer_class(self):
-        """Return appropriate serializer based on action"""
-        if self.action == 'retrieve':
+        """Return appropriate serializer based on action and query params"""
+        if self.is_sparse():
+            return FloraDynamicSerializer
+        if self.action == 'retrieve' or self.is_batch():
             return FloraDetailSerializer
-        
-        # Check for 'minimal' query param for card views
-        if self.request.query_params.get('minimal') == 'true':
-            return FloraMinimalSerializer
         return FloraListSerializer
     
+    def get_queryset(self):
+        """Fetch only what the current action's serializer renders"""
+        queryset = super().get_queryset()
+        
+        # The fotos action only needs the plant to exist; photos are queried on their own
+        if self.action == 'fotos':
+            return queryset.only('id_planta')
+        # Aggregated with values(); no serializer involved
+        if self.action == 'letras':
+            return queryset
+        return self.project_queryset(queryset)
+    
+    @action(detail=False, methods=['get'])
+    def letras(self, request):
+        """Plant count per first letter (A-Z, '#'); accepts the same filters as the list"""
+        if any(param in request.query_params for param in self.filterset_class.base_filters):
+            return Response(indice_letras.contar(self.filter_queryset(self.get_queryset())))
+        return Response(indice_letras.conteos(Flora))
+    
     @action(detail=True, methods=['get'])
     def fotos(self, request, pk=None):
         """Get all photos for a plant"""
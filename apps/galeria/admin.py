@@ -0,0 +1,20 @@
+"""Gallery admin configuration"""
+from django.contrib import admin
+from .models import FotoDestacada, EstadoFoto
+
+
+@admin.register(FotoDestacada)
+class FotoDestacadaAdmin(admin.ModelAdmin):
+    """Admin configuration for curated featured photos"""
+    list_display = ['id_destacada', 'tipo', 'foto_animal', 'foto_flora', 'peso', 'inicio', 'fin', 'activo']
+    list_filter = ['activo']
+    list_editable = ['peso', 'activo']
+    raw_id_fields = ['foto_animal', 'foto_flora']
+
+
+@admin.register(EstadoFoto)
+class EstadoFotoAdmin(admin.ModelAdmin):
+    """Read-mostly view of photo URL health checks"""
+    list_display = ['tipo', 'id_foto', 'url_foto', 'ok', 'codigo', 'error', 'verificado']
+    list_filter = ['tipo', 'ok', 'codigo']
+    search_fields = ['url_foto']
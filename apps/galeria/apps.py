@@ -5,3 +5,6 @@ class GaleriaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.galeria'
     verbose_name = 'Galería'
+
+    def ready(self):
+        from . import signals  # noqa: F401
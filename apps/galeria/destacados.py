@@ -0,0 +1,144 @@
+"""Weighted rotation of curated featured photos"""
+import heapq
+import math
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(n) build, O(1) weighted draw"""
+
+    def __init__(self, items, weights):
+        n = len(items)
+        self.items = list(items)
+        self.weights = list(weights)
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+        if not n:
+            return
+
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def draw(self):
+        i = random.randrange(len(self.items))
+        return self.items[i] if random.random() < self.prob[i] else self.items[self.alias[i]]
+
+    def draw_distinct(self, k):
+        """
+        Draw ``min(k, len(self))`` distinct items, weighted, without replacement.
+
+        Alias draws with duplicates rejected, which is successive weighted
+        sampling in O(1) per draw while ``k`` is small next to the table. When
+        rejections pile up (``k`` close to ``len(self)`` or a few heavy items)
+        the rest is filled with Efraimidis-Spirakis over the items not yet
+        drawn, which continues the same distribution.
+        """
+        k = min(k, len(self.items))
+        elegidos = {}
+        for _ in range(2 * k + 8):
+            if len(elegidos) == k:
+                return list(elegidos)
+            elegidos.setdefault(self.draw(), None)
+        if len(elegidos) < k:
+            elegidos.update(dict.fromkeys(self._draw_keyed(k - len(elegidos), excluir=elegidos)))
+        return list(elegidos)
+
+    def _draw_keyed(self, k, excluir=()):
+        """
+        Efraimidis-Spirakis: each item gets the key ``u ** (1 / w)`` and the
+        ``k`` largest keys win. Compared as ``log(u) / w`` so tiny weights do
+        not underflow to 0.
+        """
+        claves = (
+            (math.log(1.0 - random.random()) / peso, item)
+            for item, peso in zip(self.items, self.weights)
+            if item not in excluir
+        )
+        return [item for _, item in heapq.nlargest(k, claves, key=lambda clave: clave[0])]
+
+
+class RotacionDestacados:
+    """
+    Alias tables of active featured photos, one per tipo.
+
+    Tables are rebuilt only when curation changes (signals call
+    ``invalidate``), when an active window opens or closes, or after
+    ``GALERIA_DESTACADOS_REFRESCO`` seconds so other workers' edits show up.
+    """
+
+    def __init__(self):
+        self._tables = None
+        self._valid_until = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self._tables = None
+
+    def _build(self):
+        from .models import FotoDestacada
+
+        now = timezone.now()
+        rows = FotoDestacada.objects.filter(activo=True, peso__gt=0).values_list(
+            'foto_animal_id', 'foto_flora_id', 'peso', 'inicio', 'fin'
+        )
+        entries = {'fauna': {}, 'flora': {}}
+        boundaries = []
+        for foto_animal_id, foto_flora_id, peso, inicio, fin in rows:
+            if inicio and inicio > now:
+                boundaries.append(inicio)
+                continue
+            if fin and fin <= now:
+                continue
+            if fin:
+                boundaries.append(fin)
+            tipo, foto_id = ('fauna', foto_animal_id) if foto_animal_id else ('flora', foto_flora_id)
+            # Una foto curada dos veces suma sus pesos
+            entries[tipo][foto_id] = entries[tipo].get(foto_id, 0) + peso
+
+        self._tables = {
+            tipo: AliasTable(list(pesos), list(pesos.values()))
+            for tipo, pesos in entries.items()
+        }
+        self._valid_until = min(boundaries) if boundaries else None
+        self._built_at = time.monotonic()
+
+    def tables(self):
+        with self._lock:
+            stale = (
+                self._tables is None
+                or (self._valid_until and timezone.now() >= self._valid_until)
+                or time.monotonic() - self._built_at > settings.GALERIA_DESTACADOS_REFRESCO
+            )
+            if stale:
+                self._build()
+            return self._tables
+
+    def draw(self, tipo, k):
+        """Return up to ``k`` distinct curated photo IDs, or None if ``tipo`` has no curation"""
+        table = self.tables()[tipo]
+        if not len(table):
+            return None
+        return table.draw_distinct(k)
+
+
+rotacion = RotacionDestacados()
@@ -0,0 +1,102 @@
+"""Maintained catalog counters behind EstadisticasView"""
+import threading
+
+from django.db import transaction
+from django.db.models import F
+
+from apps.core import versiones
+from apps.fauna.models import Animal, FotoAnimal
+from apps.flora.models import Flora, FotoFlora
+from .models import EstadisticaCatalogo
+
+
+CONTADORES = {
+    Animal: 'total_animales',
+    Flora: 'total_plantas',
+    FotoAnimal: 'total_fotos_fauna',
+    FotoFlora: 'total_fotos_flora',
+}
+
+_cache = {'data': None, 'firma': None}
+_lock = threading.Lock()
+
+
+def contar():
+    """Exact totals straight from the catalog tables"""
+    return {campo: model.objects.count() for model, campo in CONTADORES.items()}
+
+
+def invalidar():
+    with _lock:
+        _cache['data'] = None
+
+
+def firma():
+    """Data version of the counters row, bumped on every change to it"""
+    return versiones.firma(EstadisticaCatalogo)
+
+
+def ajustar(model, delta):
+    """
+    Apply ``delta`` to the counter of ``model`` once the surrounding
+    transaction commits (a rolled-back write never touches the counters).
+
+    Called by the post_save/post_delete signals; bulk operations that bypass
+    signals (bulk_create, raw SQL) must call it themselves or run
+    ``manage.py reconciliar_estadisticas`` afterwards.
+    """
+    campo = CONTADORES[model]
+    transaction.on_commit(lambda: _aplicar(campo, delta))
+
+
+def _aplicar(campo, delta):
+    actualizadas = EstadisticaCatalogo.objects.filter(pk=1).update(
+        **{campo: F(campo) + delta, 'version': F('version') + 1}
+    )
+    if not actualizadas:
+        reconciliar()
+        return
+    # update() sends no post_save
+    versiones.incrementar(EstadisticaCatalogo)
+    invalidar()
+
+
+def reconciliar():
+    """Recount every table and overwrite the counters; returns (before, after)"""
+    fila = EstadisticaCatalogo.objects.filter(pk=1).first()
+    antes = {campo: getattr(fila, campo) for campo in CONTADORES.values()} if fila else None
+    despues = contar()
+    if antes != despues:
+        EstadisticaCatalogo.objects.update_or_create(
+            pk=1,
+            defaults={**despues, 'version': (fila.version + 1) if fila else 1}
+        )
+        versiones.incrementar(EstadisticaCatalogo)
+    invalidar()
+    return antes, despues
+
+
+def obtener():
+    """
+    Current counters.
+
+    Served from the process cache (zero queries beyond the shared data
+    versions) until ``firma()`` moves, i.e. until any process changed the
+    counters; then one primary-key read refreshes it.
+    """
+    # Read the version first: a change racing the row read only causes another refresh
+    actual = firma()
+    with _lock:
+        if _cache['data'] is not None and _cache['firma'] == actual:
+            return _cache['data']
+
+    fila = EstadisticaCatalogo.objects.filter(pk=1).first()
+    if fila is None:
+        reconciliar()
+        actual = firma()
+        fila = EstadisticaCatalogo.objects.get(pk=1)
+
+    data = {campo: getattr(fila, campo) for campo in CONTADORES.values()}
+    with _lock:
+        _cache.update(data=data, firma=actual)
+    return data
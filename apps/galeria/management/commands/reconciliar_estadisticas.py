@@ -0,0 +1,24 @@
+"""Recount catalog tables and repair drift in EstadisticaCatalogo"""
+from django.core.management.base import BaseCommand
+
+from apps.galeria import estadisticas
+
+
+class Command(BaseCommand):
+    help = 'Recalcula los contadores de EstadisticaCatalogo a partir de las tablas del catálogo'
+
+    def handle(self, *args, **options):
+        antes, despues = estadisticas.reconciliar()
+        if antes is None:
+            self.stdout.write(self.style.SUCCESS(f'Contadores inicializados: {despues}'))
+            return
+
+        deriva = {
+            campo: despues[campo] - antes[campo]
+            for campo in despues
+            if despues[campo] != antes[campo]
+        }
+        if deriva:
+            self.stdout.write(self.style.WARNING(f'Deriva corregida: {deriva}'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Contadores al día, sin deriva.'))
@@ -0,0 +1,16 @@
+"""Fill Animal/Flora.foto_principal for rows inserted without Django signals"""
+from django.core.management.base import BaseCommand
+
+from apps.fauna import signals as fauna_signals
+from apps.flora import signals as flora_signals
+
+
+class Command(BaseCommand):
+    help = 'Asigna la foto principal (la de menor id) a animales y plantas que no la tienen'
+
+    def handle(self, *args, **options):
+        animales = fauna_signals.asignar_foto_principal()
+        plantas = flora_signals.asignar_foto_principal()
+        self.stdout.write(self.style.SUCCESS(
+            f'Foto principal revisada: {animales} animales, {plantas} plantas.'
+        ))
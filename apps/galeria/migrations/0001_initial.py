@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('fauna', '0001_initial'),
+        ('flora', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FotoDestacada',
+            fields=[
+                ('id_destacada', models.AutoField(primary_key=True, serialize=False)),
+                ('peso', models.PositiveIntegerField(default=1, help_text='Peso relativo dentro de su tipo (mayor = aparece más seguido)')),
+                ('inicio', models.DateTimeField(blank=True, help_text='Vacío = desde siempre', null=True)),
+                ('fin', models.DateTimeField(blank=True, help_text='Vacío = sin vencimiento', null=True)),
+                ('activo', models.BooleanField(default=True)),
+                ('foto_animal', models.ForeignKey(blank=True, db_column='id_foto_animal', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='destacados', to='fauna.fotoanimal')),
+                ('foto_flora', models.ForeignKey(blank=True, db_column='id_foto_flora', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='destacados', to='flora.fotoflora')),
+            ],
+            options={
+                'verbose_name': 'Foto destacada',
+                'verbose_name_plural': 'Fotos destacadas',
+                'db_table': 'FotoDestacada',
+            },
+        ),
+    ]
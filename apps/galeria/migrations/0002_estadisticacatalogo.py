@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:14
+
+from django.db import migrations, models
+
+
+def inicializar_contadores(apps, schema_editor):
+    modelos = {
+        'total_animales': apps.get_model('fauna', 'Animal'),
+        'total_plantas': apps.get_model('flora', 'Flora'),
+        'total_fotos_fauna': apps.get_model('fauna', 'FotoAnimal'),
+        'total_fotos_flora': apps.get_model('flora', 'FotoFlora'),
+    }
+    EstadisticaCatalogo = apps.get_model('galeria', 'EstadisticaCatalogo')
+    EstadisticaCatalogo.objects.update_or_create(
+        pk=1,
+        defaults={campo: model.objects.count() for campo, model in modelos.items()},
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('galeria', '0001_initial'),
+        ('fauna', '0001_initial'),
+        ('flora', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EstadisticaCatalogo',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, editable=False, primary_key=True, serialize=False)),
+                ('total_animales', models.IntegerField(default=0)),
+                ('total_plantas', models.IntegerField(default=0)),
+                ('total_fotos_fauna', models.IntegerField(default=0)),
+                ('total_fotos_flora', models.IntegerField(default=0)),
+                ('version', models.BigIntegerField(default=0)),
+                ('actualizado', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Estadística del catálogo',
+                'verbose_name_plural': 'Estadísticas del catálogo',
+                'db_table': 'EstadisticaCatalogo',
+            },
+        ),
+        migrations.RunPython(inicializar_contadores, migrations.RunPython.noop),
+    ]
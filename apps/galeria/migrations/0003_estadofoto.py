@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('galeria', '0002_estadisticacatalogo'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EstadoFoto',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('fauna', 'Fauna'), ('flora', 'Flora')], max_length=5)),
+                ('id_foto', models.IntegerField()),
+                ('url_foto', models.CharField(max_length=500)),
+                ('ok', models.BooleanField()),
+                ('codigo', models.PositiveSmallIntegerField(blank=True, help_text='Código HTTP final', null=True)),
+                ('error', models.CharField(blank=True, max_length=255, null=True)),
+                ('verificado', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Estado de foto',
+                'verbose_name_plural': 'Estados de fotos',
+                'db_table': 'EstadoFoto',
+                'indexes': [models.Index(fields=['tipo', 'ok', 'id_foto'], name='estadofoto_rotas_idx')],
+                'unique_together': {('tipo', 'id_foto')},
+            },
+        ),
+    ]
@@ -0,0 +1,101 @@
+"""Gallery models"""
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from apps.fauna.models import FotoAnimal
+from apps.flora.models import FotoFlora
+
+
+class FotoDestacada(models.Model):
+    """Foto curada para el carrusel de destacados"""
+    id_destacada = models.AutoField(primary_key=True)
+    foto_animal = models.ForeignKey(
+        FotoAnimal,
+        on_delete=models.CASCADE,
+        db_column='id_foto_animal',
+        related_name='destacados',
+        blank=True,
+        null=True
+    )
+    foto_flora = models.ForeignKey(
+        FotoFlora,
+        on_delete=models.CASCADE,
+        db_column='id_foto_flora',
+        related_name='destacados',
+        blank=True,
+        null=True
+    )
+    peso = models.PositiveIntegerField(
+        default=1,
+        help_text='Peso relativo dentro de su tipo (mayor = aparece más seguido)'
+    )
+    inicio = models.DateTimeField(blank=True, null=True, help_text='Vacío = desde siempre')
+    fin = models.DateTimeField(blank=True, null=True, help_text='Vacío = sin vencimiento')
+    activo = models.BooleanField(default=True)
+
+    class Meta:
+        db_table = 'FotoDestacada'
+        verbose_name = 'Foto destacada'
+        verbose_name_plural = 'Fotos destacadas'
+
+    def __str__(self):
+        return f"Destacada {self.tipo} #{self.foto_id} (peso {self.peso})"
+
+    @property
+    def tipo(self):
+        return 'fauna' if self.foto_animal_id else 'flora'
+
+    @property
+    def foto_id(self):
+        return self.foto_animal_id or self.foto_flora_id
+
+    def clean(self):
+        if bool(self.foto_animal_id) == bool(self.foto_flora_id):
+            raise ValidationError('Seleccione exactamente una foto de fauna o de flora.')
+        if self.inicio and self.fin and self.fin <= self.inicio:
+            raise ValidationError({'fin': 'El fin debe ser posterior al inicio.'})
+
+
+class EstadisticaCatalogo(models.Model):
+    """Contadores del catálogo (fila única) mantenidos por señales"""
+    id = models.PositiveSmallIntegerField(primary_key=True, default=1, editable=False)
+    total_animales = models.IntegerField(default=0)
+    total_plantas = models.IntegerField(default=0)
+    total_fotos_fauna = models.IntegerField(default=0)
+    total_fotos_flora = models.IntegerField(default=0)
+    version = models.BigIntegerField(default=0)
+    actualizado = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'EstadisticaCatalogo'
+        verbose_name = 'Estadística del catálogo'
+        verbose_name_plural = 'Estadísticas del catálogo'
+
+    def __str__(self):
+        return f"Estadísticas v{self.version}"
+
+
+class EstadoFoto(models.Model):
+    """Resultado de la última verificación de url_foto (manage.py verificar_fotos)"""
+    TIPO_CHOICES = [
+        ('fauna', 'Fauna'),
+        ('flora', 'Flora'),
+    ]
+
+    tipo = models.CharField(max_length=5, choices=TIPO_CHOICES)
+    id_foto = models.IntegerField()
+    url_foto = models.CharField(max_length=500)
+    ok = models.BooleanField()
+    codigo = models.PositiveSmallIntegerField(blank=True, null=True, help_text='Código HTTP final')
+    error = models.CharField(max_length=255, blank=True, null=True)
+    verificado = models.DateTimeField()
+
+    class Meta:
+        db_table = 'EstadoFoto'
+        verbose_name = 'Estado de foto'
+        verbose_name_plural = 'Estados de fotos'
+        unique_together = ('tipo', 'id_foto')
+        indexes = [models.Index(fields=['tipo', 'ok', 'id_foto'], name='estadofoto_rotas_idx')]
+
+    def __str__(self):
+        return f"{self.tipo} #{self.id_foto}: {'OK' if self.ok else self.codigo or self.error}"
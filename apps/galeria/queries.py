@@ -0,0 +1,88 @@
+"""
+Values-based gallery item queries.
+
+Every gallery endpoint reads photos through ``fotos()``, which selects only
+the eight columns a GaleriaItemSerializer item needs (no model instances,
+no TextField columns, no Categoria join), and maps rows with ``a_item``.
+Photos whose URL was found dead by ``verificar_fotos`` are skipped.
+"""
+from django.conf import settings
+from django.db.models import CharField, Exists, F, OuterRef, Value
+
+from apps.core import derivados
+from apps.fauna.models import FotoAnimal
+from apps.flora.models import FotoFlora
+from .models import EstadoFoto
+
+
+MODELOS = {
+    'fauna': FotoAnimal,
+    'flora': FotoFlora,
+}
+
+ESPECIE = {
+    'fauna': 'animal',
+    'flora': 'planta',
+}
+
+CAMPOS = (
+    'tipo', 'id_foto', 'nombre', 'url_foto', 'descripcion',
+    'especie_id', 'nombre_cientifico', 'estado',
+)
+
+
+def fotos(tipo, queryset=None):
+    """Values queryset of gallery rows for ``tipo`` ('fauna' or 'flora')"""
+    if queryset is None:
+        queryset = MODELOS[tipo].objects.all()
+    if settings.GALERIA_OCULTAR_FOTOS_ROTAS:
+        queryset = queryset.exclude(Exists(rotas(tipo)))
+    especie = ESPECIE[tipo]
+    return queryset.annotate(
+        tipo=Value(tipo, output_field=CharField()),
+        nombre=F(f'{especie}__nombre_comun'),
+        especie_id=F(f'{especie}_id'),
+        nombre_cientifico=F(f'{especie}__nombre_cientifico'),
+        estado=F(f'{especie}__estado'),
+    ).values(*CAMPOS)
+
+
+def rotas(tipo):
+    """
+    Dead-link marks from ``manage.py verificar_fotos`` for the outer photo row.
+
+    Matched on url_foto too, so editing a photo's URL un-hides it right away.
+    """
+    return EstadoFoto.objects.filter(
+        tipo=tipo,
+        ok=False,
+        id_foto=OuterRef('id_foto'),
+        url_foto=OuterRef('url_foto'),
+    )
+
+
+def a_item(row):
+    """Map a ``fotos()`` row to the GaleriaItemSerializer output shape"""
+    return {
+        'id': row['id_foto'],
+        'tipo': row['tipo'],
+        'nombre': row['nombre'],
+        'url_foto': row['url_foto'],
+        'descripcion_foto': row['descripcion'],
+        'especie_id': row['especie_id'],
+        'nombre_cientifico': row['nombre_cientifico'],
+        'estado': row['estado'],
+        'srcset': derivados.srcset(row['url_foto']),
+    }
+
+
+def items(rows):
+    return [a_item(row) for row in rows]
+
+
+def por_ids(tipo, ids):
+    """Gallery items for ``ids`` in the given order, with one IN (...) query"""
+    if not ids:
+        return []
+    rows = {row['id_foto']: row for row in fotos(tipo).filter(id_foto__in=ids)}
+    return [a_item(rows[pk]) for pk in ids if pk in rows]
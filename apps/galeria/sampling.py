@@ -0,0 +1,142 @@
+"""In-process photo ID pools for random gallery sampling"""
+import random
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+
+
+class PhotoIdPool:
+    """
+    Compact sorted pool of photo IDs for one photo table.
+
+    The pool is loaded once per process and then kept current incrementally:
+    local writes arrive through signals (``add``/``discard``), inserts made by
+    other workers are picked up by a periodic ``pk > high water mark`` query and
+    rows deleted elsewhere are evicted the first time they fail to resolve.
+    Rows that exist but are filtered out of a sample (hidden photos) stay.
+    """
+
+    def __init__(self, model, refresh_interval=300):
+        self.model = model
+        self.refresh_interval = refresh_interval
+        self._ids = array('i')
+        self._loaded = False
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    @property
+    def max_id(self):
+        return self._ids[-1] if self._ids else 0
+
+    @property
+    def nbytes(self):
+        """Memory used by the ID buffer"""
+        return self._ids.buffer_info()[1] * self._ids.itemsize
+
+    def _load(self):
+        ids = self.model.objects.order_by('pk').values_list('pk', flat=True)
+        self._ids = array('i', ids.iterator(chunk_size=10000))
+        self._loaded = True
+        self._refreshed_at = time.monotonic()
+
+    def _refresh(self):
+        """Append rows inserted by other processes since the last refresh"""
+        queryset = self.model.objects.order_by('pk').values_list('pk', flat=True)
+        if self._ids:
+            queryset = queryset.filter(pk__gt=self._ids[-1])
+        self._ids.extend(queryset.iterator(chunk_size=10000))
+        self._refreshed_at = time.monotonic()
+
+    def ensure_ready(self):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            elif time.monotonic() - self._refreshed_at > self.refresh_interval:
+                self._refresh()
+
+    def reset(self):
+        with self._lock:
+            self._ids = array('i')
+            self._loaded = False
+
+    def add(self, pk):
+        with self._lock:
+            if not self._loaded:
+                return
+            if not self._ids or pk > self._ids[-1]:
+                self._ids.append(pk)
+                return
+            pos = bisect_left(self._ids, pk)
+            if pos == len(self._ids) or self._ids[pos] != pk:
+                self._ids.insert(pos, pk)
+
+    def discard(self, pk):
+        with self._lock:
+            pos = bisect_left(self._ids, pk)
+            if pos < len(self._ids) and self._ids[pos] == pk:
+                del self._ids[pos]
+
+    def __contains__(self, pk):
+        pos = bisect_left(self._ids, pk)
+        return pos < len(self._ids) and self._ids[pos] == pk
+
+    def sample(self, k):
+        """Return up to ``k`` distinct random IDs in O(k)"""
+        self.ensure_ready()
+        with self._lock:
+            size = len(self._ids)
+            positions = random.sample(range(size), min(k, size))
+            return [self._ids[pos] for pos in positions]
+
+    def sample_queryset(self, queryset, k, rondas=4):
+        """
+        Fetch ``k`` random rows of ``queryset`` with one ``IN (...)`` query per round.
+
+        Works with model and ``values()`` querysets (rows keyed by the pk column).
+        IDs the queryset filters out (e.g. photos hidden for a dead URL) are
+        replaced by new draws, up to ``rondas`` rounds; only IDs whose row no
+        longer exists are evicted from the pool.
+        """
+        pk_name = self.model._meta.pk.attname
+        elegidas = []
+        vistos = set()
+        for _ in range(rondas):
+            faltan = k - len(elegidas)
+            if faltan <= 0:
+                break
+            # Over-draw by what was already seen so the round still has ``faltan`` new IDs
+            ids = [pk for pk in self.sample(faltan + len(vistos)) if pk not in vistos][:faltan]
+            if not ids:
+                break
+            vistos.update(ids)
+            rows = {
+                row[pk_name] if isinstance(row, dict) else row.pk: row
+                for row in queryset.filter(pk__in=ids)
+            }
+            elegidas.extend(rows[pk] for pk in ids if pk in rows)
+            faltantes = [pk for pk in ids if pk not in rows]
+            if faltantes:
+                existentes = set(self.model.objects.filter(pk__in=faltantes).values_list('pk', flat=True))
+                for pk in faltantes:
+                    if pk not in existentes:
+                        self.discard(pk)
+        return elegidas
+
+
+_pools = {}
+
+
+def get_pool(model):
+    """Return the process-wide pool for a photo model"""
+    pool = _pools.get(model)
+    if pool is None:
+        pool = _pools.setdefault(
+            model, PhotoIdPool(model, settings.GALERIA_ALEATORIOS_REFRESCO)
+        )
+    return pool
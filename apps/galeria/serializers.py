@@ -38,3 +38,6 @@ class GaleriaItemSerializer(serializers.Serializer):
     # Optional detailed info
     nombre_cientifico = serializers.CharField(required=False)
     estado = serializers.CharField(required=False)
+    
+    # Responsive variants: {'webp': 'url 320w, ...', 'jpeg': ...} or null
+    srcset = serializers.DictField(child=serializers.CharField(), required=False, allow_null=True)
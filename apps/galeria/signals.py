@@ -0,0 +1,50 @@
+"""Gallery signal handlers"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.fauna.models import Animal, FotoAnimal
+from apps.flora.models import Flora, FotoFlora
+from . import estadisticas
+from .models import FotoDestacada
+from .sampling import get_pool
+from .destacados import rotacion
+
+
+@receiver(post_save, sender=FotoAnimal)
+@receiver(post_save, sender=FotoFlora)
+def agregar_foto_al_pool(sender, instance, created, **kwargs):
+    """Keep the random sampling pool in sync with new (or edited) photos; add() is idempotent"""
+    get_pool(sender).add(instance.pk)
+
+
+@receiver(post_delete, sender=FotoAnimal)
+@receiver(post_delete, sender=FotoFlora)
+def quitar_foto_del_pool(sender, instance, **kwargs):
+    """Drop deleted photos from the random sampling pool"""
+    get_pool(sender).discard(instance.pk)
+
+
+@receiver(post_save, sender=FotoDestacada)
+@receiver(post_delete, sender=FotoDestacada)
+def invalidar_rotacion_destacados(sender, **kwargs):
+    """Rebuild the featured alias tables after any curation change"""
+    rotacion.invalidate()
+
+
+@receiver(post_save, sender=Animal)
+@receiver(post_save, sender=Flora)
+@receiver(post_save, sender=FotoAnimal)
+@receiver(post_save, sender=FotoFlora)
+def incrementar_estadisticas(sender, instance, created, raw=False, **kwargs):
+    """Count new species and photos in the statistics row"""
+    if created and not raw:
+        estadisticas.ajustar(sender, 1)
+
+
+@receiver(post_delete, sender=Animal)
+@receiver(post_delete, sender=Flora)
+@receiver(post_delete, sender=FotoAnimal)
+@receiver(post_delete, sender=FotoFlora)
+def decrementar_estadisticas(sender, instance, **kwargs):
+    """Discount deleted species and photos (cascades included)"""
+    estadisticas.ajustar(sender, -1)
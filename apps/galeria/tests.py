@@ -0,0 +1,333 @@
+import asyncio
+import io
+import threading
+import time
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.core import versiones
+from apps.fauna.models import Animal, Categoria, FotoAnimal
+from apps.flora.models import Flora, FotoFlora
+from . import estadisticas, queries, verificador
+from .destacados import AliasTable
+from .models import EstadoFoto
+from .sampling import PhotoIdPool
+from .verificador import verificar_urls
+
+
+class Manejador(BaseHTTPRequestHandler):
+    """
+    /ok/*        200
+    /falta/*     404
+    /sin-head/*  405 to HEAD, 200 to GET
+    /lento/*     first request outlasts the client timeout, later ones answer 200
+    """
+    pedidos = {}
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def responder(self, head):
+        with self.lock:
+            self.pedidos[self.path] = self.pedidos.get(self.path, 0) + 1
+            numero = self.pedidos[self.path]
+        if self.path.startswith('/falta/'):
+            return self.send_error(404)
+        if self.path.startswith('/sin-head/') and head:
+            return self.send_error(405)
+        if self.path.startswith('/lento/') and numero == 1:
+            time.sleep(1.5)
+        self.send_response(200)
+        self.send_header('Content-Length', '1')
+        self.end_headers()
+        if not head:
+            self.wfile.write(b'x')
+
+    def do_HEAD(self):
+        self.responder(head=True)
+
+    def do_GET(self):
+        self.responder(head=False)
+
+
+class VerificadorTests(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.servidor = ThreadingHTTPServer(('127.0.0.1', 0), Manejador)
+        threading.Thread(target=cls.servidor.serve_forever, daemon=True).start()
+        cls.base = f'http://127.0.0.1:{cls.servidor.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.servidor.shutdown()
+        cls.servidor.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        Manejador.pedidos.clear()
+
+    def url(self, ruta):
+        return f'{self.base}{ruta}'
+
+    def verificar(self, urls):
+        return asyncio.run(verificar_urls(urls, timeout=0.5, reintentos=1, backoff=0.01))
+
+    def test_verificar_urls(self):
+        resultados = self.verificar([
+            self.url('/ok/1'), self.url('/falta/1'), self.url('/sin-head/1'), self.url('/lento/1'),
+        ])
+
+        self.assertTrue(resultados[self.url('/ok/1')].ok)
+        self.assertEqual(resultados[self.url('/ok/1')].codigo, 200)
+
+        self.assertFalse(resultados[self.url('/falta/1')].ok)
+        self.assertEqual(resultados[self.url('/falta/1')].codigo, 404)
+
+        self.assertTrue(resultados[self.url('/sin-head/1')].ok)
+        self.assertEqual(resultados[self.url('/sin-head/1')].codigo, 200)
+        # HEAD refused, then the GET fallback
+        self.assertEqual(Manejador.pedidos['/sin-head/1'], 2)
+
+        self.assertTrue(resultados[self.url('/lento/1')].ok)
+        # Timed out once, answered on the retry
+        self.assertEqual(Manejador.pedidos['/lento/1'], 2)
+
+    def test_timeout_sin_reintentos_queda_como_error(self):
+        resultado = asyncio.run(verificar_urls([self.url('/lento/2')], timeout=0.5, reintentos=0))[self.url('/lento/2')]
+        self.assertFalse(resultado.ok)
+        self.assertIsNone(resultado.codigo)
+        self.assertTrue(resultado.error)
+
+    def test_comando_guarda_estado_por_foto(self):
+        categoria = Categoria.objects.create(nombre='Aves')
+        animal = Animal.objects.create(nombre_comun='Garza', nombre_cientifico='Ardea alba', categoria=categoria)
+        rutas = ['/ok/1', '/falta/1', '/sin-head/1', '/lento/1', '/ok/1']
+        fotos = [FotoAnimal.objects.create(animal=animal, url_foto=self.url(ruta)) for ruta in rutas]
+        # Mark of a photo that no longer exists
+        EstadoFoto.objects.create(tipo='fauna', id_foto=fotos[-1].pk + 100, url_foto='x', ok=False, verificado=timezone.now())
+
+        # batch_size=2 so the photos span several batches, all checked through one session
+        with mock.patch('apps.galeria.verificador._sesion', wraps=verificador._sesion) as sesion:
+            call_command('verificar_fotos', tipo='fauna', timeout=0.5, reintentos=1, batch_size=2, stdout=io.StringIO())
+        self.assertEqual(sesion.call_count, 1)
+
+        estados = {estado.id_foto: estado for estado in EstadoFoto.objects.filter(tipo='fauna')}
+        self.assertEqual(set(estados), {foto.pk for foto in fotos})
+        esperado = [(True, 200), (False, 404), (True, 200), (True, 200), (True, 200)]
+        for foto, (ok, codigo) in zip(fotos, esperado):
+            with self.subTest(url=foto.url_foto):
+                self.assertEqual(estados[foto.pk].url_foto, foto.url_foto)
+                self.assertEqual((estados[foto.pk].ok, estados[foto.pk].codigo), (ok, codigo))
+
+
+class FotoBulkUpdateTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuario = User.objects.create_user('editor', password='x')
+        categoria = Categoria.objects.create(nombre='Aves')
+        animal = Animal.objects.create(nombre_comun='Garza', nombre_cientifico='Ardea alba', categoria=categoria)
+        cls.fotos = [
+            FotoAnimal.objects.create(animal=animal, url_foto=f'https://example.org/{i}.jpg') for i in range(3)
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.usuario)
+
+    def test_id_repetido_se_rechaza_por_item(self):
+        primera, segunda, _ = self.fotos
+        response = self.client.patch('/api/galeria/fotos/fauna/lote/', [
+            {'id': primera.pk, 'descripcion': 'a'},
+            {'id': segunda.pk, 'descripcion': 'b'},
+            {'id': primera.pk, 'descripcion': 'c'},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [resultado['estado'] for resultado in response.data['resultados']],
+            ['duplicado', 'sin_aplicar', 'duplicado'],
+        )
+        self.assertFalse(FotoAnimal.objects.exclude(descripcion=None).exists())
+
+    def test_cambios_validos_se_aplican(self):
+        response = self.client.patch('/api/galeria/fotos/fauna/lote/', [
+            {'id': foto.pk, 'descripcion': f'foto {foto.pk}'} for foto in self.fotos
+        ], format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['actualizadas'], 3)
+        for foto in self.fotos:
+            foto.refresh_from_db()
+            self.assertEqual(foto.descripcion, f'foto {foto.pk}')
+
+
+class EstadisticasTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.categoria = Categoria.objects.create(nombre='Aves')
+        estadisticas.reconciliar()
+
+    def setUp(self):
+        # Process caches outlive the rolled-back test transactions
+        versiones._invalidar()
+        estadisticas.invalidar()
+
+    def crear_animal(self, nombre):
+        return Animal.objects.create(nombre_comun=nombre, nombre_cientifico=f'{nombre} sp', categoria=self.categoria)
+
+    def test_contadores_se_ajustan_al_confirmar(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.crear_animal('Garza')
+        self.assertEqual(estadisticas.obtener()['total_animales'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Animal.objects.get(nombre_comun='Garza').delete()
+        self.assertEqual(estadisticas.obtener(), estadisticas.contar())
+
+    def test_escritura_revertida_no_cuenta(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    self.crear_animal('Garza')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(callbacks, [])
+        self.assertEqual(estadisticas.obtener()['total_animales'], 0)
+
+
+class PhotoIdPoolTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        categoria = Categoria.objects.create(nombre='Aves')
+        animal = Animal.objects.create(nombre_comun='Garza', nombre_cientifico='Ardea alba', categoria=categoria)
+        cls.fotos = [
+            FotoAnimal.objects.create(animal=animal, url_foto=f'https://example.org/{i}.jpg') for i in range(6)
+        ]
+
+    def setUp(self):
+        self.pool = PhotoIdPool(FotoAnimal)
+        self.pool.ensure_ready()
+
+    def ocultar(self, foto):
+        EstadoFoto.objects.create(
+            tipo='fauna', id_foto=foto.pk, url_foto=foto.url_foto, ok=False, verificado=timezone.now()
+        )
+
+    def test_foto_oculta_se_reemplaza_y_no_sale_del_pool(self):
+        oculta = self.fotos[0]
+        self.ocultar(oculta)
+
+        for _ in range(20):
+            filas = self.pool.sample_queryset(queries.fotos('fauna'), 5)
+            self.assertEqual(len(filas), 5)
+            self.assertNotIn(oculta.pk, [fila['id_foto'] for fila in filas])
+        self.assertIn(oculta.pk, self.pool)
+
+    def test_foto_eliminada_sale_del_pool(self):
+        eliminada = self.fotos[0]
+        FotoAnimal.objects.filter(pk=eliminada.pk).delete()  # No signal, as from another worker
+
+        filas = self.pool.sample_queryset(queries.fotos('fauna'), 6)
+        self.assertEqual(len(filas), 5)
+        self.assertNotIn(eliminada.pk, self.pool)
+
+    def test_editar_foto_la_devuelve_al_pool(self):
+        foto = self.fotos[0]
+        self.pool.discard(foto.pk)
+        with mock.patch('apps.galeria.signals.get_pool', return_value=self.pool):
+            foto.url_foto = 'https://example.org/nueva.jpg'
+            foto.save()
+        self.assertIn(foto.pk, self.pool)
+
+    def test_url_corregida_vuelve_a_aleatorios(self):
+        foto = self.fotos[0]
+        self.ocultar(foto)
+        with mock.patch('apps.galeria.views.get_pool', return_value=self.pool):
+            ids = {item['id'] for item in APIClient().get('/api/galeria/aleatorios/?tipo=fauna&limit=6').data}
+            self.assertEqual(ids, {f.pk for f in self.fotos[1:]})
+
+            foto.url_foto = 'https://example.org/corregida.jpg'
+            foto.save()
+            ids = {item['id'] for item in APIClient().get('/api/galeria/aleatorios/?tipo=fauna&limit=6').data}
+            self.assertEqual(ids, {f.pk for f in self.fotos})
+
+
+class AliasTableTests(SimpleTestCase):
+
+    def test_draw_distinct_sin_repetidos(self):
+        tabla = AliasTable(list(range(50)), [1] * 49 + [1000])
+        for k in (1, 5, 49, 50, 80):
+            with self.subTest(k=k):
+                elegidos = tabla.draw_distinct(k)
+                self.assertEqual(len(elegidos), min(k, 50))
+                self.assertEqual(len(set(elegidos)), len(elegidos))
+
+    def test_draw_distinct_respeta_pesos(self):
+        tabla = AliasTable(['a', 'b', 'c'], [8, 1, 1])
+        primeros = [tabla.draw_distinct(2)[0] for _ in range(2000)]
+        self.assertGreater(primeros.count('a'), 1400)
+
+    def test_tabla_vacia(self):
+        self.assertEqual(AliasTable([], []).draw_distinct(3), [])
+
+
+class SeededShuffleTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        categoria = Categoria.objects.create(nombre='Aves')
+        animal = Animal.objects.create(nombre_comun='Garza', nombre_cientifico='Ardea alba', categoria=categoria)
+        planta = Flora.objects.create(nombre_comun='Ceiba', nombre_cientifico='Ceiba pentandra')
+        cls.fauna = [
+            FotoAnimal.objects.create(animal=animal, url_foto=f'https://example.org/a{i}.jpg') for i in range(9)
+        ]
+        cls.flora = [
+            FotoFlora.objects.create(planta=planta, url_foto=f'https://example.org/p{i}.jpg') for i in range(7)
+        ]
+        oculta = cls.fauna[4]
+        EstadoFoto.objects.create(
+            tipo='fauna', id_foto=oculta.pk, url_foto=oculta.url_foto, ok=False, verificado=timezone.now()
+        )
+
+    def setUp(self):
+        pools = {FotoAnimal: PhotoIdPool(FotoAnimal), FotoFlora: PhotoIdPool(FotoFlora)}
+        parche = mock.patch('apps.galeria.views.get_pool', side_effect=pools.__getitem__)
+        parche.start()
+        self.addCleanup(parche.stop)
+
+    def recorrer(self, seed, limit=3):
+        """``[(tipo, id)]`` over every page of one shuffle"""
+        vistos = []
+        url = f'/api/galeria/aleatorios/?tipo=todos&limit={limit}&seed={seed}'
+        while url:
+            data = APIClient().get(url).data
+            self.assertLessEqual(len(data['results']), limit)
+            vistos.extend((item['tipo'], item['id']) for item in data['results'])
+            url = data['next']
+        return vistos
+
+    def test_paginas_sin_repetidos_y_completas(self):
+        vistos = self.recorrer('abc')
+        esperados = {('fauna', foto.pk) for foto in self.fauna if foto != self.fauna[4]}
+        esperados |= {('flora', foto.pk) for foto in self.flora}
+        self.assertEqual(len(vistos), len(set(vistos)))
+        self.assertEqual(set(vistos), esperados)
+
+    def test_misma_semilla_mismo_orden(self):
+        # The order belongs to the seed, not to the page size
+        self.assertEqual(self.recorrer('abc'), self.recorrer('abc', limit=5))
+        self.assertNotEqual(self.recorrer('abc'), self.recorrer('xyz'))
@@ -1,5 +1,5 @@
 """Gallery URL configuration"""
-from django.urls import path
+from django.urls import path, re_path
 from .views import (
     DestacadosView, 
     AleatoriosView, 
@@ -7,6 +7,8 @@ from .views import (
     FotoAnimalDetailUpdateView,
     FotoFloraDetailUpdateView,
     EstadosConservacionView,
+    FotosView,
+    FotoBulkUpdateView,
 )
 
 app_name = 'galeria'
@@ -17,10 +19,16 @@ urlpatterns = [
     path('aleatorios/', AleatoriosView.as_view(), name='aleatorios'),
     path('estadisticas/', EstadisticasView.as_view(), name='estadisticas'),
     
+    # Unified fauna + flora feed (keyset pagination)
+    path('fotos/', FotosView.as_view(), name='fotos'),
+    
     # Foto edit endpoints (GET público, PATCH requiere auth) - por ID de animal/planta
     path('fotos/fauna/<int:id_animal>/', FotoAnimalDetailUpdateView.as_view(), name='foto-fauna-detail'),
     path('fotos/flora/<int:id_planta>/', FotoFloraDetailUpdateView.as_view(), name='foto-flora-detail'),
     
+    # Edición masiva de fotos (PATCH, requiere auth) - por id_foto
+    re_path(r'^fotos/(?P<tipo>fauna|flora)/lote/$', FotoBulkUpdateView.as_view(), name='foto-lote'),
+    
     # Estados de conservación
     path('estados-conservacion/', EstadosConservacionView.as_view(), name='estados-conservacion'),
 ]
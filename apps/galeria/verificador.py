@@ -0,0 +1,133 @@
+"""Concurrent photo URL health checks (asyncio + aiohttp)"""
+import asyncio
+import random
+import threading
+from dataclasses import dataclass
+
+
+# HEAD responses that often mean "HEAD not supported" rather than "broken"
+HEAD_FALLBACK_STATUS = {400, 403, 405, 501}
+# Transient responses worth retrying
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class Resultado:
+    ok: bool
+    codigo: int = None
+    error: str = None
+
+
+async def _pedir(session, metodo, url):
+    headers = {'Range': 'bytes=0-0'} if metodo == 'GET' else None
+    async with session.request(metodo, url, headers=headers, allow_redirects=True) as respuesta:
+        return respuesta.status
+
+
+async def verificar_url(session, url, reintentos=2, backoff=0.5):
+    """HEAD with GET fallback, retrying timeouts/5xx/429 with exponential backoff"""
+    import aiohttp
+
+    resultado = Resultado(ok=False, error='sin intentos')
+    for intento in range(reintentos + 1):
+        try:
+            codigo = await _pedir(session, 'HEAD', url)
+            if codigo in HEAD_FALLBACK_STATUS:
+                codigo = await _pedir(session, 'GET', url)
+            resultado = Resultado(ok=200 <= codigo < 400, codigo=codigo)
+            if codigo not in RETRY_STATUS:
+                return resultado
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            resultado = Resultado(ok=False, error=(str(e) or type(e).__name__)[:255])
+            if isinstance(e, (aiohttp.InvalidURL, ValueError)):
+                return resultado
+        if intento < reintentos:
+            await asyncio.sleep(backoff * 2 ** intento * (1 + random.random()))
+    return resultado
+
+
+def _sesion(concurrencia, por_host, timeout):
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=concurrencia, limit_per_host=por_host, ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    headers = {'User-Agent': 'EcoAlbum-Verificador/1.0'}
+    return aiohttp.ClientSession(connector=connector, timeout=client_timeout, headers=headers)
+
+
+async def verificar_urls(urls, concurrencia=200, por_host=8, timeout=10, reintentos=2,
+                         backoff=0.5, al_completar=None):
+    """
+    Check every URL in ``urls`` and return ``{url: Resultado}``.
+
+    ``concurrencia`` workers pull from a shared queue (memory stays bounded for
+    100k+ URLs) and the connector caps open connections per host.
+    ``al_completar(url, resultado)`` is called as results arrive.
+    """
+    pendientes = list(dict.fromkeys(urls))
+    resultados = {}
+    cola = iter(pendientes)
+
+    async with _sesion(concurrencia, por_host, timeout) as session:
+        async def worker():
+            for url in cola:
+                resultado = await verificar_url(session, url, reintentos, backoff)
+                resultados[url] = resultado
+                if al_completar:
+                    al_completar(url, resultado)
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrencia, len(pendientes)) or 1)))
+    return resultados
+
+
+class Verificador:
+    """
+    One event loop and one ClientSession for a whole run, fed from sync code.
+
+    The loop runs in a background thread so the caller keeps the database work
+    on its own thread and can save one batch while the next is being checked.
+    A semaphore caps requests in flight at ``concurrencia``.
+
+        with Verificador(concurrencia=200) as verificador:
+            futuros = verificador.enviar(urls)      # {url: concurrent Future}
+            resultados = {url: f.result() for url, f in futuros.items()}
+    """
+
+    def __init__(self, concurrencia=200, por_host=8, timeout=10, reintentos=2, backoff=0.5):
+        self.concurrencia = concurrencia
+        self.por_host = por_host
+        self.timeout = timeout
+        self.reintentos = reintentos
+        self.backoff = backoff
+        self._loop = None
+        self._hilo = None
+
+    async def _abrir(self):
+        self._session = _sesion(self.concurrencia, self.por_host, self.timeout)
+        self._semaforo = asyncio.Semaphore(self.concurrencia)
+
+    async def _verificar(self, url):
+        async with self._semaforo:
+            return await verificar_url(self._session, url, self.reintentos, self.backoff)
+
+    def _ejecutar(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def __enter__(self):
+        self._loop = asyncio.new_event_loop()
+        self._hilo = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._hilo.start()
+        self._ejecutar(self._abrir()).result()
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self._ejecutar(self._session.close()).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._hilo.join()
+            self._loop.close()
+
+    def enviar(self, urls):
+        """Schedule ``urls`` (deduplicated) and return ``{url: concurrent.futures.Future}``"""
+        return {url: self._ejecutar(self._verificar(url)) for url in dict.fromkeys(urls)}
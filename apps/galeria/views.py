@@ -1,36 +1,34 @@
 """Gallery views for carousel endpoints"""
+import base64
 import random
+from collections import Counter
+from django.conf import settings
+from django.db import transaction
 from rest_framework import status
+from rest_framework.exceptions import NotFound
 from rest_framework.views import APIView
 from rest_framework.generics import RetrieveUpdateAPIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.permissions import AllowAny, IsAuthenticated, IsAuthenticatedOrReadOnly
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from apps.fauna.models import FotoAnimal, Animal
-from apps.flora.models import FotoFlora, Flora
+from apps.core import versiones
+from apps.core.condicional import ConditionalGetMixin
+from apps.core.estados import ESTADO_FAUNA_CHOICES, ESTADO_FLORA_CHOICES
+from apps.core.respuestas import CachedResponseMixin
+from apps.fauna.models import Animal, FotoAnimal
+from apps.flora.models import Flora, FotoFlora
+from .models import EstadisticaCatalogo, EstadoFoto
 from .serializers import GaleriaItemSerializer, FotoAnimalEditSerializer, FotoFloraEditSerializer
+from .sampling import get_pool
+from .destacados import rotacion
+from .permutacion import FeistelPermutation
+from . import estadisticas, queries
 
 
-# Estados de conservación (sincronizados con schema.sql)
-ESTADO_FAUNA_CHOICES = [
-    'Preocupación menor (LC)',
-    'Casi amenazado (NT)',
-    'Vulnerable (VU)',
-    'En peligro (EN)',
-    'Peligro crítico (CR)',
-]
-
-ESTADO_FLORA_CHOICES = [
-    'Preocupación menor (LC)',
-    'Vulnerable (VU)',
-    'En peligro (EN)',
-    'Peligro crítico (CR)',
-]
-
-
-class FotoAnimalDetailUpdateView(RetrieveUpdateAPIView):
+class FotoAnimalDetailUpdateView(CachedResponseMixin, RetrieveUpdateAPIView):
     """
     GET: Ver detalle de una foto de fauna por ID del animal.
     PATCH/PUT: Editar url_foto y descripcion (requiere autenticación).
@@ -38,6 +36,7 @@ class FotoAnimalDetailUpdateView(RetrieveUpdateAPIView):
     queryset = FotoAnimal.objects.select_related('animal')
     serializer_class = FotoAnimalEditSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    version_models = (FotoAnimal, Animal)
     lookup_field = 'animal_id'
     lookup_url_kwarg = 'id_animal'
     
@@ -65,7 +64,7 @@ class FotoAnimalDetailUpdateView(RetrieveUpdateAPIView):
         return super().put(request, *args, **kwargs)
 
 
-class FotoFloraDetailUpdateView(RetrieveUpdateAPIView):
+class FotoFloraDetailUpdateView(CachedResponseMixin, RetrieveUpdateAPIView):
     """
     GET: Ver detalle de una foto de flora por ID de la planta.
     PATCH/PUT: Editar url_foto y descripcion (requiere autenticación).
@@ -73,6 +72,7 @@ class FotoFloraDetailUpdateView(RetrieveUpdateAPIView):
     queryset = FotoFlora.objects.select_related('planta')
     serializer_class = FotoFloraEditSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    version_models = (FotoFlora, Flora)
     lookup_field = 'planta_id'
     lookup_url_kwarg = 'id_planta'
     
@@ -92,6 +92,114 @@ class FotoFloraDetailUpdateView(RetrieveUpdateAPIView):
         return super().patch(request, *args, **kwargs)
 
 
+class FotoBulkUpdateView(APIView):
+    """
+    PATCH: Editar url_foto/descripcion de muchas fotos de fauna o flora en una sola
+    transacción (requiere autenticación). Cada cambio se valida con el serializer de
+    edición correspondiente y se aplica con bulk_update en lotes de ``batch_size``.
+    Si algún cambio es inválido o repite un id no se aplica ninguno.
+    """
+    permission_classes = [IsAuthenticated]
+    edit_serializers = {
+        'fauna': FotoAnimalEditSerializer,
+        'flora': FotoFloraEditSerializer,
+    }
+    campos_editables = ('url_foto', 'descripcion')
+    
+    @swagger_auto_schema(
+        operation_description="Editar url_foto y/o descripcion de muchas fotos por id_foto (requiere autenticación)",
+        manual_parameters=[
+            openapi.Parameter(
+                'batch_size',
+                openapi.IN_QUERY,
+                description="Filas por UPDATE en bulk_update (default: GALERIA_BULK_BATCH_SIZE)",
+                type=openapi.TYPE_INTEGER
+            )
+        ],
+        request_body=openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                required=['id'],
+                properties={
+                    'id': openapi.Schema(type=openapi.TYPE_INTEGER),
+                    'url_foto': openapi.Schema(type=openapi.TYPE_STRING),
+                    'descripcion': openapi.Schema(type=openapi.TYPE_STRING),
+                }
+            )
+        ),
+        responses={
+            200: openapi.Response(description="Todos los cambios aplicados, resultado por item"),
+            400: openapi.Response(description="Cambios inválidos, nada aplicado, resultado por item"),
+        }
+    )
+    def patch(self, request, tipo):
+        cambios = request.data
+        if not isinstance(cambios, list) or not cambios:
+            return Response(
+                {'detail': 'Se esperaba una lista no vacía de cambios {id, url_foto, descripcion}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(cambios) > settings.GALERIA_BULK_MAX_ITEMS:
+            return Response(
+                {'detail': f'Máximo {settings.GALERIA_BULK_MAX_ITEMS} cambios por request.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            batch_size = int(request.query_params.get('batch_size', settings.GALERIA_BULK_BATCH_SIZE))
+            if batch_size < 1:
+                raise ValueError(batch_size)
+        except ValueError:
+            return Response({'detail': 'batch_size debe ser un entero positivo.'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        model = queries.MODELOS[tipo]
+        serializer_class = self.edit_serializers[tipo]
+        ids = [cambio.get('id') for cambio in cambios if isinstance(cambio, dict)]
+        ids = [pk for pk in ids if isinstance(pk, int)]
+        fotos = model.objects.in_bulk(ids)
+        # The same id twice is ambiguous (which change wins?): reject every occurrence
+        repetidos = {pk for pk, veces in Counter(ids).items() if veces > 1}
+        
+        resultados = []
+        validas = {}
+        for cambio in cambios:
+            pk = cambio.get('id') if isinstance(cambio, dict) else None
+            if isinstance(pk, int) and pk in repetidos:
+                resultados.append({
+                    'id': pk,
+                    'estado': 'duplicado',
+                    'errores': {'id': ['id repetido en la lista de cambios.']},
+                })
+                continue
+            foto = fotos.get(pk) if isinstance(pk, int) else None
+            if foto is None:
+                resultados.append({'id': pk, 'estado': 'no_encontrada'})
+                continue
+            
+            data = {campo: cambio[campo] for campo in self.campos_editables if campo in cambio}
+            serializer = serializer_class(foto, data=data, partial=True)
+            if not serializer.is_valid():
+                resultados.append({'id': pk, 'estado': 'invalida', 'errores': serializer.errors})
+                continue
+            for campo, valor in serializer.validated_data.items():
+                setattr(foto, campo, valor)
+            validas[pk] = foto
+            resultados.append({'id': pk, 'estado': 'actualizada'})
+        
+        if len(validas) < len(cambios):
+            for resultado in resultados:
+                if resultado['estado'] == 'actualizada':
+                    resultado['estado'] = 'sin_aplicar'
+            return Response({'actualizadas': 0, 'resultados': resultados}, status=status.HTTP_400_BAD_REQUEST)
+        
+        with transaction.atomic():
+            model.objects.bulk_update(list(validas.values()), self.campos_editables, batch_size=batch_size)
+            # bulk_update sends no post_save
+            versiones.incrementar(model)
+        
+        return Response({'actualizadas': len(validas), 'resultados': resultados})
+
+
 class EstadosConservacionView(APIView):
     """
     Obtener lista de estados de conservación disponibles.
@@ -130,7 +238,8 @@ class EstadosConservacionView(APIView):
 class DestacadosView(APIView):
     """
     Get featured photos for homepage carousel.
-    Returns a curated selection of photos from both fauna and flora.
+    Returns a weighted draw over the curated FotoDestacada entries,
+    mixing fauna and flora by GALERIA_DESTACADOS_PROPORCION_FAUNA.
     """
     permission_classes = [AllowAny]
     
@@ -158,51 +267,52 @@ class DestacadosView(APIView):
         limit = min(int(request.query_params.get('limit', 10)), 20)
         tipo = request.query_params.get('tipo', 'todos')
         
-        items = []
+        # Split the limit between fauna and flora by the configured mix ratio
+        if tipo == 'todos':
+            fauna_limit = round(limit * settings.GALERIA_DESTACADOS_PROPORCION_FAUNA)
+            cuotas = [('fauna', fauna_limit), ('flora', limit - fauna_limit)]
+        elif tipo in ['fauna', 'flora']:
+            cuotas = [(tipo, limit)]
+        else:
+            cuotas = []
         
-        # Get fauna photos
-        if tipo in ['fauna', 'todos']:
-            fauna_fotos = FotoAnimal.objects.select_related('animal', 'animal__categoria')[:limit]
-            for foto in fauna_fotos:
-                items.append({
-                    'id': foto.id_foto,
-                    'tipo': 'fauna',
-                    'nombre': foto.animal.nombre_comun,
-                    'url_foto': foto.url_foto,
-                    'descripcion_foto': foto.descripcion,
-                    'especie_id': foto.animal.id_animal,
-                    'nombre_cientifico': foto.animal.nombre_cientifico,
-                    'estado': foto.animal.estado
-                })
+        items = []
+        for tipo_foto, cuota in cuotas:
+            elegidas = queries.por_ids(tipo_foto, rotacion.draw(tipo_foto, cuota) or [])
+            # Fewer curated (or visible) photos than the quota, or none at all:
+            # top up with the first uncurated ones, as before curation existed
+            items.extend(elegidas + self.relleno(tipo_foto, elegidas, cuota - len(elegidas)))
         
-        # Get flora photos
-        if tipo in ['flora', 'todos']:
-            flora_fotos = FotoFlora.objects.select_related('planta')[:limit]
-            for foto in flora_fotos:
-                items.append({
-                    'id': foto.id_foto,
-                    'tipo': 'flora',
-                    'nombre': foto.planta.nombre_comun,
-                    'url_foto': foto.url_foto,
-                    'descripcion_foto': foto.descripcion,
-                    'especie_id': foto.planta.id_planta,
-                    'nombre_cientifico': foto.planta.nombre_cientifico,
-                    'estado': foto.planta.estado
-                })
+        # A tipo with fewer photos than its quota leaves the rest to the other one
+        for tipo_foto, _ in cuotas:
+            items.extend(self.relleno(tipo_foto, items, limit - len(items)))
         
-        # Limit total results
-        items = items[:limit]
+        if tipo == 'todos':
+            random.shuffle(items)
         
-        serializer = GaleriaItemSerializer(items, many=True)
-        return Response(serializer.data)
+        return Response(items)
+    
+    @staticmethod
+    def relleno(tipo, items, faltan):
+        """Up to ``faltan`` more photos of ``tipo``, lowest id first, skipping those in ``items``"""
+        if faltan <= 0:
+            return []
+        usadas = [item['id'] for item in items if item['tipo'] == tipo]
+        return queries.items(queries.fotos(tipo).exclude(id_foto__in=usadas).order_by('id_foto')[:faltan])
 
 
 class AleatoriosView(APIView):
     """
     Get random photos for dynamic content display.
     Returns randomly selected photos from fauna and flora.
+    With ``seed`` the photos are instead walked in a deterministic shuffled
+    order (keyed Feistel permutation over the ID space) and paginated with a
+    cursor, so infinite scroll never repeats a photo and keeps no server state.
     """
     permission_classes = [AllowAny]
+    cursor_query_param = 'cursor'
+    # Maximum permutation positions probed per returned photo (gaps in the ID space)
+    max_probes_per_item = 64
     
     @swagger_auto_schema(
         operation_description="Get random photos for dynamic content",
@@ -219,6 +329,19 @@ class AleatoriosView(APIView):
                 description="Filter by type: 'fauna', 'flora', or 'todos' (default)",
                 type=openapi.TYPE_STRING,
                 enum=['fauna', 'flora', 'todos']
+            ),
+            openapi.Parameter(
+                'seed',
+                openapi.IN_QUERY,
+                description="Shuffle seed: enables paginated no-repeat mode, "
+                            "response becomes {seed, next, results}",
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'cursor',
+                openapi.IN_QUERY,
+                description="Opaque cursor from the previous page's 'next' link (seed mode)",
+                type=openapi.TYPE_STRING
             )
         ],
         responses={200: GaleriaItemSerializer(many=True)}
@@ -228,72 +351,113 @@ class AleatoriosView(APIView):
         limit = min(int(request.query_params.get('limit', 10)), 20)
         tipo = request.query_params.get('tipo', 'todos')
         
+        seed = request.query_params.get('seed')
+        if seed:
+            return self.get_shuffle(request, seed, limit, tipo)
+        
         items = []
         half_limit = limit // 2
         
         # Get random fauna photos
         if tipo in ['fauna', 'todos']:
-            fauna_count = FotoAnimal.objects.count()
-            if fauna_count > 0:
-                # Use random IDs for better performance than ORDER BY RAND()
-                fauna_limit = limit if tipo == 'fauna' else half_limit
-                fauna_ids = list(FotoAnimal.objects.values_list('id_foto', flat=True))
-                random_fauna_ids = random.sample(fauna_ids, min(fauna_limit, len(fauna_ids)))
-                
-                fauna_fotos = FotoAnimal.objects.filter(
-                    id_foto__in=random_fauna_ids
-                ).select_related('animal', 'animal__categoria')
-                
-                for foto in fauna_fotos:
-                    items.append({
-                        'id': foto.id_foto,
-                        'tipo': 'fauna',
-                        'nombre': foto.animal.nombre_comun,
-                        'url_foto': foto.url_foto,
-                        'descripcion_foto': foto.descripcion,
-                        'especie_id': foto.animal.id_animal,
-                        'nombre_cientifico': foto.animal.nombre_cientifico,
-                        'estado': foto.animal.estado
-                    })
+            # Sample from the in-process ID pool: O(limit) plus one IN (...) fetch
+            fauna_limit = limit if tipo == 'fauna' else half_limit
+            fauna_fotos = get_pool(FotoAnimal).sample_queryset(queries.fotos('fauna'), fauna_limit)
+            items.extend(queries.items(fauna_fotos))
         
         # Get random flora photos
         if tipo in ['flora', 'todos']:
-            flora_count = FotoFlora.objects.count()
-            if flora_count > 0:
-                flora_limit = limit if tipo == 'flora' else half_limit
-                flora_ids = list(FotoFlora.objects.values_list('id_foto', flat=True))
-                random_flora_ids = random.sample(flora_ids, min(flora_limit, len(flora_ids)))
-                
-                flora_fotos = FotoFlora.objects.filter(
-                    id_foto__in=random_flora_ids
-                ).select_related('planta')
-                
-                for foto in flora_fotos:
-                    items.append({
-                        'id': foto.id_foto,
-                        'tipo': 'flora',
-                        'nombre': foto.planta.nombre_comun,
-                        'url_foto': foto.url_foto,
-                        'descripcion_foto': foto.descripcion,
-                        'especie_id': foto.planta.id_planta,
-                        'nombre_cientifico': foto.planta.nombre_cientifico,
-                        'estado': foto.planta.estado
-                    })
+            flora_limit = limit if tipo == 'flora' else half_limit
+            flora_fotos = get_pool(FotoFlora).sample_queryset(queries.fotos('flora'), flora_limit)
+            items.extend(queries.items(flora_fotos))
         
         # Shuffle results for mixed display
         if tipo == 'todos':
             random.shuffle(items)
         
-        serializer = GaleriaItemSerializer(items, many=True)
-        return Response(serializer.data)
+        return Response(items)
+    
+    def get_shuffle(self, request, seed, limit, tipo):
+        """One page of the shuffled gallery selected by ``seed``"""
+        tipos = [t for t in ('fauna', 'flora') if tipo in (t, 'todos')]
+        if not tipos:
+            return Response({'seed': seed, 'next': None, 'results': []})
+        
+        pools = [get_pool(queries.MODELOS[t]) for t in tipos]
+        for pool in pools:
+            pool.ensure_ready()
+        
+        # The ID space is fixed by the first page (tope), so later pages walk the
+        # same permutation; photos added meanwhile appear in the next shuffle.
+        posicion, tope = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+        if tope is None:
+            tope = max(pool.max_id for pool in pools) + 1
+        
+        # Position v in the permutation maps to photo v // len(tipos) of tipos[v % len(tipos)]
+        size = tope * len(tipos)
+        permutacion = FeistelPermutation(seed, size)
+        resultados = []
+        probes = 0
+        while posicion < size and len(resultados) < limit and probes < limit * self.max_probes_per_item:
+            # Probe until the page could be full, then fetch; photos hidden by
+            # fotos() (dead URLs) leave gaps that the next round fills
+            elegidos = []
+            while (posicion < size and len(resultados) + len(elegidos) < limit
+                   and probes < limit * self.max_probes_per_item):
+                valor = permutacion(posicion)
+                posicion += 1
+                probes += 1
+                id_foto, indice = divmod(valor, len(tipos))
+                if id_foto in pools[indice]:
+                    elegidos.append((tipos[indice], id_foto))
+            
+            por_clave = {}
+            for t in tipos:
+                ids = [id_foto for tipo_foto, id_foto in elegidos if tipo_foto == t]
+                por_clave.update(((t, item['id']), item) for item in queries.por_ids(t, ids))
+            resultados.extend(por_clave[clave] for clave in elegidos if clave in por_clave)
+        
+        next_url = None
+        if posicion < size:
+            next_url = replace_query_param(
+                request.build_absolute_uri(),
+                self.cursor_query_param,
+                self.encode_cursor(posicion, tope)
+            )
+        
+        return Response({
+            'seed': seed,
+            'next': next_url,
+            'results': resultados
+        })
+    
+    @staticmethod
+    def encode_cursor(posicion, tope):
+        return base64.urlsafe_b64encode(f'{posicion}:{tope}'.encode()).decode()
+    
+    @staticmethod
+    def decode_cursor(cursor):
+        if not cursor:
+            return 0, None
+        try:
+            posicion, tope = base64.urlsafe_b64decode(cursor.encode()).decode().split(':')
+            posicion, tope = int(posicion), int(tope)
+            if posicion < 0 or tope < 1:
+                raise ValueError(cursor)
+            return posicion, tope
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound('Invalid cursor')
 
 
-class EstadisticasView(APIView):
+class EstadisticasView(ConditionalGetMixin, APIView):
     """
     Get statistics for the gallery/homepage.
-    Returns counts of animals, plants, and photos.
+    Returns counts of animals, plants, and photos from the maintained
+    EstadisticaCatalogo row instead of counting every table.
     """
     permission_classes = [AllowAny]
+    # Bumped whenever the counters row changes (see estadisticas.py)
+    version_models = (EstadisticaCatalogo,)
     
     @swagger_auto_schema(
         operation_description="Get gallery statistics",
@@ -316,10 +480,11 @@ class EstadisticasView(APIView):
     )
     def get(self, request):
         """Get gallery statistics"""
-        total_animales = Animal.objects.count()
-        total_plantas = Flora.objects.count()
-        total_fotos_fauna = FotoAnimal.objects.count()
-        total_fotos_flora = FotoFlora.objects.count()
+        totales = estadisticas.obtener()
+        total_animales = totales['total_animales']
+        total_plantas = totales['total_plantas']
+        total_fotos_fauna = totales['total_fotos_fauna']
+        total_fotos_flora = totales['total_fotos_flora']
         
         return Response({
             'total_animales': total_animales,
@@ -329,3 +494,124 @@ class EstadisticasView(APIView):
             'total_especies': total_animales + total_plantas,
             'total_fotos': total_fotos_fauna + total_fotos_flora
         })
+
+
+class FotosView(CachedResponseMixin, APIView):
+    """
+    Unified fauna + flora photo feed for the "explore all photos" page.
+    Both tables are read as one stream ordered by (tipo, id_foto) and
+    paginated with an opaque keyset cursor, so every page costs the same.
+    """
+    permission_classes = [AllowAny]
+    version_models = (FotoAnimal, FotoFlora, Animal, Flora, EstadoFoto)
+    cursor_query_param = 'cursor'
+    default_limit = 20
+    max_limit = 100
+    
+    @swagger_auto_schema(
+        operation_description="Page through every fauna and flora photo",
+        manual_parameters=[
+            openapi.Parameter(
+                'cursor',
+                openapi.IN_QUERY,
+                description="Opaque cursor taken from the previous page's 'next' link",
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'limit',
+                openapi.IN_QUERY,
+                description="Number of photos per page (default: 20, max: 100)",
+                type=openapi.TYPE_INTEGER
+            ),
+            openapi.Parameter(
+                'tipo',
+                openapi.IN_QUERY,
+                description="Filter by type: 'fauna', 'flora', or 'todos' (default)",
+                type=openapi.TYPE_STRING,
+                enum=['fauna', 'flora', 'todos']
+            )
+        ],
+        responses={200: openapi.Response(
+            description="Page of gallery items",
+            schema=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    'next': openapi.Schema(type=openapi.TYPE_STRING, format=openapi.FORMAT_URI),
+                    'results': openapi.Schema(
+                        type=openapi.TYPE_ARRAY,
+                        items=openapi.Schema(type=openapi.TYPE_OBJECT)
+                    ),
+                }
+            )
+        )}
+    )
+    def get(self, request):
+        """Get a page of photos"""
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+            if limit < 1:
+                raise ValueError(limit)
+        except ValueError:
+            return Response({'detail': 'limit debe ser un entero positivo.'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = min(limit, self.max_limit)
+        tipo = request.query_params.get('tipo', 'todos')
+        posicion = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+        
+        ramas = []
+        if tipo in ['fauna', 'todos']:
+            ramas.append(self.rama('fauna', posicion))
+        if tipo in ['flora', 'todos']:
+            ramas.append(self.rama('flora', posicion))
+        
+        # Fauna sorts before flora, so flora is only read when the fauna side runs short.
+        # Each side is a plain id_foto range scan capped at what the page still needs.
+        rows = []
+        for rama in ramas:
+            if rama is None:
+                continue
+            rows.extend(rama.order_by('id_foto')[:limit + 1 - len(rows)])
+            if len(rows) > limit:
+                break
+        
+        next_url = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            ultimo = rows[-1]
+            next_url = replace_query_param(
+                request.build_absolute_uri(),
+                self.cursor_query_param,
+                self.encode_cursor(ultimo['tipo'], ultimo['id_foto'])
+            )
+        
+        return Response({
+            'next': next_url,
+            'results': queries.items(rows)
+        })
+    
+    @staticmethod
+    def rama(tipo, posicion):
+        """One side of the feed, already restricted to rows after the cursor"""
+        queryset = queries.MODELOS[tipo].objects.all()
+        if posicion:
+            tipo_cursor, id_cursor = posicion
+            if tipo < tipo_cursor:
+                return None
+            if tipo == tipo_cursor:
+                queryset = queryset.filter(id_foto__gt=id_cursor)
+        return queries.fotos(tipo, queryset)
+    
+    @staticmethod
+    def encode_cursor(tipo, id_foto):
+        return base64.urlsafe_b64encode(f'{tipo}:{id_foto}'.encode()).decode()
+    
+    @staticmethod
+    def decode_cursor(cursor):
+        if not cursor:
+            return None
+        try:
+            tipo, id_foto = base64.urlsafe_b64decode(cursor.encode()).decode().split(':')
+            if tipo not in ('fauna', 'flora'):
+                raise ValueError(tipo)
+            return tipo, int(id_foto)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound('Invalid cursor')
@@ -29,6 +29,9 @@ INSTALLED_APPS = [
     'apps.fauna',
     'apps.flora',
     'apps.galeria',
+    'apps.catalogo',
+    'apps.busqueda',
+    'apps.exportacion',
 ]
 
 MIDDLEWARE = [
@@ -62,20 +65,31 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'ecoalbum_api.wsgi.application'
 
-DATABASES = {
-    'default': {
-        'ENGINE': config('DB_ENGINE', default='mssql'),
-        'NAME': config('DB_NAME'),
-        'HOST': config('DB_HOST'),
-        'PORT': config('DB_PORT', default=1433, cast=int),
-        'USER': config('DB_USER'),
-        'PASSWORD': config('DB_PASSWORD'),
-        'OPTIONS': {
-            'driver': 'ODBC Driver 18 for SQL Server',
-            'extra_params': 'TrustServerCertificate=yes;Encrypt=no',
+DB_ENGINE = config('DB_ENGINE', default='mssql')
+
+if DB_ENGINE == 'django.db.backends.sqlite3':
+    # Local runs and the test suite: DB_ENGINE=django.db.backends.sqlite3 python manage.py test
+    DATABASES = {
+        'default': {
+            'ENGINE': DB_ENGINE,
+            'NAME': config('DB_NAME', default=str(BASE_DIR / 'db.sqlite3')),
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': DB_ENGINE,
+            'NAME': config('DB_NAME'),
+            'HOST': config('DB_HOST'),
+            'PORT': config('DB_PORT', default=1433, cast=int),
+            'USER': config('DB_USER'),
+            'PASSWORD': config('DB_PASSWORD'),
+            'OPTIONS': {
+                'driver': 'ODBC Driver 18 for SQL Server',
+                'extra_params': 'TrustServerCertificate=yes;Encrypt=no',
+            }
         }
     }
-}
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -98,8 +112,28 @@ USE_I18N = True
 USE_TZ = True
 
 STATIC_URL = '/static/'
+MEDIA_URL = config('MEDIA_URL', default='/media/')
+MEDIA_ROOT = config('MEDIA_ROOT', default=str(BASE_DIR / 'media'))
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache
+# 'respuestas' guarda respuestas JSON renderizadas (apps/core/respuestas.py); las claves llevan
+# la versión de datos, así que nunca hay que invalidar. LocMemCache es por proceso; con
+# FileBasedCache y una ruta común (p. ej. /app/var/respuestas) la comparten los workers del host
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'respuestas': {
+        'BACKEND': config('RESPUESTAS_CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('RESPUESTAS_CACHE_LOCATION', default='respuestas'),
+        'TIMEOUT': config('RESPUESTAS_CACHE_TIMEOUT', default=600, cast=int),
+        'OPTIONS': {
+            'MAX_ENTRIES': config('RESPUESTAS_CACHE_MAX_ENTRIES', default=5000, cast=int),
+        },
+    },
+}
+
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': [
@@ -151,3 +185,43 @@ LOGGING = {
         'level': 'INFO',
     },
 }
+
+# Galería
+# Segundos entre refrescos incrementales del pool de IDs de fotos aleatorias
+GALERIA_ALEATORIOS_REFRESCO = config('GALERIA_ALEATORIOS_REFRESCO', default=300, cast=int)
+# Fracción de destacados de fauna cuando tipo=todos (el resto es flora)
+GALERIA_DESTACADOS_PROPORCION_FAUNA = config('GALERIA_DESTACADOS_PROPORCION_FAUNA', default=0.5, cast=float)
+# Segundos máximos antes de reconstruir las tablas de rotación de destacados
+GALERIA_DESTACADOS_REFRESCO = config('GALERIA_DESTACADOS_REFRESCO', default=60, cast=int)
+# Edición masiva de fotos: filas por UPDATE y máximo de cambios por request
+GALERIA_BULK_BATCH_SIZE = config('GALERIA_BULK_BATCH_SIZE', default=500, cast=int)
+GALERIA_BULK_MAX_ITEMS = config('GALERIA_BULK_MAX_ITEMS', default=5000, cast=int)
+# Miniaturas responsive (manage.py generar_derivados)
+GALERIA_DERIVADOS_ANCHOS = config('GALERIA_DERIVADOS_ANCHOS', default='320,640,1024', cast=Csv(int))
+GALERIA_DERIVADOS_CALIDAD = config('GALERIA_DERIVADOS_CALIDAD', default=80, cast=int)
+# Segundos entre comprobaciones del manifest de derivados
+GALERIA_DERIVADOS_REFRESCO = config('GALERIA_DERIVADOS_REFRESCO', default=5, cast=int)
+# Ocultar en la galería las fotos marcadas como rotas por manage.py verificar_fotos
+GALERIA_OCULTAR_FOTOS_ROTAS = config('GALERIA_OCULTAR_FOTOS_ROTAS', default=True, cast=bool)
+
+# Catálogo
+# Segundos que cada proceso reutiliza las versiones de tablas antes de releerlas
+CATALOGO_VERSIONES_TTL = config('CATALOGO_VERSIONES_TTL', default=5, cast=int)
+# Máximo de ids en /api/fauna/?ids= y /api/flora/?ids=
+CATALOGO_IDS_MAX = config('CATALOGO_IDS_MAX', default=100, cast=int)
+
+# Fauna
+# Especies relacionadas guardadas por animal (manage.py calcular_relacionados)
+FAUNA_RELACIONADOS_MAX = config('FAUNA_RELACIONADOS_MAX', default=10, cast=int)
+
+# Búsqueda
+# Índice SQLite FTS5 local (manage.py reconstruir_busqueda); se puede borrar y reconstruir
+BUSQUEDA_INDICE = config('BUSQUEDA_INDICE', default=str(BASE_DIR / 'var' / 'busqueda.sqlite3'))
+# Máximo de resultados por búsqueda (SQL Server admite ~2100 parámetros por consulta)
+BUSQUEDA_LIMITE = config('BUSQUEDA_LIMITE', default=500, cast=int)
+# Segundos entre comprobaciones de versión de los índices en memoria (autocompletado, nombres científicos)
+BUSQUEDA_INDICES_REFRESCO = config('BUSQUEDA_INDICES_REFRESCO', default=30, cast=int)
+
+# Exportación
+# Especies leídas por consulta en /api/export/ (memoria acotada a un lote)
+EXPORTACION_LOTE = config('EXPORTACION_LOTE', default=500, cast=int)
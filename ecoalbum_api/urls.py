@@ -14,14 +14,23 @@ API Endpoints:
 - /api/galeria/destacados/       - Fotos destacadas (carrusel)
 - /api/galeria/aleatorios/       - Fotos aleatorias
 - /api/galeria/estadisticas/     - Estadísticas generales
+- /api/galeria/fotos/            - Todas las fotos (fauna + flora, paginación por cursor)
+- /api/galeria/fotos/{tipo}/lote/ - Edición masiva de fotos (PATCH, requiere auth)
+- /api/catalogo/referencia/      - Datos de referencia en un solo payload
+- /api/autocomplete/             - Sugerencias de especies por prefijo
+- /api/especies/resolver/        - Nombre científico con errores -> especies candidatas
+- /api/export/fauna.ndjson       - Catálogo completo en streaming (también flora, .csv)
 - /api/health/                   - Health check
+- /api/health/cache/             - Aciertos/fallos de la caché de respuestas
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework import permissions
-from apps.core.views import HealthCheckView
+from apps.core.views import HealthCheckView, ResponseCacheStatsView
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -57,6 +66,7 @@ urlpatterns = [
     
     # Health check
     path('api/health/', HealthCheckView.as_view(), name='health-check'),
+    path('api/health/cache/', ResponseCacheStatsView.as_view(), name='cache-stats'),
     
     # Fauna endpoints (incluye categorías, amenazas, acciones)
     path('api/fauna/', include('apps.fauna.urls')),
@@ -67,8 +77,20 @@ urlpatterns = [
     # Gallery endpoints
     path('api/galeria/', include('apps.galeria.urls')),
     
+    # Catalog endpoints (datos de referencia)
+    path('api/catalogo/', include('apps.catalogo.urls')),
+    
+    # Search endpoints (autocompletado, resolver nombres científicos)
+    path('api/', include('apps.busqueda.urls')),
+    
+    # Full-catalog export (NDJSON / CSV streaming)
+    path('api/export/', include('apps.exportacion.urls')),
+    
     # API Documentation
     path('api/swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('api/docs/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
     path('api/schema.json', schema_view.without_ui(cache_timeout=0), name='schema-json'),
 ]
+
+# Miniaturas generadas (en producción servir MEDIA_ROOT desde el proxy/CDN)
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""
+Benchmark de /api/galeria/aleatorios/: muestreo antiguo vs pool de IDs.
+
+Crea una base SQLite temporal con N fotos sintéticas (1M por defecto) y mide
+latencia y memoria por request de:
+  - antes:   COUNT(*) + values_list de todos los IDs + random.sample + IN (...)
+  - después: PhotoIdPool.sample_queryset (O(limit) + un IN (...))
+
+Uso:
+    python scripts/benchmark-aleatorios.py [--fotos 1000000] [--requests 200]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ecoalbum_api.settings')
+for var in ('DB_NAME', 'DB_HOST', 'DB_USER', 'DB_PASSWORD'):
+    os.environ.setdefault(var, 'benchmark')
+
+
+def setup_django(db_path):
+    import django
+    from django.conf import settings
+
+    settings.DATABASES = {
+        'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': db_path}
+    }
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def poblar(total):
+    """Inserta un animal y `total` fotos sintéticas"""
+    from django.db import connection, transaction
+    from apps.fauna.models import Categoria, Animal
+
+    categoria = Categoria.objects.create(nombre='Aves')
+    animal = Animal.objects.create(
+        nombre_comun='Águila Harpía',
+        nombre_cientifico='Harpia harpyja',
+        categoria=categoria,
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        lote = 50000
+        for inicio in range(0, total, lote):
+            cursor.executemany(
+                'INSERT INTO FotoAnimal (id_animal, url_foto, descripcion) VALUES (%s, %s, %s)',
+                [
+                    (animal.pk, f'https://example.org/fotos/{i}.jpg', None)
+                    for i in range(inicio, min(inicio + lote, total))
+                ],
+            )
+
+
+def antes(limit):
+    from apps.fauna.models import FotoAnimal
+
+    if FotoAnimal.objects.count() > 0:
+        ids = list(FotoAnimal.objects.values_list('id_foto', flat=True))
+        elegidos = random.sample(ids, min(limit, len(ids)))
+        return list(FotoAnimal.objects.filter(id_foto__in=elegidos).select_related('animal'))
+    return []
+
+
+def despues(limit):
+    from apps.fauna.models import FotoAnimal
+    from apps.galeria import queries
+    from apps.galeria.sampling import get_pool
+
+    return get_pool(FotoAnimal).sample_queryset(queries.fotos('fauna'), limit)
+
+
+def medir(nombre, funcion, requests, limit):
+    tiempos = []
+    picos = []
+    for _ in range(requests):
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        funcion(limit)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        picos.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    tiempos.sort()
+    print(
+        f"{nombre:<10} p50={statistics.median(tiempos):9.3f} ms  "
+        f"p95={tiempos[int(len(tiempos) * 0.95) - 1]:9.3f} ms  "
+        f"pico/request={max(picos) / 1024:10.1f} KiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--fotos', type=int, default=1_000_000)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(os.path.join(tmp, 'benchmark.sqlite3'))
+        print(f"Poblando {args.fotos:,} fotos sintéticas...")
+        poblar(args.fotos)
+
+        from apps.fauna.models import FotoAnimal
+        from apps.galeria.sampling import get_pool
+
+        pool = get_pool(FotoAnimal)
+        inicio = time.perf_counter()
+        pool.ensure_ready()
+        print(
+            f"Carga inicial del pool: {(time.perf_counter() - inicio) * 1000:.1f} ms, "
+            f"{len(pool):,} IDs en {pool.nbytes / 1024 / 1024:.1f} MiB residentes"
+        )
+
+        # "antes" es muy lento con 1M filas; con pocas repeticiones basta
+        medir('antes', antes, max(1, args.requests // 20), args.limit)
+        medir('después', despues, args.requests, args.limit)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+Benchmark de consultas por endpoint de AnimalViewSet y FloraViewSet.
+
+Crea una base SQLite temporal con datos sintéticos y, para cada endpoint,
+reporta cuántas consultas SQL ejecuta la request y cuántas filas devuelven
+en total (cada consulta capturada se vuelve a ejecutar para contar filas).
+
+Uso:
+    python scripts/benchmark-consultas-viewsets.py [--animales 200] [--fotos-por-especie 4]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ecoalbum_api.settings')
+for var in ('DB_NAME', 'DB_HOST', 'DB_USER', 'DB_PASSWORD'):
+    os.environ.setdefault(var, 'benchmark')
+
+
+def setup_django(db_path):
+    import django
+    from django.conf import settings
+
+    settings.DATABASES = {
+        'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': db_path}
+    }
+    settings.ALLOWED_HOSTS = ['testserver']
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def poblar(animales, fotos_por_especie):
+    from apps.fauna.models import (
+        Categoria, Animal, FotoAnimal, Amenaza, AccionProteccion,
+        AnimalAmenaza, AnimalAccionProteccion,
+    )
+    from apps.flora.models import Flora, FotoFlora
+
+    categorias = Categoria.objects.bulk_create([Categoria(nombre=f'Categoría {i}') for i in range(5)])
+    amenazas = Amenaza.objects.bulk_create([Amenaza(nombre=f'Amenaza {i}') for i in range(8)])
+    acciones = AccionProteccion.objects.bulk_create([AccionProteccion(titulo=f'Acción {i}') for i in range(8)])
+    creados = Animal.objects.bulk_create([
+        Animal(
+            nombre_comun=f'Animal {i:04d}',
+            nombre_cientifico=f'Genus{i} species{i}',
+            descripcion='Descripción ' * 50,
+            estado='Vulnerable (VU)',
+            categoria=categorias[i % len(categorias)],
+        )
+        for i in range(animales)
+    ])
+    for animal in creados:
+        for j in range(fotos_por_especie):
+            FotoAnimal.objects.create(animal=animal, url_foto=f'https://example.org/a/{animal.pk}/{j}.jpg')
+    AnimalAmenaza.objects.bulk_create([
+        AnimalAmenaza(animal=animal, amenaza=amenazas[(animal.pk + k) % len(amenazas)])
+        for animal in creados for k in range(3)
+    ])
+    AnimalAccionProteccion.objects.bulk_create([
+        AnimalAccionProteccion(animal=animal, accion=acciones[(animal.pk + k) % len(acciones)])
+        for animal in creados for k in range(2)
+    ])
+    plantas = Flora.objects.bulk_create([
+        Flora(nombre_comun=f'Planta {i:04d}', nombre_cientifico=f'Planta species{i}', descripcion='Texto ' * 50)
+        for i in range(animales // 2)
+    ])
+    for planta in plantas:
+        for j in range(fotos_por_especie):
+            FotoFlora.objects.create(planta=planta, url_foto=f'https://example.org/f/{planta.pk}/{j}.jpg')
+    return creados[0].pk, plantas[0].pk
+
+
+def medir(client, url):
+    """(consultas, filas) de una request GET"""
+    from django.db import connection
+
+    capturadas = []
+
+    def capturar(execute, sql, params, many, context):
+        capturadas.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(capturar):
+        respuesta = client.get(url)
+    assert respuesta.status_code == 200, (url, respuesta.status_code)
+
+    filas = 0
+    with connection.cursor() as cursor:
+        for sql, params in capturadas:
+            cursor.execute(sql, params)
+            filas += len(cursor.fetchall())
+    return len(capturadas), filas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--animales', type=int, default=200)
+    parser.add_argument('--fotos-por-especie', type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(os.path.join(tmp, 'benchmark.sqlite3'))
+        animal, planta = poblar(args.animales, args.fotos_por_especie)
+
+        from django.test import Client
+
+        client = Client()
+        endpoints = [
+            '/api/fauna/fauna/',
+            '/api/fauna/fauna/?fields=id,nombre_comun,foto_principal',
+            f'/api/fauna/fauna/{animal}/',
+            f'/api/fauna/fauna/{animal}/fotos/',
+            f'/api/fauna/fauna/{animal}/amenazas/',
+            f'/api/fauna/fauna/{animal}/acciones/',
+            '/api/flora/flora/',
+            '/api/flora/flora/?minimal=true',
+            f'/api/flora/flora/{planta}/',
+            f'/api/flora/flora/{planta}/fotos/',
+        ]
+        print(f"{'endpoint':<60}{'consultas':>10}{'filas':>8}")
+        for url in endpoints:
+            consultas, filas = medir(client, url)
+            print(f"{url:<60}{consultas:>10}{filas:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+Microbenchmark de items de galería: instancias de modelo vs filas values().
+
+Compara, para un lote de fotos de fauna (el caso de destacados/aleatorios):
+  - antes:   select_related('animal', 'animal__categoria') + dicts a mano
+             + GaleriaItemSerializer(many=True)
+  - después: apps.galeria.queries (8 columnas vía values() + a_item)
+
+Reporta bytes transferidos desde la BD por lote y CPU por item.
+
+Uso:
+    python scripts/benchmark-galeria-items.py [--animales 500] [--lote 20]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ecoalbum_api.settings')
+for var in ('DB_NAME', 'DB_HOST', 'DB_USER', 'DB_PASSWORD'):
+    os.environ.setdefault(var, 'benchmark')
+
+TEXTO = (
+    'Especie característica de los bosques húmedos tropicales de Panamá, '
+    'con poblaciones fragmentadas por la pérdida de hábitat. '
+)
+
+
+def setup_django(db_path):
+    import django
+    from django.conf import settings
+
+    settings.DATABASES = {
+        'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': db_path}
+    }
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def poblar(animales, fotos_por_animal):
+    from apps.fauna.models import Categoria, Animal, FotoAnimal
+
+    categoria = Categoria.objects.create(nombre='Aves', descripcion='Aves de Panamá')
+    creados = Animal.objects.bulk_create([
+        Animal(
+            nombre_comun=f'Animal {i}',
+            nombre_cientifico=f'Genus{i} species{i}',
+            descripcion=TEXTO * 12,
+            habitat=TEXTO * 6,
+            distribucion=TEXTO * 4,
+            importancia_ecologica=TEXTO * 6,
+            estado='Vulnerable (VU)',
+            categoria=categoria,
+        )
+        for i in range(animales)
+    ])
+    FotoAnimal.objects.bulk_create([
+        FotoAnimal(animal=animal, url_foto=f'https://example.org/{animal.pk}/{j}.jpg', descripcion='Adulto')
+        for animal in creados
+        for j in range(fotos_por_animal)
+    ])
+
+
+def antes(ids):
+    from apps.fauna.models import FotoAnimal
+    from apps.galeria.serializers import GaleriaItemSerializer
+
+    fotos = FotoAnimal.objects.filter(id_foto__in=ids).select_related('animal', 'animal__categoria')
+    items = []
+    for foto in fotos:
+        items.append({
+            'id': foto.id_foto,
+            'tipo': 'fauna',
+            'nombre': foto.animal.nombre_comun,
+            'url_foto': foto.url_foto,
+            'descripcion_foto': foto.descripcion,
+            'especie_id': foto.animal.id_animal,
+            'nombre_cientifico': foto.animal.nombre_cientifico,
+            'estado': foto.animal.estado
+        })
+    return GaleriaItemSerializer(items, many=True).data
+
+
+def despues(ids):
+    from apps.galeria import queries
+
+    return queries.por_ids('fauna', ids)
+
+
+def bytes_transferidos(queryset):
+    """Suma del tamaño de cada valor devuelto por la consulta"""
+    from django.db import connection
+
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return sum(
+            len(valor.encode()) if isinstance(valor, str) else 8
+            for fila in cursor.fetchall()
+            for valor in fila
+            if valor is not None
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--animales', type=int, default=500)
+    parser.add_argument('--fotos-por-animal', type=int, default=3)
+    parser.add_argument('--lote', type=int, default=20)
+    parser.add_argument('--repeticiones', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(os.path.join(tmp, 'benchmark.sqlite3'))
+        poblar(args.animales, args.fotos_por_animal)
+
+        from apps.fauna.models import FotoAnimal
+        from apps.galeria import queries
+
+        todos = list(FotoAnimal.objects.values_list('id_foto', flat=True))
+        lotes = [random.sample(todos, args.lote) for _ in range(args.repeticiones)]
+
+        qs_antes = FotoAnimal.objects.filter(id_foto__in=lotes[0]).select_related('animal', 'animal__categoria')
+        qs_despues = queries.fotos('fauna').filter(id_foto__in=lotes[0])
+        print(f"Lote de {args.lote} fotos")
+        print(f"{'':<10}{'bytes/lote':>12}{'µs CPU/item':>14}")
+        for nombre, funcion, queryset in (('antes', antes, qs_antes), ('después', despues, qs_despues)):
+            inicio = time.process_time()
+            for ids in lotes:
+                funcion(ids)
+            por_item = (time.process_time() - inicio) / (args.repeticiones * args.lote) * 1e6
+            print(f"{nombre:<10}{bytes_transferidos(queryset):>12,}{por_item:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
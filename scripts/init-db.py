@@ -207,6 +207,13 @@ def run_django_migrate():
         return False
 
 
+def run_django_command(command):
+    """Ejecuta un comando de manage.py sin abortar la inicialización si falla."""
+    print(f"🔄 Ejecutando manage.py {command}...")
+    result = subprocess.run([sys.executable, 'manage.py', command], check=False)
+    return result.returncode == 0
+
+
 def main():
     """Función principal de inicialización."""
     print("=" * 50)
@@ -218,6 +225,8 @@ def main():
         print("ℹ️ Base de datos ya inicializada con datos.")
         print("🔄 Ejecutando migraciones pendientes...")
         run_django_migrate()
+        run_django_command('reconstruir_busqueda')
+        run_django_command('calcular_relacionados')
         print("✅ Inicialización completada.")
         return
     
@@ -236,6 +245,13 @@ def main():
     else:
         print("ℹ️ Datos ya existen, saltando seed.sql")
     
+    # Paso 4: Recalcular contadores, foto principal, letra inicial, índice de búsqueda y especies relacionadas (seed.sql inserta sin pasar por las señales de Django)
+    run_django_command('reconciliar_estadisticas')
+    run_django_command('sincronizar_fotos_principales')
+    run_django_command('sincronizar_letras')
+    run_django_command('reconstruir_busqueda')
+    run_django_command('calcular_relacionados')
+    
     print("=" * 50)
     print("✅ Inicialización de base de datos completada.")
     print("=" * 50)